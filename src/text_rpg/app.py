@@ -136,6 +136,10 @@ class GameApp:
                 retriever=self.retriever,
                 indexer=self.indexer,
             )
+            # Near-duplicate evaluate/negotiate requests reuse earlier answers
+            from text_rpg.systems.director import cache as director_cache
+
+            director_cache.configure(self.embeddings.embed)
         return self._director
 
     @property
@@ -754,6 +758,8 @@ class GameApp:
 
         if action_type == "quit":
             self._save_game(repos, turn_number)
+            if self._director is not None:
+                self._director.close()
             self.display.show_info("Game saved. Farewell!")
             return "break"
 
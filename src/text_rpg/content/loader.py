@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import tomllib
 from pathlib import Path
 from typing import Any
@@ -44,7 +45,9 @@ def load_all_items() -> dict[str, dict]:
             items[item["id"]] = item
     return items
 
+@functools.cache
 def load_all_factions() -> dict[str, dict]:
+    """Load faction definitions. Cached per process — treat the result as read-only."""
     factions_file = CONTENT_DIR / "factions" / "factions.toml"
     if not factions_file.exists():
         return {}
@@ -107,8 +110,12 @@ def load_all_story_seeds() -> list[dict[str, Any]]:
     return load_all_seeds()
 
 
+@functools.cache
 def load_world_events() -> list[dict[str, Any]]:
-    """Load world events from content/stories/world_events.toml."""
+    """Load world events from content/stories/world_events.toml.
+
+    Cached per process — treat the result as read-only.
+    """
     events_file = CONTENT_DIR / "stories" / "world_events.toml"
     if not events_file.exists():
         return []
@@ -116,8 +123,12 @@ def load_world_events() -> list[dict[str, Any]]:
     return data.get("events", [])
 
 
+@functools.cache
 def load_all_regions() -> dict[str, dict[str, Any]]:
-    """Load all region metadata (id, name, level ranges) without full location data."""
+    """Load all region metadata (id, name, level ranges) without full location data.
+
+    Cached per process — treat the result as read-only.
+    """
     regions: dict[str, dict[str, Any]] = {}
     regions_dir = CONTENT_DIR / "regions"
     if not regions_dir.exists():
@@ -130,8 +141,12 @@ def load_all_regions() -> dict[str, dict[str, Any]]:
     return regions
 
 
+@functools.cache
 def load_all_guilds() -> dict[str, dict]:
-    """Load all guild definitions from content/guilds/guilds.toml."""
+    """Load all guild definitions from content/guilds/guilds.toml.
+
+    Cached per process — treat the result as read-only.
+    """
     guilds_file = CONTENT_DIR / "guilds" / "guilds.toml"
     if not guilds_file.exists():
         return {}
@@ -139,6 +154,20 @@ def load_all_guilds() -> dict[str, dict]:
     return {k: v for k, v in data.items() if isinstance(v, dict) and "name" in v}
 
 
+@functools.cache
+def load_guilds_by_profession() -> dict[str, tuple[str, ...]]:
+    """Map each trade profession to the ids of the guilds that practise it.
+
+    Cached per process — treat the result as read-only.
+    """
+    index: dict[str, list[str]] = {}
+    for gid, gdata in load_all_guilds().items():
+        profession = gdata.get("profession")
+        if profession:
+            index.setdefault(profession, []).append(gid)
+    return {profession: tuple(gids) for profession, gids in index.items()}
+
+
 def load_work_order_templates() -> list[dict[str, Any]]:
     """Load work order templates from content/guilds/work_orders.toml."""
     orders_file = CONTENT_DIR / "guilds" / "work_orders.toml"
@@ -173,3 +202,17 @@ def load_region(region_id: str) -> dict[str, Any]:
         shops_data = load_toml(shops_file)
         region_data["shops"] = shops_data.get("shops", [])
     return region_data
+
+
+def reload() -> None:
+    """Drop all memoized content so the next load re-reads the TOML files."""
+    from text_rpg.mechanics import story_seeds
+
+    load_all_factions.cache_clear()
+    load_all_regions.cache_clear()
+    load_all_guilds.cache_clear()
+    load_guilds_by_profession.cache_clear()
+    load_world_events.cache_clear()
+    story_seeds.load_all_seeds.cache_clear()
+    story_seeds.load_seed_map.cache_clear()
+    story_seeds.eligible_seed_ids.cache_clear()
@@ -520,12 +520,11 @@ class TurnLoop:
 
         # Story seed narrator hints from active stories
         try:
-            from text_rpg.mechanics.story_seeds import get_narrator_hints, load_all_seeds
+            from text_rpg.mechanics.story_seeds import get_narrator_hints, load_seed_map
 
             active_stories = self.repos["world_state"].get_active_stories(context.game_id)
             if active_stories:
-                all_seeds = load_all_seeds()
-                seed_map = {s["id"]: s for s in all_seeds}
+                seed_map = load_seed_map()
                 for story in active_stories[:1]:  # Only from first active story
                     seed = seed_map.get(story.get("seed_id", ""))
                     if not seed:
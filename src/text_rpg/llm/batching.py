@@ -0,0 +1,203 @@
+"""Micro-batching of independent structured LLM requests."""
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, FileSystemLoader
+
+from text_rpg.llm.provider import LLMProvider
+from text_rpg.llm.token_budget import TokenBudget
+
+logger = logging.getLogger(__name__)
+
+_PROMPTS_DIR = Path(__file__).parent / "prompts"
+_jinja_env: Environment | None = None
+
+
+def _get_jinja() -> Environment:
+    global _jinja_env
+    if _jinja_env is None:
+        _jinja_env = Environment(loader=FileSystemLoader(str(_PROMPTS_DIR)), autoescape=False)
+    return _jinja_env
+
+
+@dataclass(slots=True)
+class _Request:
+    prompt: str
+    system_prompt: str | None
+    max_tokens: int
+    future: Future = field(default_factory=Future)
+
+
+class BatchingLLM(LLMProvider):
+    """Coalesces concurrent generate_structured() calls into one LLM request.
+
+    Requests are buffered until max_batch are waiting or max_wait seconds
+    have passed since the first one, then sent as a single "answer each of
+    these N tasks" prompt. Identical system prompts (instructions + schema)
+    are sent once per batch, not once per task. A batch also closes early
+    when the next request would push prompt plus answer budgets past the
+    model's context window (context_tokens, by default the inner
+    provider's num_ctx). Each answer echoes its task number and is routed
+    by it; answers the model drops, mangles or misnumbers are retried
+    individually, so callers always get a per-request result and still
+    run their own validate_*.
+
+    Only requests with the same temperature share a batch. A lone request
+    is forwarded unchanged. generate_structured() blocks until its batch
+    resolves — call it from worker threads, or use submit() directly.
+    """
+
+    def __init__(self, llm: LLMProvider, max_batch: int = 8, max_wait: float = 0.25,
+                 context_tokens: int | None = None) -> None:
+        self.inner = llm
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        if context_tokens is None:
+            context_tokens = getattr(llm, "num_ctx", 4096)
+        self._budget = TokenBudget(max_context_tokens=context_tokens)
+        self._lock = threading.Lock()
+        # temperature -> requests waiting for the next flush
+        self._pending: dict[float, list[_Request]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def submit(self, prompt: str, system_prompt: str | None = None,
+               temperature: float = 0.7, max_tokens: int = 512) -> Future:
+        """Queue a structured request; the Future resolves to its parsed dict."""
+        request = _Request(prompt, system_prompt, max_tokens)
+        with self._lock:
+            queue = self._pending.get(temperature)
+            if queue and not self._fits([*queue, request]):
+                # Send what's waiting; this request starts the next batch
+                self._pool().submit(self._run, self._pending.pop(temperature), temperature)
+                queue = None
+            if queue is None:
+                queue = self._pending[temperature] = []
+            queue.append(request)
+            if len(queue) >= self.max_batch:
+                batch = self._pending.pop(temperature)
+                self._pool().submit(self._run, batch, temperature)
+            elif len(queue) == 1:
+                timer = threading.Timer(self.max_wait, self._flush, (temperature, queue))
+                timer.daemon = True
+                timer.start()
+        return request.future
+
+    def generate(self, prompt: str, system_prompt: str | None = None,
+                 temperature: float = 0.8, max_tokens: int = 1024) -> str:
+        return self.inner.generate(prompt, system_prompt, temperature, max_tokens)
+
+    def generate_structured(self, prompt: str, system_prompt: str | None = None,
+                            temperature: float = 0.7, max_tokens: int = 512) -> dict[str, Any]:
+        return self.submit(prompt, system_prompt, temperature, max_tokens).result()
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    @property
+    def model_name(self) -> str:
+        return self.inner.model_name
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _fits(self, batch: list[_Request]) -> bool:
+        """Whether the batch prompt and every answer's budget fit the context window."""
+        answer_tokens = sum(r.max_tokens for r in batch)
+        return self._budget.fits_budget(_render_batch(batch), reserved_tokens=answer_tokens)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm-batch")
+        return self._executor
+
+    def _flush(self, temperature: float, queue: list[_Request]) -> None:
+        with self._lock:
+            # The queue may already have been flushed for reaching max_batch
+            if self._pending.get(temperature) is not queue:
+                return
+            del self._pending[temperature]
+        self._run(queue, temperature)
+
+    def _run(self, batch: list[_Request], temperature: float) -> None:
+        if len(batch) == 1:
+            self._run_single(batch[0], temperature)
+            return
+        try:
+            raw = self.inner.generate_structured(
+                _render_batch(batch), None, temperature, sum(r.max_tokens for r in batch),
+            )
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        answers = _answers_by_task(raw, len(batch))
+        for i, request in enumerate(batch, 1):
+            answer = answers.get(i)
+            if answer is not None:
+                request.future.set_result(answer)
+            else:
+                logger.debug(f"Batched answer {i}/{len(batch)} missing, retrying alone")
+                self._run_single(request, temperature)
+
+    def _run_single(self, request: _Request, temperature: float) -> None:
+        try:
+            result = self.inner.generate_structured(
+                request.prompt, request.system_prompt, temperature, request.max_tokens,
+            )
+        except Exception as e:
+            request.future.set_exception(e)
+        else:
+            request.future.set_result(result)
+
+
+def _render_batch(batch: list[_Request]) -> str:
+    """Render N requests as one prompt, sending each distinct system prompt once."""
+    specs: list[str] = []
+    spec_index: dict[str, int] = {}
+    tasks = []
+    for request in batch:
+        spec = request.system_prompt or "Respond in JSON only."
+        if spec not in spec_index:
+            spec_index[spec] = len(specs) + 1
+            specs.append(spec)
+        tasks.append({"format": spec_index[spec], "prompt": request.prompt})
+    return _get_jinja().get_template("batch_generation.j2").render(specs=specs, tasks=tasks)
+
+
+def _answers_by_task(raw: Any, n_tasks: int) -> dict[int, dict]:
+    """Map task number -> answer, keeping only answers whose number is unambiguous.
+
+    Position is never trusted: a dropped or reordered answer would hand
+    later tasks each other's payloads, and the validators are too lenient
+    to catch an NPC returned for a quest.
+    """
+    items = raw.get("answers") if isinstance(raw, dict) else None
+    if not isinstance(items, list):
+        return {}
+    answers: dict[int, dict] = {}
+    duplicated: set[int] = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            task = int(item.get("task"))
+        except (TypeError, ValueError):
+            continue
+        answer = item.get("answer")
+        if not 1 <= task <= n_tasks or not isinstance(answer, dict) or not answer:
+            continue
+        if task in answers:
+            duplicated.add(task)
+        answers[task] = answer
+    for task in duplicated:
+        del answers[task]
+    return answers
@@ -3,12 +3,59 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, Iterable
 
 from text_rpg.llm.provider import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+_JSON_ONLY = "\n\nYou MUST respond with valid JSON only. No other text."
+
+
+class _JsonObjectEnd:
+    """Incremental scanner that finds where the first top-level JSON object closes."""
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> int:
+        """Consume *text*; return the index just past the closing brace, or -1."""
+        for i, c in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif c == "\\":
+                    self.escaped = True
+                elif c == '"':
+                    self.in_string = False
+            elif c == '"':
+                # Strings only matter once inside the object
+                self.in_string = self.depth > 0
+            elif c == "{":
+                self.depth += 1
+            elif c == "}" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+def _take_json_object(deltas: Iterable[str]) -> str:
+    """Join streamed deltas, stopping as soon as the JSON object is complete."""
+    scanner = _JsonObjectEnd()
+    parts: list[str] = []
+    for delta in deltas:
+        end = scanner.feed(delta)
+        if end >= 0:
+            parts.append(delta[:end])
+            break
+        parts.append(delta)
+    return "".join(parts)
+
 
 class OllamaProvider(LLMProvider):
     def __init__(self, model: str = "mistral", base_url: str = "http://localhost:11434",
@@ -18,14 +65,19 @@ class OllamaProvider(LLMProvider):
         self._litellm_model = f"ollama/{model}"
         self._num_ctx = num_ctx
 
+    def _messages(self, prompt: str, system_prompt: str | None) -> list[dict[str, Any]]:
+        messages: list[dict[str, Any]] = []
+        # Ollama reuses the KV cache of a repeated system prefix on its own
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
     def generate(self, prompt: str, system_prompt: str | None = None,
                  temperature: float = 0.8, max_tokens: int = 1024) -> str:
         try:
             import litellm
-            messages: list[dict[str, str]] = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
+            messages = self._messages(prompt, system_prompt)
 
             response = litellm.completion(
                 model=self._litellm_model,
@@ -42,8 +94,70 @@ class OllamaProvider(LLMProvider):
 
     def generate_structured(self, prompt: str, system_prompt: str | None = None,
                             temperature: float = 0.7, max_tokens: int = 512) -> dict[str, Any]:
-        json_system = (system_prompt or "") + "\n\nYou MUST respond with valid JSON only. No other text."
-        text = self.generate(prompt, json_system, temperature, max_tokens)
+        # Streamed so the request is dropped once the object closes, rather
+        # than waiting on (and paying for) any trailing commentary.
+        try:
+            import litellm
+            stream = litellm.completion(
+                model=self._litellm_model,
+                messages=self._messages(prompt, (system_prompt or "") + _JSON_ONLY),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                api_base=self.base_url,
+                num_ctx=self._num_ctx,
+                stream=True,
+            )
+            text = _take_json_object(chunk.choices[0].delta.content or "" for chunk in stream)
+        except Exception as e:
+            logger.error(f"LLM generation failed: {e}")
+            return {}
+        return self._parse_json(text)
+
+    async def agenerate(self, prompt: str, system_prompt: str | None = None,
+                        temperature: float = 0.8, max_tokens: int = 1024) -> str:
+        try:
+            import litellm
+            messages = self._messages(prompt, system_prompt)
+
+            response = await litellm.acompletion(
+                model=self._litellm_model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                api_base=self.base_url,
+                num_ctx=self._num_ctx,
+            )
+            return response.choices[0].message.content or ""
+        except Exception as e:
+            logger.error(f"LLM generation failed: {e}")
+            return self._fallback_response()
+
+    async def agenerate_structured(self, prompt: str, system_prompt: str | None = None,
+                                   temperature: float = 0.7, max_tokens: int = 512) -> dict[str, Any]:
+        try:
+            import litellm
+            stream = await litellm.acompletion(
+                model=self._litellm_model,
+                messages=self._messages(prompt, (system_prompt or "") + _JSON_ONLY),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                api_base=self.base_url,
+                num_ctx=self._num_ctx,
+                stream=True,
+            )
+            scanner = _JsonObjectEnd()
+            parts: list[str] = []
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content or ""
+                end = scanner.feed(delta)
+                if end >= 0:
+                    parts.append(delta[:end])
+                    break
+                parts.append(delta)
+            text = "".join(parts)
+        except Exception as e:
+            logger.error(f"LLM generation failed: {e}")
+            return {}
         return self._parse_json(text)
 
     def is_available(self) -> bool:
@@ -61,12 +175,17 @@ class OllamaProvider(LLMProvider):
     def model_name(self) -> str:
         return self._model
 
+    @property
+    def num_ctx(self) -> int:
+        return self._num_ctx
+
     def _parse_json(self, text: str) -> dict[str, Any]:
         text = text.strip()
         if "```json" in text:
             start = text.index("```json") + 7
-            end = text.index("```", start)
-            text = text[start:end].strip()
+            # A streamed reply is cut at the closing brace, before the fence closes
+            end = text.find("```", start)
+            text = text[start:end if end != -1 else len(text)].strip()
         elif "```" in text:
             start = text.index("```") + 3
             end = text.index("```", start) if "```" in text[start + 3:] else len(text)
@@ -1,6 +1,7 @@
 """Abstract LLM provider interface."""
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -14,6 +15,18 @@ class LLMProvider(ABC):
     def generate_structured(self, prompt: str, system_prompt: str | None = None,
                             temperature: float = 0.7, max_tokens: int = 512) -> dict[str, Any]: ...
 
+    async def agenerate(self, prompt: str, system_prompt: str | None = None,
+                        temperature: float = 0.8, max_tokens: int = 1024) -> str:
+        """Async generate(). Default runs the sync call in a worker thread."""
+        return await asyncio.to_thread(self.generate, prompt, system_prompt, temperature, max_tokens)
+
+    async def agenerate_structured(self, prompt: str, system_prompt: str | None = None,
+                                   temperature: float = 0.7, max_tokens: int = 512) -> dict[str, Any]:
+        """Async generate_structured(). Default runs the sync call in a worker thread."""
+        return await asyncio.to_thread(
+            self.generate_structured, prompt, system_prompt, temperature, max_tokens,
+        )
+
     @abstractmethod
     def is_available(self) -> bool: ...
 
@@ -0,0 +1,186 @@
+"""Response cache in front of an LLMProvider — exact-match plus optional semantic lookup."""
+from __future__ import annotations
+
+import copy
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from text_rpg.llm.provider import LLMProvider
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class InMemoryEmbeddingCache:
+    """Bounded LRU cache of structured LLM responses with a TTL.
+
+    Entries are keyed by a hash of the full request. When an embedding is
+    stored alongside an entry, lookup_similar() can also match prompts whose
+    embedding is within the cosine threshold. Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl_seconds: float = 600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # key -> (stored_at, embedding | None, response)
+        self._entries: OrderedDict[str, tuple[float, list[float] | None, dict]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry[0]):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def lookup_similar(self, embedding: list[float], threshold: float) -> dict | None:
+        with self._lock:
+            best_key: str | None = None
+            best_score = threshold
+            for key, (stored_at, emb, _) in list(self._entries.items()):
+                if self._expired(stored_at):
+                    del self._entries[key]
+                    continue
+                if emb is None:
+                    continue
+                score = _cosine(embedding, emb)
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is None:
+                return None
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][2]
+
+    def put(self, key: str, response: dict, embedding: list[float] | None = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _expired(self, stored_at: float) -> bool:
+        return (time.monotonic() - stored_at) > self.ttl_seconds
+
+
+class CachedLLMProvider(LLMProvider):
+    """Wraps an LLMProvider and serves repeated structured requests from cache.
+
+    Only generate_structured() is cached — free-text generate() is narrative
+    and should vary per call. Empty responses (parse failures) are never
+    stored. Callers always receive a deep copy, since validators mutate the
+    returned dict. Identical requests that arrive while the first is still
+    in flight (e.g. from the Director's background pool) wait for its answer
+    instead of issuing a second LLM call.
+    """
+
+    def __init__(
+        self,
+        llm: LLMProvider,
+        cache: InMemoryEmbeddingCache | None = None,
+        threshold: float = 0.95,
+        embed_fn: Callable[[str], list[float]] | None = None,
+    ) -> None:
+        self.inner = llm
+        self.cache = cache or InMemoryEmbeddingCache()
+        self.threshold = threshold
+        self.embed_fn = embed_fn
+        self.hits = 0
+        self.misses = 0
+        # Guards _inflight; the cache has its own lock
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+
+    def generate(self, prompt: str, system_prompt: str | None = None,
+                 temperature: float = 0.8, max_tokens: int = 1024) -> str:
+        return self.inner.generate(prompt, system_prompt, temperature, max_tokens)
+
+    def generate_structured(self, prompt: str, system_prompt: str | None = None,
+                            temperature: float = 0.7, max_tokens: int = 512) -> dict[str, Any]:
+        key = self.request_key(prompt, system_prompt, temperature, max_tokens)
+        with self._lock:
+            cached = self.cache.get(key)
+            pending = self._inflight.get(key) if cached is None else None
+            if cached is None and pending is None:
+                owned: Future = Future()
+                self._inflight[key] = owned
+
+        if cached is not None:
+            self.hits += 1
+            return copy.deepcopy(cached)
+        if pending is not None:
+            self.hits += 1
+            return copy.deepcopy(pending.result())
+
+        try:
+            result = self._generate_uncached(key, prompt, system_prompt, temperature, max_tokens)
+        except BaseException as e:
+            owned.set_exception(e)
+            raise
+        else:
+            # Waiters copy from this snapshot, not the dict our caller will mutate
+            owned.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _generate_uncached(self, key: str, prompt: str, system_prompt: str | None,
+                           temperature: float, max_tokens: int) -> dict[str, Any]:
+        embedding: list[float] | None = None
+        if self.embed_fn is not None:
+            try:
+                embedding = self.embed_fn(prompt)
+            except Exception:
+                embedding = None
+            if embedding:
+                cached = self.cache.lookup_similar(embedding, self.threshold)
+                if cached is not None:
+                    self.hits += 1
+                    return copy.deepcopy(cached)
+
+        self.misses += 1
+        result = self.inner.generate_structured(prompt, system_prompt, temperature, max_tokens)
+        if result:
+            self.cache.put(key, copy.deepcopy(result), embedding)
+        return result
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    @property
+    def model_name(self) -> str:
+        return self.inner.model_name
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    @staticmethod
+    def request_key(prompt: str, system_prompt: str | None,
+                    temperature: float, max_tokens: int) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for part in (prompt, system_prompt or "", repr(temperature), repr(max_tokens)):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
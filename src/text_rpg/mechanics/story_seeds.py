@@ -1,8 +1,10 @@
 """Pure functions for the story seeds system — loading, selection, variable resolution."""
 from __future__ import annotations
 
+import functools
 import json
 import random
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -12,8 +14,23 @@ STORIES_DIR = Path(__file__).parent.parent / "content" / "stories"
 BEAT_ORDER = ("hook", "development", "escalation", "resolution")
 
 
+@dataclass(slots=True)
+class TriggerState:
+    """Per-story snapshot consumed by check_beat_trigger."""
+    turn_number: int = 0
+    character_level: int = 1
+    completed_quest_ids: list[str] = field(default_factory=list)
+    current_beat: str = "hook"
+    beat_turn_numbers: dict[str, int] = field(default_factory=dict)
+    quest_ids: list[str] = field(default_factory=list)
+
+
+@functools.cache
 def load_all_seeds() -> list[dict]:
-    """Load all story seeds from TOML files in content/stories/."""
+    """Load all story seeds from TOML files in content/stories/.
+
+    Cached per process — treat the result as read-only.
+    """
     import tomllib
 
     seeds: list[dict] = []
@@ -26,10 +43,34 @@ def load_all_seeds() -> list[dict]:
             data = tomllib.load(fh)
         for seed in data.get("seeds", []):
             seed["_source_file"] = f.stem
+            # Precompiled for select_seed's filters
+            seed["_incompatible_tags_set"] = frozenset(seed.get("incompatible_tags", ()))
+            seed["_level_bounds"] = tuple(seed.get("level_range", (1, 20))[:2])
             seeds.append(seed)
     return seeds
 
 
+@functools.cache
+def load_seed_map() -> dict[str, dict]:
+    """Map seed id -> seed for all loaded seeds. Cached alongside load_all_seeds."""
+    return {s["id"]: s for s in load_all_seeds()}
+
+
+@functools.lru_cache(maxsize=64)
+def eligible_seed_ids(completed_ids: frozenset[str], character_level: int) -> frozenset[str]:
+    """IDs of loaded seeds not yet completed whose level range covers *character_level*.
+
+    A cheap pre-filter for select_seed (ignores tag compatibility). Both keys
+    change rarely, so the answer is memoized.
+    """
+    eligible = set()
+    for seed in load_all_seeds():
+        level_min, level_max = seed["_level_bounds"]
+        if seed["id"] not in completed_ids and level_min <= character_level <= level_max:
+            eligible.add(seed["id"])
+    return frozenset(eligible)
+
+
 def select_seed(
     available_seeds: list[dict],
     game_state: dict,
@@ -47,8 +88,8 @@ def select_seed(
     Returns:
         Selected seed dict, or None if none eligible.
     """
-    completed_ids = completed_ids or []
-    active_tags = active_tags or []
+    completed_set = frozenset(completed_ids or ())
+    active_tags_set = frozenset(active_tags or ())
     turn = game_state.get("turn_number", 0)
     level = game_state.get("character_level", 1)
 
@@ -57,17 +98,19 @@ def select_seed(
 
     for seed in available_seeds:
         # Skip already completed
-        if seed["id"] in completed_ids:
+        if seed["id"] in completed_set:
             continue
 
         # Check level range
-        level_range = seed.get("level_range", [1, 20])
-        if not (level_range[0] <= level <= level_range[1]):
+        level_min, level_max = seed.get("_level_bounds") or seed.get("level_range", (1, 20))[:2]
+        if not (level_min <= level <= level_max):
             continue
 
         # Check incompatible tags
-        incompatible = seed.get("incompatible_tags", [])
-        if any(t in active_tags for t in incompatible):
+        incompatible = seed.get("_incompatible_tags_set")
+        if incompatible is None:
+            incompatible = frozenset(seed.get("incompatible_tags", ()))
+        if not incompatible.isdisjoint(active_tags_set):
             continue
 
         eligible.append(seed)
@@ -154,22 +197,15 @@ def fill_templates(items: list[str], variables: dict[str, str]) -> list[str]:
     return [fill_template(t, variables) for t in items]
 
 
-def check_beat_trigger(
-    beat: dict,
-    story_state: dict,
-    game_state: dict,
-) -> bool:
+def check_beat_trigger(beat: dict, state: TriggerState) -> bool:
     """Check if a beat's trigger conditions are met.
 
     Args:
         beat: The beat definition from the seed.
-        story_state: Current story tracking state.
-        game_state: Current game state (turn_number, completed quests, etc.).
+        state: Story tracking state plus the game state it is checked against.
     """
     trigger_type = beat.get("trigger_type", "")
-    turn = game_state.get("turn_number", 0)
-    completed_quests = game_state.get("completed_quest_ids", [])
-    beat_turns = story_state.get("beat_turn_numbers", {})
+    turn = state.turn_number
 
     if trigger_type == "turn_range":
         # Activate when turn is between min and max
@@ -177,20 +213,17 @@ def check_beat_trigger(
 
     elif trigger_type == "turn_offset":
         # Activate N turns after the previous beat was activated
-        prev_beat = _previous_beat(story_state.get("current_beat", "hook"))
-        prev_turn = beat_turns.get(prev_beat, 0)
+        prev_beat = _previous_beat(state.current_beat)
+        prev_turn = state.beat_turn_numbers.get(prev_beat, 0)
         offset = beat.get("trigger_value", 20)
         return turn >= prev_turn + offset
 
     elif trigger_type == "quest_complete":
         # Activate when a specific quest is completed
         trigger_value = beat.get("trigger_value", "")
-        if trigger_value == "hook_quest":
-            quest_ids = story_state.get("quest_ids", [])
-            return any(qid in completed_quests for qid in quest_ids)
-        elif trigger_value == "escalation_quest":
-            quest_ids = story_state.get("quest_ids", [])
-            return any(qid in completed_quests for qid in quest_ids)
+        completed_quests = state.completed_quest_ids
+        if trigger_value in ("hook_quest", "escalation_quest"):
+            return any(qid in completed_quests for qid in state.quest_ids)
         return trigger_value in completed_quests
 
     return False
@@ -3,12 +3,14 @@ from __future__ import annotations
 from text_rpg.rag.vector_store import VectorStore
 from text_rpg.rag.embeddings import OllamaEmbeddings
 from text_rpg.rag.indexer import Indexer
+from text_rpg.rag.index_queue import IndexerQueue
 from text_rpg.rag.retriever import Retriever, RetrievalResult
 
 __all__ = [
     "VectorStore",
     "OllamaEmbeddings",
     "Indexer",
+    "IndexerQueue",
     "Retriever",
     "RetrievalResult",
 ]
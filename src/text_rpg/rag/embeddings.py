@@ -26,14 +26,21 @@ class OllamaEmbeddings:
         """Embed a single text string."""
         return self._call_ollama(text)
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Embed multiple texts sequentially."""
-        return [self._call_ollama(t) for t in texts]
+    def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        """Embed multiple texts, sending up to *batch_size* per request."""
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), batch_size):
+            vectors.extend(self._call_ollama_batch(texts[start:start + batch_size]))
+        return vectors
 
     def _call_ollama(self, text: str) -> list[float]:
         """Call the Ollama embedding endpoint and return the vector."""
+        return self._call_ollama_batch([text])[0]
+
+    def _call_ollama_batch(self, texts: list[str]) -> list[list[float]]:
+        """Call the Ollama embedding endpoint once for a list of inputs."""
         url = f"{self.base_url}/api/embed"
-        payload = json.dumps({"model": self.model, "input": text}).encode()
+        payload = json.dumps({"model": self.model, "input": texts}).encode()
         req = urllib.request.Request(
             url,
             data=payload,
@@ -42,13 +49,15 @@ class OllamaEmbeddings:
         try:
             with urllib.request.urlopen(req, timeout=30) as resp:
                 result: dict[str, Any] = json.loads(resp.read())
-                return result["embeddings"][0]
+                embeddings = result["embeddings"]
+                if len(embeddings) != len(texts):
+                    raise IndexError(f"expected {len(texts)} embeddings, got {len(embeddings)}")
+                return embeddings
         except (urllib.error.URLError, ConnectionError, TimeoutError) as exc:
             logger.warning("Ollama embedding failed: %s. Zero-vector fallback.", exc)
-            return [0.0] * self.DEFAULT_DIM
         except (KeyError, IndexError) as exc:
             logger.warning("Unexpected Ollama response: %s. Zero-vector fallback.", exc)
-            return [0.0] * self.DEFAULT_DIM
+        return [[0.0] * self.DEFAULT_DIM for _ in texts]
 
     def is_available(self) -> bool:
         """Return True if Ollama is running and the model is available."""
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+
+from text_rpg.rag.indexer import Indexer
+
+logger = logging.getLogger(__name__)
+
+
+class IndexerQueue:
+    """Runs Indexer writes on a background thread so the turn loop never waits on embeddings.
+
+    Exposes the same ``index_event`` / ``index_lore`` / ``index_npc_fact``
+    methods as :class:`Indexer`, but they only enqueue. A daemon consumer
+    drains up to *batch_size* entries at a time into ``Indexer.index_many``.
+    The thread is started on the first enqueue.
+    """
+
+    def __init__(self, indexer: Indexer, batch_size: int = 32) -> None:
+        self.indexer = indexer
+        self.batch_size = batch_size
+        self._queue: queue.Queue[tuple[str, tuple] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def index_event(
+        self,
+        game_id: str,
+        event_type: str,
+        description: str,
+        location_id: str | None = None,
+        actor_id: str | None = None,
+        turn_number: int = 0,
+    ) -> None:
+        self._put(("event", (game_id, event_type, description, location_id, actor_id, turn_number)))
+
+    def index_lore(self, content: str, category: str, tags: dict[str, str] | None = None) -> None:
+        self._put(("lore", (content, category, tags)))
+
+    def index_npc_fact(self, game_id: str, npc_id: str, npc_name: str, fact: str) -> None:
+        self._put(("npc_fact", (game_id, npc_id, npc_name, fact)))
+
+    def flush(self) -> None:
+        """Block until every queued entry has been indexed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Index whatever is queued, then stop the consumer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _put(self, entry: tuple[str, tuple]) -> None:
+        if self.indexer is None:
+            return
+        self._ensure_thread()
+        self._queue.put(entry)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="rag-indexer", daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            batch = [first] if first is not None else []
+            stop = first is None
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                else:
+                    batch.append(entry)
+            try:
+                self.indexer.index_many(batch)
+            except Exception as e:
+                logger.warning(f"Background indexing of {len(batch)} entries failed: {e}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
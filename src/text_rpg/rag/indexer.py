@@ -39,23 +39,9 @@ class Indexer:
         turn_number: int = 0,
     ) -> None:
         """Index a game event for later retrieval."""
-        if not self.is_available:
-            return
-        doc_id = str(uuid.uuid4())
-        embedding = self.embeddings.embed(description)
-        metadata: dict[str, Any] = {
-            "game_id": game_id,
-            "event_type": event_type,
-            "turn_number": turn_number,
-            "doc_type": "event",
-        }
-        if location_id:
-            metadata["location_id"] = location_id
-        if actor_id:
-            metadata["actor_id"] = actor_id
-        self.store.add_documents(
-            "events", [description], [metadata], [doc_id], [embedding]
-        )
+        self.index_many([
+            ("event", (game_id, event_type, description, location_id, actor_id, turn_number)),
+        ])
 
     # ------------------------------------------------------------------
     # Lore indexing
@@ -68,16 +54,7 @@ class Indexer:
         tags: dict[str, str] | None = None,
     ) -> None:
         """Index world lore or generated content."""
-        if not self.is_available:
-            return
-        doc_id = str(uuid.uuid4())
-        embedding = self.embeddings.embed(content)
-        metadata: dict[str, Any] = {"category": category, "doc_type": "lore"}
-        if tags:
-            metadata.update(tags)
-        self.store.add_documents(
-            "game_lore", [content], [metadata], [doc_id], [embedding]
-        )
+        self.index_many([("lore", (content, category, tags))])
 
     # ------------------------------------------------------------------
     # NPC fact indexing
@@ -91,20 +68,31 @@ class Indexer:
         fact: str,
     ) -> None:
         """Index a fact about an NPC."""
-        if not self.is_available:
+        self.index_many([("npc_fact", (game_id, npc_id, npc_name, fact))])
+
+    # ------------------------------------------------------------------
+    # Batched indexing
+    # ------------------------------------------------------------------
+
+    def index_many(self, entries: list[tuple[str, tuple]]) -> None:
+        """Index a batch of ``(kind, args)`` entries with one embedding call.
+
+        *kind* is ``"event"``, ``"lore"`` or ``"npc_fact"`` and *args* are the
+        positional arguments of the matching ``index_*`` method.
+        """
+        if not entries or not self.is_available:
             return
-        doc_id = str(uuid.uuid4())
-        text = f"{npc_name}: {fact}"
-        embedding = self.embeddings.embed(text)
-        metadata: dict[str, Any] = {
-            "game_id": game_id,
-            "npc_id": npc_id,
-            "npc_name": npc_name,
-            "doc_type": "npc_fact",
-        }
-        self.store.add_documents(
-            "game_lore", [text], [metadata], [doc_id], [embedding]
-        )
+        # collection -> (texts, metadatas)
+        grouped: dict[str, tuple[list[str], list[dict[str, Any]]]] = {}
+        for kind, args in entries:
+            collection, text, metadata = _DOC_BUILDERS[kind](*args)
+            texts, metadatas = grouped.setdefault(collection, ([], []))
+            texts.append(text)
+            metadatas.append(metadata)
+        for collection, (texts, metadatas) in grouped.items():
+            embeddings = self.embeddings.embed_batch(texts)
+            ids = [str(uuid.uuid4()) for _ in texts]
+            self.store.add_documents(collection, texts, metadatas, ids, embeddings)
 
     # ------------------------------------------------------------------
     # Bulk / seed data
@@ -129,3 +117,52 @@ class Indexer:
         embeddings = self.embeddings.embed_batch(texts)
         self.store.add_documents("srd_reference", texts, metadatas, ids, embeddings)
         logger.info("Indexed %d seed documents.", len(documents))
+
+
+def _event_doc(
+    game_id: str,
+    event_type: str,
+    description: str,
+    location_id: str | None = None,
+    actor_id: str | None = None,
+    turn_number: int = 0,
+) -> tuple[str, str, dict[str, Any]]:
+    metadata: dict[str, Any] = {
+        "game_id": game_id,
+        "event_type": event_type,
+        "turn_number": turn_number,
+        "doc_type": "event",
+    }
+    if location_id:
+        metadata["location_id"] = location_id
+    if actor_id:
+        metadata["actor_id"] = actor_id
+    return "events", description, metadata
+
+
+def _lore_doc(
+    content: str, category: str, tags: dict[str, str] | None = None,
+) -> tuple[str, str, dict[str, Any]]:
+    metadata: dict[str, Any] = {"category": category, "doc_type": "lore"}
+    if tags:
+        metadata.update(tags)
+    return "game_lore", content, metadata
+
+
+def _npc_fact_doc(
+    game_id: str, npc_id: str, npc_name: str, fact: str,
+) -> tuple[str, str, dict[str, Any]]:
+    metadata: dict[str, Any] = {
+        "game_id": game_id,
+        "npc_id": npc_id,
+        "npc_name": npc_name,
+        "doc_type": "npc_fact",
+    }
+    return "game_lore", f"{npc_name}: {fact}", metadata
+
+
+_DOC_BUILDERS = {
+    "event": _event_doc,
+    "lore": _lore_doc,
+    "npc_fact": _npc_fact_doc,
+}
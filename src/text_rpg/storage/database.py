@@ -28,6 +28,7 @@ _MIGRATIONS = [
     "018_guilds_professions",
     "019_origin_id",
     "020_size",
+    "021_quest_status_index",
 ]
 
 
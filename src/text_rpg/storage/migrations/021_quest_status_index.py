@@ -0,0 +1,10 @@
+"""Migration 021: Index quests by (game_id, status) for per-turn status lookups."""
+from __future__ import annotations
+
+import sqlite3
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quests_game_status ON quests(game_id, status)"
+    )
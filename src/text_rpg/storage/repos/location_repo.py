@@ -67,6 +67,15 @@ class LocationRepo:
             ).fetchone()
         return _deserialize(row)
 
+    def get_type_and_region(self, location_id: str, game_id: str) -> tuple[str | None, str | None] | None:
+        """Return (location_type, region_id) for a location without decoding its JSON fields."""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT location_type, region_id FROM locations WHERE id = ? AND game_id = ?",
+                (location_id, game_id),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
     def get_by_region(self, game_id: str, region_id: str) -> list[dict]:
         """Return all locations in a region for a given game."""
         with self.db.get_connection() as conn:
@@ -85,6 +94,16 @@ class LocationRepo:
             ).fetchall()
         return _deserialize_many(rows)
 
+    def get_visited_summary(self, game_id: str) -> dict[str | None, tuple[int, int]]:
+        """Return {region_id: (visited_count, total_count)} for a game's locations."""
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT region_id, SUM(visited), COUNT(*) FROM locations "
+                "WHERE game_id = ? GROUP BY region_id",
+                (game_id,),
+            ).fetchall()
+        return {r[0]: (int(r[1] or 0), r[2]) for r in rows}
+
     def update_field(
         self, location_id: str, game_id: str, field: str, value: Any
     ) -> None:
@@ -105,6 +105,15 @@ class ReputationRepo:
             result["crimes"] = json.loads(crimes)
         return result
 
+    def get_bounty_amount(self, game_id: str, region: str) -> int:
+        """Outstanding bounty in a region, without loading its crime list."""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT amount FROM bounties WHERE game_id = ? AND region = ?",
+                (game_id, region),
+            ).fetchone()
+        return (row[0] or 0) if row else 0
+
     def add_bounty(self, game_id: str, region: str, amount: int, crime_desc: str) -> None:
         with self.db.get_connection() as conn:
             row = conn.execute(
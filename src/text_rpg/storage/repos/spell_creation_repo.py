@@ -95,6 +95,17 @@ class SpellCreationRepo:
             ).fetchone()
         return self._row_to_dict(row) if row else None
 
+    def count_discoveries(self, game_id: str, char_id: str) -> int:
+        """Return custom spells plus discovered combinations for a character."""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT "
+                "(SELECT COUNT(*) FROM custom_spells WHERE game_id = ? AND character_id = ?) + "
+                "(SELECT COUNT(*) FROM discovered_combinations WHERE game_id = ? AND character_id = ?)",
+                (game_id, char_id, game_id, char_id),
+            ).fetchone()
+        return row[0]
+
     def delete_all(self, game_id: str) -> None:
         """Delete all spell creation data for a game (used in game deletion cascade)."""
         with self.db.get_connection() as conn:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, field
 from typing import Any
 
 from text_rpg.storage.database import Database
@@ -11,6 +12,15 @@ _QUEST_JSON = frozenset({"objectives", "item_rewards"})
 _COMBAT_JSON = frozenset({"combatants", "turn_order"})
 
 
+@dataclass(slots=True)
+class StoryContext:
+    """Everything story progression reads from the DB in one turn."""
+
+    active_stories: list[dict] = field(default_factory=list)
+    completed_story_ids: list[str] = field(default_factory=list)
+    completed_quest_ids: list[str] = field(default_factory=list)
+
+
 def _serialize_fields(data: dict, json_fields: frozenset[str]) -> dict:
     out = dict(data)
     for field in json_fields:
@@ -118,6 +128,15 @@ class WorldStateRepo:
             ).fetchall()
         return [_deserialize_row(r, _QUEST_JSON) for r in rows]
 
+    def get_completed_quest_ids(self, game_id: str) -> list[str]:
+        """Return the IDs of all completed quests for a game."""
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT id FROM quests WHERE game_id = ? AND status = 'completed'",
+                (game_id,),
+            ).fetchall()
+        return [r["id"] for r in rows]
+
     def update_quest_status(
         self, quest_id: str, game_id: str, status: str
     ) -> None:
@@ -169,6 +188,27 @@ class WorldStateRepo:
             ).fetchall()
         return [_deserialize_row(r, self._STORY_JSON) for r in rows]
 
+    def get_story_context(self, game_id: str) -> StoryContext:
+        """Load active stories, finished story IDs and completed quest IDs in one go."""
+        with self.db.get_connection() as conn:
+            active = conn.execute(
+                "SELECT * FROM story_state WHERE game_id = ? AND status = 'active'",
+                (game_id,),
+            ).fetchall()
+            finished = conn.execute(
+                "SELECT seed_id FROM story_state WHERE game_id = ? AND status IN ('completed', 'failed')",
+                (game_id,),
+            ).fetchall()
+            quests = conn.execute(
+                "SELECT id FROM quests WHERE game_id = ? AND status = 'completed'",
+                (game_id,),
+            ).fetchall() if active else []
+        return StoryContext(
+            active_stories=[_deserialize_row(r, self._STORY_JSON) for r in active],
+            completed_story_ids=[r["seed_id"] for r in finished],
+            completed_quest_ids=[r["id"] for r in quests],
+        )
+
     def get_story_state(self, game_id: str, seed_id: str) -> dict | None:
         with self.db.get_connection() as conn:
             row = conn.execute(
@@ -188,6 +228,26 @@ class WorldStateRepo:
                 (beat, json.dumps(activated_beats), json.dumps(quest_ids), game_id, seed_id),
             )
 
+    def advance_beat_tx(
+        self, game_id: str, seed_id: str, beat: str,
+        activated_beats: list[str], quest_ids: list[str],
+        beat_turn_numbers: dict[str, int],
+    ) -> None:
+        """Advance a story to a new beat in a single transaction.
+
+        Replaces the update_story_beat + get_story_state + save_story_state
+        sequence with one UPDATE and one commit.
+        """
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "UPDATE story_state SET current_beat = ?, activated_beats = ?, "
+                "quest_ids = ?, beat_turn_numbers = ? WHERE game_id = ? AND seed_id = ?",
+                (
+                    beat, json.dumps(activated_beats), json.dumps(quest_ids),
+                    json.dumps(beat_turn_numbers), game_id, seed_id,
+                ),
+            )
+
     def complete_story(self, game_id: str, seed_id: str, status: str) -> None:
         with self.db.get_connection() as conn:
             conn.execute(
@@ -221,3 +281,27 @@ class WorldStateRepo:
                 "VALUES (?, ?, ?, ?) ON CONFLICT(game_id, event_id) DO UPDATE SET last_triggered_turn = ?",
                 (f"{game_id}_{event_id}", game_id, event_id, turn, turn),
             )
+
+    def get_event_cooldowns(self, game_id: str, event_ids: list[str]) -> dict[str, int]:
+        """Return {event_id: last_triggered_turn} for the given events that have fired."""
+        if not event_ids:
+            return {}
+        placeholders = ",".join("?" * len(event_ids))
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT event_id, last_triggered_turn FROM world_event_cooldowns "
+                f"WHERE game_id = ? AND event_id IN ({placeholders})",
+                (game_id, *event_ids),
+            ).fetchall()
+        return {r["event_id"]: r["last_triggered_turn"] for r in rows if r["last_triggered_turn"]}
+
+    def set_event_cooldowns(self, game_id: str, event_ids: list[str], turn: int) -> None:
+        """Record that all of the given events fired on this turn."""
+        if not event_ids:
+            return
+        with self.db.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO world_event_cooldowns (id, game_id, event_id, last_triggered_turn) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(game_id, event_id) DO UPDATE SET last_triggered_turn = ?",
+                [(f"{game_id}_{eid}", game_id, eid, turn, turn) for eid in event_ids],
+            )
@@ -30,6 +30,9 @@ class GameContext:
         self.character = character
         self.location = location
         self.entities = entities
+        # Precomputed once per turn — several systems need "alive NPCs here"
+        self.alive_entities = [e for e in entities if e.get("is_alive", True)]
+        self.alive_npcs = [e for e in self.alive_entities if e.get("entity_type") == "npc"]
         self.combat_state = combat_state
         self.inventory = inventory
         self.recent_events = recent_events or []
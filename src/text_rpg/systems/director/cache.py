@@ -0,0 +1,146 @@
+"""Semantic response cache for the Director's evaluate/negotiate calls.
+
+Players repeat themselves: "climb the wall", "try climbing the wall again",
+"scale the wall". Each evaluation is cached under a compact key: the template,
+the free-text part of the request, and a scope of exact-match fields such as
+location and character level. A later request with the same scope is served
+from cache when its text matches exactly, or, once an embedding function is
+configured, when its text embeds within the cosine threshold.
+"""
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from text_rpg.llm.semantic_cache import InMemoryEmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Validated responses partitioned by (template_id, scope), LRU-bounded.
+
+    Partitioning keeps the cosine probe confined to requests that can share
+    an answer. A plausibility check in another location never matches.
+    Safe to share between threads; embedding happens outside the lock.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], list[float]] | None = None,
+        max_partitions: int = 128,
+        partition_size: int = 32,
+        ttl_seconds: float = 900.0,
+    ) -> None:
+        self.embed_fn = embed_fn
+        self.max_partitions = max_partitions
+        self.partition_size = partition_size
+        self.ttl_seconds = ttl_seconds
+        self._partitions: OrderedDict[tuple, InMemoryEmbeddingCache] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, template_id: str, scope: tuple, text: str,
+               threshold: float) -> tuple[dict | None, list[float] | None]:
+        """Return (cached response or None, embedding to pass to store()).
+
+        Text is only embedded when the partition exists and has no exact
+        match, so exact repeats and first-of-scope requests cost no embed
+        call. The embedding is None when it wasn't computed; store() then
+        embeds lazily.
+        """
+        with self._lock:
+            partition = self._partitions.get((template_id, scope))
+            if partition is not None:
+                self._partitions.move_to_end((template_id, scope))
+        embedding = None
+        if partition is not None:
+            cached = partition.get(_exact_key(text))
+            if cached is None:
+                embedding = self._embed(text)
+                if embedding:
+                    cached = partition.lookup_similar(embedding, threshold)
+            if cached is not None:
+                self.hits += 1
+                return copy.deepcopy(cached), embedding
+        self.misses += 1
+        return None, embedding
+
+    def store(self, template_id: str, scope: tuple, text: str,
+              response: dict, embedding: list[float] | None) -> None:
+        if embedding is None:
+            embedding = self._embed(text)
+        key = (template_id, scope)
+        with self._lock:
+            partition = self._partitions.get(key)
+            if partition is None:
+                partition = InMemoryEmbeddingCache(self.partition_size, self.ttl_seconds)
+                self._partitions[key] = partition
+                while len(self._partitions) > self.max_partitions:
+                    self._partitions.popitem(last=False)
+        partition.put(_exact_key(text), copy.deepcopy(response), embedding or None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+
+    def _embed(self, text: str) -> list[float] | None:
+        """Embed text; [] when embedding failed or is unusable, None without embed_fn."""
+        if self.embed_fn is None:
+            return None
+        try:
+            embedding = self.embed_fn(text)
+        except Exception as e:
+            logger.debug(f"Semantic cache embedding failed: {e}")
+            return []
+        # Ollama's zero-vector fallback would never match anything anyway
+        return embedding if any(embedding) else []
+
+
+def _exact_key(text: str) -> str:
+    return hashlib.sha1(" ".join(text.lower().split()).encode()).hexdigest()
+
+
+_cache = SemanticCache()
+
+
+def get_cache() -> SemanticCache:
+    return _cache
+
+
+def configure(embed_fn: Callable[[str], list[float]] | None) -> None:
+    """Enable near-duplicate matching. Without an embed_fn only exact text repeats hit."""
+    _cache.embed_fn = embed_fn
+
+
+def semantic_cache(
+    template_id: str,
+    key_fn: Callable[..., tuple[str, tuple]],
+    threshold: float = 0.92,
+) -> Callable:
+    """Cache a generator's validated result under key_fn(*args) -> (text, scope).
+
+    Empty results are not stored, and callers always receive a copy.
+    """
+    def decorator(fn: Callable[..., dict]) -> Callable[..., dict]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> dict:
+            try:
+                text, scope = key_fn(*args, **kwargs)
+            except Exception:
+                return fn(*args, **kwargs)
+            cached, embedding = _cache.lookup(template_id, scope, text, threshold)
+            if cached is not None:
+                return cached
+            result = fn(*args, **kwargs)
+            if result:
+                _cache.store(template_id, scope, text, result, embedding)
+            return result
+        return wrapper
+    return decorator
@@ -1,20 +1,55 @@
 """Main Director class — post-turn evaluator that generates living world content."""
 from __future__ import annotations
 
-import json
 import logging
+import random
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
-
+from typing import Any, Callable
+
+from text_rpg.content.loader import (
+    load_all_factions,
+    load_all_regions,
+    load_region,
+    load_world_events,
+)
+from text_rpg.llm.batching import BatchingLLM
 from text_rpg.llm.provider import LLMProvider
+from text_rpg.llm.semantic_cache import CachedLLMProvider
+from text_rpg.mechanics.faction_goals import (
+    apply_goal_effects,
+    check_faction_goals,
+    check_world_events,
+)
+from text_rpg.mechanics.story_seeds import (
+    TriggerState,
+    check_beat_trigger,
+    eligible_seed_ids,
+    load_all_seeds,
+    load_seed_map,
+    next_beat,
+    resolve_variables,
+    select_seed,
+)
 from text_rpg.models.action import Action, ActionResult, DiceRoll, StateMutation
+from text_rpg.rag.index_queue import IndexerQueue
 from text_rpg.rag.indexer import Indexer
 from text_rpg.rag.retriever import Retriever
 from text_rpg.systems.base import GameContext
 from text_rpg.systems.director import triggers
-from text_rpg.utils import safe_json
+from text_rpg.systems.director.generators import (
+    evaluate_plausibility,
+    generate_follow_up_quest,
+    generate_location,
+    generate_npc,
+    generate_quest,
+    generate_region,
+)
 from text_rpg.systems.director.schemas import validate_plausibility
+from text_rpg.utils import safe_json, to_json_str
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +69,27 @@ _COOLDOWNS: dict[str, int] = {
 }
 
 
+# Games whose cooldowns a single Director remembers before evicting the LRU one
+_MAX_COOLDOWN_ENTRIES = 10_000
+
+
+@dataclass(slots=True)
+class _CooldownState:
+    """Turn each generation type last fired. One slot per _COOLDOWNS key."""
+
+    npc: int = -999
+    location: int = -999
+    quest: int = -999
+    enrich: int = -999
+    pacing: int = -999
+    story: int = -999
+    faction_goals: int = -999
+    world_event: int = -999
+    region: int = -999
+    arcane_location: int = -999
+    guild: int = -999
+
+
 class Director:
     """Post-turn evaluator that injects procedural content into the world.
 
@@ -47,11 +103,79 @@ class Director:
         retriever: Retriever,
         indexer: Indexer,
     ) -> None:
-        self.llm = llm
+        # Exact-match response cache: identical generator prompts (same
+        # location, entities, recent events) reuse the previous response.
+        self.llm = CachedLLMProvider(llm)
+        # Background-pool generations that overlap are coalesced into one LLM
+        # request; cache misses only, sharing the turn-thread cache.
+        self._batcher = BatchingLLM(llm)
+        self._batch_llm = CachedLLMProvider(self._batcher, cache=self.llm.cache)
         self.retriever = retriever
         self.indexer = indexer
-        # Track last generation turn per type to enforce cooldowns
-        self._last_generation: dict[str, int] = {}
+        # RAG writes are embedded and stored off the turn thread
+        self._index_queue = IndexerQueue(indexer)
+        self._index_fns = {
+            "lore": self._index_queue.index_lore,
+            "npc_fact": self._index_queue.index_npc_fact,
+            "event": self._index_queue.index_event,
+        }
+        # Last generation turn per type, per game — LRU-bounded, see _cooldowns()
+        self._last_generation: OrderedDict[str, _CooldownState] = OrderedDict()
+        self._max_cooldown_entries = _MAX_COOLDOWN_ENTRIES
+        # Off-turn LLM work (new-location NPCs, concurrent story quests). Only the
+        # LLM call runs on the pool — results are saved on the turn thread,
+        # which owns the DB connection.
+        self._background_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="director",
+        )
+        self._pending_npcs: dict[str, tuple[Future, dict]] = {}
+        # Speculative next-turn NPC per game: (future, location_id, turn_number)
+        self._prefetch: dict[str, tuple[Future, str, int]] = {}
+        # First-hit-wins generation steps, in priority order:
+        # (gen_type, cooldown, trigger(tctx, repos) or None, generate(context, repos))
+        self._pipeline: tuple[tuple[str, int, Callable | None, Callable], ...] = (
+            ("npc", _COOLDOWNS["npc"],
+             lambda t, r: triggers.should_spawn_npc(t, r), self._try_generate_npc),
+            ("quest", _COOLDOWNS["quest"], None, self._try_any_npc_quest),
+            ("enrich", _COOLDOWNS["enrich"],
+             lambda t, r: triggers.should_enrich_location(t), self._try_enrich_location),
+            ("pacing", _COOLDOWNS["pacing"],
+             lambda t, r: triggers.pacing_check(t), self._try_seed_hooks),
+            ("region", _COOLDOWNS["region"], None, self._try_reveal_region),
+            ("guild", _COOLDOWNS["guild"],
+             lambda t, r: triggers.should_offer_guild_recruitment(t, r),
+             self._guild_recruitment_hint),
+            ("arcane_location", _COOLDOWNS["arcane_location"],
+             lambda t, r: triggers.should_spawn_arcane_location(t, r),
+             self._arcane_location_hint),
+        )
+
+    def _safe_index(self, kind: str, *args: Any, **kwargs: Any) -> None:
+        """Queue a RAG write ("lore", "npc_fact" or "event"). Never raises."""
+        try:
+            self._index_fns[kind](*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"RAG indexing ({kind}) failed: {e}")
+
+    def flush_index(self) -> None:
+        """Finish any queued RAG writes. The consumer restarts on the next enqueue."""
+        self._index_queue.close()
+
+    def close(self) -> None:
+        """Stop background work on quit: drop queued generations, then flush RAG writes.
+
+        Generations already running are allowed to finish (their results are
+        discarded) so that no worker is left waiting on a closed batcher.
+        """
+        for future, _ in self._pending_npcs.values():
+            future.cancel()
+        self._pending_npcs.clear()
+        for future, _, _ in self._prefetch.values():
+            future.cancel()
+        self._prefetch.clear()
+        self._background_pool.shutdown(wait=True, cancel_futures=True)
+        self._batcher.close()
+        self.flush_index()
 
     def evaluate(
         self,
@@ -66,6 +190,12 @@ class Director:
         """
         events: list[dict] = []
 
+        # 0. Save any background-generated NPCs that have finished. Their
+        # locations (and those still generating) already have an NPC coming
+        # that this turn's context can't see yet.
+        npc_coming = self._collect_background_npcs(context, repos)
+        npc_blocked = context.location.get("id") in npc_coming
+
         # 1. Check for quest follow-ups on completed quests
         for event in action_result.events:
             if event.get("event_type") == "QUEST_COMPLETE":
@@ -78,94 +208,44 @@ class Director:
                             events.append(result)
                             return events
 
-        # 2. Should we spawn an NPC?
-        if self._can_generate("npc", context.turn_number):
-            if triggers.should_spawn_npc(context, repos):
-                result = self._try_generate_npc(context, repos)
-                if result:
-                    events.append(result)
-                    return events
-
-        # 3. Should we offer a quest from an existing NPC?
-        if self._can_generate("quest", context.turn_number):
-            for entity in context.entities:
-                if entity.get("entity_type") == "npc" and entity.get("is_alive", True):
-                    if triggers.should_offer_quest(entity, context):
-                        result = self._try_prepare_quest(entity, context, repos)
-                        if result:
-                            events.append(result)
-                            return events
-
-        # 4. Should we enrich the location?
-        if self._can_generate("enrich", context.turn_number):
-            if triggers.should_enrich_location(context):
-                result = self._try_enrich_location(context, repos)
-                if result:
-                    events.append(result)
-                    return events
-
-        # 5. Pacing check — seed hooks every N turns
-        if self._can_generate("pacing", context.turn_number):
-            if triggers.pacing_check(context):
-                result = self._try_seed_hooks(context, repos)
-                if result:
-                    events.append(result)
-                    return events
-
-        # 6. Should we reveal a new region?
-        if self._can_generate("region", context.turn_number):
-            result = self._try_reveal_region(context, repos)
+        # 2-6. Content generation — first success wins
+        turn = context.turn_number
+        tctx = triggers.TriggerCtx.from_context(context)
+        last_generation = self._cooldowns(context.game_id)
+        for gen_type, cooldown, trigger, generate in self._pipeline:
+            if turn - getattr(last_generation, gen_type) < cooldown:
+                continue
+            if gen_type == "npc" and npc_blocked:
+                continue
+            if trigger is not None and not trigger(tctx, repos):
+                continue
+            result = generate(context, repos)
             if result:
                 events.append(result)
                 return events
 
-        # 6b. Should we hint at guild recruitment for skilled crafters?
-        if self._can_generate("guild", context.turn_number):
-            if triggers.should_offer_guild_recruitment(context, repos):
-                self._last_generation["guild"] = context.turn_number
-                events.append({
-                    "event_type": "STORY_BEAT",
-                    "description": (
-                        "Your crafting skill has not gone unnoticed. "
-                        "A guild representative may be looking for talented artisans like you."
-                    ),
-                    "mechanical_details": {"hint": "guild_recruitment_nearby"},
-                })
-                return events
-
-        # 6c. Should we spawn an arcane location for spell inventors?
-        if self._can_generate("arcane_location", context.turn_number):
-            if triggers.should_spawn_arcane_location(context, repos):
-                self._last_generation["arcane_location"] = context.turn_number
-                events.append({
-                    "event_type": "STORY_BEAT",
-                    "description": (
-                        "Your growing mastery of spell creation draws attention. "
-                        "Rumors speak of a hidden arcane tower nearby, where ancient "
-                        "mages once forged spells of incredible power."
-                    ),
-                    "mechanical_details": {"hint": "arcane_location_nearby"},
-                })
-                return events
-
         # 7. Story progression — check story seed beats
         story_events = self._check_story_progression(context, repos)
         if story_events:
             events.extend(story_events)
 
         # 8. Faction goals — autonomous faction actions
-        if self._can_generate("faction_goals", context.turn_number):
+        if turn - last_generation.faction_goals >= _COOLDOWNS["faction_goals"]:
             faction_events = self._check_faction_goals(context, repos)
             if faction_events:
                 events.extend(faction_events)
-                self._last_generation["faction_goals"] = context.turn_number
+                last_generation.faction_goals = context.turn_number
 
         # 9. World events — random ambient events
-        if self._can_generate("world_event", context.turn_number):
+        if turn - last_generation.world_event >= _COOLDOWNS["world_event"]:
             world_events = self._check_world_events(context, repos)
             if world_events:
                 events.extend(world_events)
-                self._last_generation["world_event"] = context.turn_number
+                last_generation.world_event = context.turn_number
+
+        # 10. Nothing spawned — prefetch next turn's most likely generation
+        if not npc_blocked:
+            self._maybe_prefetch_npc(context, repos, tctx)
 
         return events
 
@@ -179,8 +259,6 @@ class Director:
         Returns dict with: plausibility, skill, ability, reasoning,
         success_description, failure_description.
         """
-        from text_rpg.systems.director.generators import evaluate_plausibility
-
         return evaluate_plausibility(self.llm, action.raw_input, context)
 
     def generate_creative_outcome(
@@ -222,8 +300,6 @@ class Director:
         deep enough past content boundaries, new locations may belong to a
         different region.
         """
-        from text_rpg.systems.director.generators import generate_location
-
         try:
             location_data = generate_location(
                 self.llm, context, direction, context.location,
@@ -246,8 +322,8 @@ class Director:
         location_data["region_id"] = new_region_id
 
         # Save new location (without embedded connections)
-        location_data["connections"] = json.dumps([])
-        repos["location"].save(_serialize_location(location_data))
+        location_data["connections"] = "[]"
+        repos["location"].save(_serialize("location", location_data, copy=True))
 
         # Create bidirectional connections in dedicated table
         reverse_dir = _reverse_direction(direction)
@@ -287,34 +363,82 @@ class Director:
         self._populate_new_location(location_data, context, repos)
 
         # Index to RAG
-        try:
-            self.indexer.index_lore(
-                f"Location discovered: {location_data['name']} — {location_data.get('description', '')}",
-                category="location",
-                tags={"game_id": context.game_id, "location_id": new_loc_id},
-            )
-        except Exception:
-            pass
+        self._safe_index(
+            "lore",
+            f"Location discovered: {location_data['name']} — {location_data.get('description', '')}",
+            category="location",
+            tags={"game_id": context.game_id, "location_id": new_loc_id},
+        )
 
-        self._last_generation["location"] = context.turn_number
+        self._cooldowns(context.game_id).location = context.turn_number
         return location_data
 
     # -- Private generation methods --
 
-    def _can_generate(self, gen_type: str, turn_number: int) -> bool:
+    def _try_any_npc_quest(
+        self, context: GameContext, repos: dict[str, Any]
+    ) -> dict | None:
+        """Offer a quest from the first living NPC here that qualifies."""
+        tctx = triggers.TriggerCtx.from_context(context)
+        for entity in context.alive_npcs:
+            if triggers.should_offer_quest(entity, tctx):
+                result = self._try_prepare_quest(entity, context, repos)
+                if result:
+                    return result
+        return None
+
+    def _guild_recruitment_hint(
+        self, context: GameContext, repos: dict[str, Any]
+    ) -> dict:
+        """Hint that a guild is interested in a skilled crafter."""
+        self._cooldowns(context.game_id).guild = context.turn_number
+        return {
+            "event_type": "STORY_BEAT",
+            "description": (
+                "Your crafting skill has not gone unnoticed. "
+                "A guild representative may be looking for talented artisans like you."
+            ),
+            "mechanical_details": {"hint": "guild_recruitment_nearby"},
+        }
+
+    def _arcane_location_hint(
+        self, context: GameContext, repos: dict[str, Any]
+    ) -> dict:
+        """Hint at a hidden arcane tower for spell inventors."""
+        self._cooldowns(context.game_id).arcane_location = context.turn_number
+        return {
+            "event_type": "STORY_BEAT",
+            "description": (
+                "Your growing mastery of spell creation draws attention. "
+                "Rumors speak of a hidden arcane tower nearby, where ancient "
+                "mages once forged spells of incredible power."
+            ),
+            "mechanical_details": {"hint": "arcane_location_nearby"},
+        }
+
+    def _cooldowns(self, game_id: str) -> _CooldownState:
+        """Cooldown state for one game, kept in a bounded LRU across games."""
+        state = self._last_generation.get(game_id)
+        if state is None:
+            state = self._last_generation[game_id] = _CooldownState()
+            if len(self._last_generation) > self._max_cooldown_entries:
+                self._last_generation.popitem(last=False)
+        else:
+            self._last_generation.move_to_end(game_id)
+        return state
+
+    def _can_generate(self, gen_type: str, turn_number: int, game_id: str) -> bool:
         """Check cooldown for a generation type."""
-        last = self._last_generation.get(gen_type, -999)
-        cooldown = _COOLDOWNS.get(gen_type, 5)
-        return (turn_number - last) >= cooldown
+        return turn_number - getattr(self._cooldowns(game_id), gen_type) >= _COOLDOWNS[gen_type]
 
     def _try_generate_npc(
         self, context: GameContext, repos: dict[str, Any]
     ) -> dict | None:
         """Attempt to generate and save a new NPC at the current location."""
-        from text_rpg.systems.director.generators import generate_npc
-
         try:
-            npc_data = generate_npc(self.llm, context, context.location, {})
+            npc_data = self._take_prefetched_npc(context)
+            if npc_data is None:
+                npc_data = generate_npc(self.llm, context, context.location, {})
         except Exception as e:
             logger.warning(f"NPC generation failed: {e}")
             return None
@@ -325,20 +449,18 @@ class Director:
         npc_data["game_id"] = context.game_id
         npc_data["location_id"] = context.location.get("id", "")
 
-        repos["entity"].save(_serialize_entity(npc_data))
+        repos["entity"].save(_serialize("entity", npc_data))
 
         # Index to RAG
-        try:
-            self.indexer.index_npc_fact(
-                context.game_id,
-                npc_data["id"],
-                npc_data["name"],
-                f"New NPC appeared: {npc_data.get('description', '')}",
-            )
-        except Exception:
-            pass
+        self._safe_index(
+            "npc_fact",
+            context.game_id,
+            npc_data["id"],
+            npc_data["name"],
+            f"New NPC appeared: {npc_data.get('description', '')}",
+        )
 
-        self._last_generation["npc"] = context.turn_number
+        self._cooldowns(context.game_id).npc = context.turn_number
         return {
             "event_type": "DIRECTOR_NPC_SPAWN",
             "description": f"A new figure appears: {npc_data['name']}.",
@@ -346,12 +468,59 @@ class Director:
             "location_id": context.location.get("id"),
         }
 
+    def _maybe_prefetch_npc(
+        self, context: GameContext, repos: dict[str, Any],
+        tctx: triggers.TriggerCtx | None = None,
+    ) -> None:
+        """Start generating an NPC in the background if one will likely spawn next turn.
+
+        Runs when the spawn trigger already holds but the NPC cooldown still
+        blocks, and the cooldown expires on the next turn. The result is kept
+        per game and only used if the player is still at this location.
+        """
+        pending = self._prefetch.get(context.game_id)
+        if pending is not None:
+            _, loc_id, turn = pending
+            if loc_id == context.location.get("id", "") and context.turn_number - turn <= 1:
+                return
+            # Player moved on or the prefetch went unused — drop it
+            pending[0].cancel()
+            del self._prefetch[context.game_id]
+        if not self._can_generate("npc", context.turn_number + 1, context.game_id):
+            return
+        if self._can_generate("npc", context.turn_number, context.game_id):
+            return  # Would have spawned this turn if it were going to
+        if tctx is None:
+            tctx = triggers.TriggerCtx.from_context(context)
+        if not triggers.should_spawn_npc(tctx, repos):
+            return
+
+        future = self._background_pool.submit(
+            generate_npc, self.llm, context, context.location, {},
+        )
+        self._prefetch[context.game_id] = (
+            future, context.location.get("id", ""), context.turn_number,
+        )
+
+    def _take_prefetched_npc(self, context: GameContext) -> dict | None:
+        """Consume a prefetched NPC if it is still valid for this turn.
+
+        Valid means same location and generated at most one turn ago; stale
+        prefetches are discarded. Raises if the background generation failed.
+        """
+        pending = self._prefetch.pop(context.game_id, None)
+        if pending is None:
+            return None
+        future, loc_id, turn = pending
+        if loc_id != context.location.get("id", "") or context.turn_number - turn > 1:
+            future.cancel()
+            return None
+        return future.result()
+
     def _try_prepare_quest(
         self, npc: dict, context: GameContext, repos: dict[str, Any]
     ) -> dict | None:
         """Generate a quest from an NPC's quest hook and save it."""
-        from text_rpg.systems.director.generators import generate_quest
-
         try:
             quest_data = generate_quest(self.llm, context, npc)
         except Exception as e:
@@ -361,19 +530,17 @@ class Director:
         quest_data["game_id"] = context.game_id
         quest_data["quest_giver_id"] = npc.get("id", "")
 
-        repos["world_state"].save_quest(_serialize_quest(quest_data))
+        repos["world_state"].save_quest(_serialize("quest", quest_data))
 
         # Index to RAG
-        try:
-            self.indexer.index_lore(
-                f"Quest available: {quest_data['name']} — {quest_data.get('description', '')}",
-                category="quest",
-                tags={"game_id": context.game_id, "quest_id": quest_data["id"]},
-            )
-        except Exception:
-            pass
+        self._safe_index(
+            "lore",
+            f"Quest available: {quest_data['name']} — {quest_data.get('description', '')}",
+            category="quest",
+            tags={"game_id": context.game_id, "quest_id": quest_data["id"]},
+        )
 
-        self._last_generation["quest"] = context.turn_number
+        self._cooldowns(context.game_id).quest = context.turn_number
         return {
             "event_type": "DIRECTOR_QUEST_AVAILABLE",
             "description": f"{npc['name']} seems to have something on their mind.",
@@ -390,8 +557,6 @@ class Director:
         self, completed_quest: dict, context: GameContext, repos: dict[str, Any]
     ) -> dict | None:
         """Generate a follow-up quest after completion."""
-        from text_rpg.systems.director.generators import generate_follow_up_quest
-
         try:
             quest_data = generate_follow_up_quest(self.llm, context, completed_quest)
         except Exception as e:
@@ -401,9 +566,9 @@ class Director:
         quest_data["game_id"] = context.game_id
         quest_data["quest_giver_id"] = completed_quest.get("quest_giver_id", "")
 
-        repos["world_state"].save_quest(_serialize_quest(quest_data))
+        repos["world_state"].save_quest(_serialize("quest", quest_data))
 
-        self._last_generation["quest"] = context.turn_number
+        self._cooldowns(context.game_id).quest = context.turn_number
         return {
             "event_type": "DIRECTOR_QUEST_FOLLOW_UP",
             "description": "A new opportunity arises from your completed quest.",
@@ -421,7 +586,7 @@ class Director:
         """Add flavour to an empty location — perhaps an NPC or item."""
         result = self._try_generate_npc(context, repos)
         if result:
-            self._last_generation["enrich"] = context.turn_number
+            self._cooldowns(context.game_id).enrich = context.turn_number
             return result
         return None
 
@@ -458,7 +623,7 @@ class Director:
         except Exception as e:
             logger.warning(f"Failed to save pacing intent: {e}")
 
-        self._last_generation["pacing"] = context.turn_number
+        self._cooldowns(context.game_id).pacing = context.turn_number
         return None  # Intents are silent — no event
 
     def _maybe_cross_region(
@@ -476,8 +641,6 @@ class Director:
         - The player has generated 3+ locations past content boundaries in this region
         - OR the player level exceeds the current region's level_range_max
         """
-        import random
-
         location_repo = repos.get("location")
         if not location_repo or not current_region_id:
             return current_region_id
@@ -496,7 +659,6 @@ class Director:
         player_level = context.character.get("level", 1)
         region_max = 5
         try:
-            from text_rpg.content.loader import load_region
             region_data = load_region(current_region_id)
             region_max = region_data.get("level_range_max", 5)
         except Exception:
@@ -514,14 +676,10 @@ class Director:
 
         # Find an unvisited content region to transition into
         try:
-            from text_rpg.content.loader import load_all_regions
-
             all_regions = load_all_regions()
-            all_game_locations = location_repo.get_all(context.game_id)
             visited_regions = {
-                loc.get("region_id", "")
-                for loc in all_game_locations
-                if loc.get("visited")
+                r for r, (visited, _) in location_repo.get_visited_summary(context.game_id).items()
+                if visited
             }
 
             # Prefer unvisited content regions
@@ -544,8 +702,6 @@ class Director:
         self, context: GameContext, repos: dict[str, Any]
     ) -> dict | None:
         """Check if conditions are right to reveal a new region, and generate one if so."""
-        from text_rpg.content.loader import load_all_regions, load_region
-
         try:
             all_regions = load_all_regions()
         except Exception:
@@ -571,12 +727,10 @@ class Director:
         if not location_repo:
             return None
 
-        all_game_locations = location_repo.get_all(context.game_id)
-        visited_regions = set()
-        for loc in all_game_locations:
-            r = loc.get("region_id", "")
-            if r and loc.get("visited"):
-                visited_regions.add(r)
+        visited_regions = {
+            r for r, (visited, _) in location_repo.get_visited_summary(context.game_id).items()
+            if r and visited
+        }
 
         # Find an unvisited content region at a higher tier
         unvisited_content = [
@@ -592,7 +746,7 @@ class Director:
             except Exception:
                 return None
 
-            self._last_generation["region"] = context.turn_number
+            self._cooldowns(context.game_id).region = context.turn_number
             return {
                 "event_type": "DIRECTOR_REGION_REVEAL",
                 "description": (
@@ -613,8 +767,6 @@ class Director:
         target_max = target_min + 4  # 5-level range
 
         try:
-            from text_rpg.systems.director.generators import generate_region
-
             existing_names = [r.get("name", r_id) for r_id, r in all_regions.items()]
             region_data = generate_region(
                 self.llm, context, current_region,
@@ -637,7 +789,7 @@ class Director:
             if i > 0:
                 prev_loc = locations[i - 1]
                 loc.setdefault("connections", [])
-            location_repo.save(_serialize_location(loc))
+            location_repo.save(_serialize("location", loc, copy=True))
 
         # Create inter-location connections within the region
         conn_repo = repos.get("connection")
@@ -677,23 +829,21 @@ class Director:
             # Place NPC at a location in the region
             if locations:
                 # Place at town/settlement or first location
-                town_locs = [l for l in locations if l.get("location_type") in ("town", "village", "settlement", "tavern", "shop")]
+                town_locs = [l for l in locations if l.get("location_type") in triggers.SETTLEMENT_TYPES]
                 target_loc = town_locs[0] if town_locs else locations[0]
                 npc["location_id"] = target_loc["id"]
             if entity_repo:
-                entity_repo.save(_serialize_entity(npc))
+                entity_repo.save(_serialize("entity", npc))
 
         # Index to RAG
-        try:
-            self.indexer.index_lore(
-                f"New region discovered: {region_data['name']} — {region_data.get('description', '')}",
-                category="location",
-                tags={"game_id": context.game_id, "region_id": region_id},
-            )
-        except Exception:
-            pass
+        self._safe_index(
+            "lore",
+            f"New region discovered: {region_data['name']} — {region_data.get('description', '')}",
+            category="location",
+            tags={"game_id": context.game_id, "region_id": region_id},
+        )
 
-        self._last_generation["region"] = context.turn_number
+        self._cooldowns(context.game_id).region = context.turn_number
         return {
             "event_type": "DIRECTOR_REGION_REVEAL",
             "description": (
@@ -716,9 +866,6 @@ class Director:
         self, context: GameContext, repos: dict[str, Any]
     ) -> list[dict]:
         """Check and resolve faction goal outcomes."""
-        from text_rpg.content.loader import load_all_factions
-        from text_rpg.mechanics.faction_goals import apply_goal_effects, check_faction_goals
-
         try:
             factions = load_all_factions()
             events = check_faction_goals(factions, context.turn_number)
@@ -730,16 +877,14 @@ class Director:
                     apply_goal_effects(effects, context.game_id, repos)
 
                 # Index to RAG
-                try:
-                    self.indexer.index_event(
-                        context.game_id,
-                        "FACTION_GOAL",
-                        event.get("description", ""),
-                        location_id=context.location.get("id"),
-                        turn_number=context.turn_number,
-                    )
-                except Exception:
-                    pass
+                self._safe_index(
+                    "event",
+                    context.game_id,
+                    "FACTION_GOAL",
+                    event.get("description", ""),
+                    location_id=context.location.get("id"),
+                    turn_number=context.turn_number,
+                )
 
             return events
         except Exception as e:
@@ -750,9 +895,6 @@ class Director:
         self, context: GameContext, repos: dict[str, Any]
     ) -> list[dict]:
         """Check and trigger random world events."""
-        from text_rpg.content.loader import load_world_events
-        from text_rpg.mechanics.faction_goals import check_world_events
-
         try:
             events_pool = load_world_events()
             if not events_pool:
@@ -761,26 +903,21 @@ class Director:
             loc_type = context.location.get("location_type", "wilderness")
 
             # Get cooldowns from DB
-            cooldowns: dict[str, int] = {}
-            for event in events_pool:
-                eid = event.get("id", "")
-                if eid:
-                    last = repos["world_state"].get_event_cooldown(context.game_id, eid)
-                    if last:
-                        cooldowns[eid] = last
+            eids = [e["id"] for e in events_pool if e.get("id")]
+            cooldowns = repos["world_state"].get_event_cooldowns(context.game_id, eids)
 
             triggered = check_world_events(
                 events_pool, context.turn_number, context.world_time, loc_type, cooldowns
             )
 
+            # Save cooldowns
+            repos["world_state"].set_event_cooldowns(
+                context.game_id, [e.get("id", "") for e in triggered], context.turn_number
+            )
+
             result_events: list[dict] = []
             for event in triggered:
                 eid = event.get("id", "")
-                # Save cooldown
-                repos["world_state"].set_event_cooldown(
-                    context.game_id, eid, context.turn_number
-                )
-
                 result_events.append({
                     "event_type": "WORLD_EVENT",
                     "description": event.get("narrator_hint", event.get("description", "")),
@@ -805,24 +942,23 @@ class Director:
         - Advances existing stories when beat triggers are met
         - Max 2 concurrent active stories
         """
-        from text_rpg.mechanics.story_seeds import (
-            check_beat_trigger,
-            get_narrator_hints,
-            load_all_seeds,
-            next_beat,
-            resolve_variables,
-            select_seed,
-        )
-
         events: list[dict] = []
+        game_id = context.game_id
+        turn_no = context.turn_number
+        char_level = context.character.get("level", 1)
+        actor_id = context.character.get("id")
+        loc_id = context.location.get("id")
 
         try:
-            active_stories = repos["world_state"].get_active_stories(context.game_id)
-            completed_ids = repos["world_state"].get_completed_story_ids(context.game_id)
+            story_ctx = repos["world_state"].get_story_context(game_id)
+            active_stories = story_ctx.active_stories
+            completed_ids = story_ctx.completed_story_ids
+            completed_quest_ids = story_ctx.completed_quest_ids
             all_seeds = load_all_seeds()
-            seed_map = {s["id"]: s for s in all_seeds}
+            seed_map = load_seed_map()
 
-            # -- Advance existing stories --
+            # -- Decide which existing stories advance --
+            advancing: list[tuple[dict, dict, str, dict]] = []
             for story in active_stories:
                 seed_id = story.get("seed_id", "")
                 seed = seed_map.get(seed_id)
@@ -838,161 +974,182 @@ class Director:
                 if not beat_def:
                     continue
 
-                # Build game state for trigger check
-                completed_quest_ids = []
-                for q in repos["world_state"].get_all_quests(context.game_id):
-                    if q.get("status") == "completed":
-                        completed_quest_ids.append(q["id"])
-
-                game_state = {
-                    "turn_number": context.turn_number,
-                    "character_level": context.character.get("level", 1),
-                    "completed_quest_ids": completed_quest_ids,
-                }
-
-                story_state = {
-                    "current_beat": current_beat,
-                    "beat_turn_numbers": story.get("beat_turn_numbers") or {},
-                    "quest_ids": story.get("quest_ids") or [],
-                }
-
-                if check_beat_trigger(beat_def, story_state, game_state):
-                    # Advance to next beat
-                    activated = safe_json(story.get("activated_beats"), [])
-                    activated.append(nxt)
-
-                    quest_ids = safe_json(story.get("quest_ids"), [])
-
-                    beat_turns = safe_json(story.get("beat_turn_numbers"), {})
-                    beat_turns[nxt] = context.turn_number
-
-                    # Generate a quest for this beat if it has a template
-                    quest_template = beat_def.get("quest_template")
-                    if quest_template:
-                        quest_event = self._generate_story_quest(
-                            seed, nxt, story, quest_template, context, repos
-                        )
-                        if quest_event:
-                            quest_id = quest_event.get("target_id", "")
-                            if quest_id:
-                                quest_ids.append(quest_id)
-                            events.append(quest_event)
-
-                    repos["world_state"].update_story_beat(
-                        context.game_id, seed_id, nxt, activated, quest_ids,
-                    )
-
-                    # Update beat_turn_numbers in story data
-                    story_data = repos["world_state"].get_story_state(context.game_id, seed_id)
-                    if story_data:
-                        data = safe_json(story_data.get("data"), {})
-                        data["beat_turn_numbers"] = beat_turns
-                        repos["world_state"].save_story_state({
-                            **story_data,
-                            "beat_turn_numbers": beat_turns,
-                        })
-
-                    seed_name = seed.get("name", seed_id)
-                    events.append({
-                        "event_type": "STORY_BEAT",
-                        "description": f"Story '{seed_name}' advances to {nxt}.",
-                        "actor_id": context.character.get("id"),
-                        "location_id": context.location.get("id"),
-                        "mechanical_details": {
-                            "story_name": seed_name,
-                            "beat_name": nxt,
-                            "seed_id": seed_id,
-                        },
-                    })
-
-            # -- Activate new stories --
-            if len(active_stories) < 2 and context.turn_number >= 5:
+                trigger_state = TriggerState(
+                    turn_number=turn_no,
+                    character_level=char_level,
+                    completed_quest_ids=completed_quest_ids,
+                    current_beat=current_beat,
+                    beat_turn_numbers=story.get("beat_turn_numbers") or {},
+                    quest_ids=story.get("quest_ids") or [],
+                )
+
+                if check_beat_trigger(beat_def, trigger_state):
+                    advancing.append((story, seed, nxt, beat_def))
+
+            # -- Decide whether a new story activates --
+            selected: dict | None = None
+            variables: dict[str, str] = {}
+            if len(active_stories) < 2 and turn_no >= 5:
                 # Check cooldown: don't activate too often
-                last_activation = self._last_generation.get("story", -999)
-                if (context.turn_number - last_activation) >= 15:
+                last_activation = self._cooldowns(game_id).story
+                completed_set = frozenset(completed_ids)
+                if (turn_no - last_activation) >= 15 and eligible_seed_ids(completed_set, char_level):
                     active_tags = []
                     for s in active_stories:
                         sid = s.get("seed_id", "")
                         sd = seed_map.get(sid, {})
                         active_tags.extend(sd.get("tags", []))
 
-                    game_state = {
-                        "turn_number": context.turn_number,
-                        "character_level": context.character.get("level", 1),
-                    }
+                    game_state = {"turn_number": turn_no, "character_level": char_level}
 
-                    selected = select_seed(all_seeds, game_state, completed_ids, active_tags)
+                    selected = select_seed(all_seeds, game_state, completed_set, active_tags)
                     if selected:
                         variables = resolve_variables(selected, context)
-                        story_id = f"{context.game_id}_{selected['id']}"
-
-                        repos["world_state"].save_story_state({
-                            "id": story_id,
-                            "game_id": context.game_id,
-                            "seed_id": selected["id"],
-                            "status": "active",
-                            "current_beat": "hook",
-                            "resolved_variables": variables,
-                            "activated_beats": ["hook"],
-                            "beat_turn_numbers": {"hook": context.turn_number},
-                            "quest_ids": [],
-                            "data": {},
-                        })
-
-                        # Generate hook quest if template exists
-                        hook = selected.get("hook", {})
-                        quest_template = hook.get("quest_template")
-                        if quest_template:
-                            quest_event = self._generate_story_quest(
-                                selected, "hook",
-                                {"resolved_variables": variables, "seed_id": selected["id"]},
-                                quest_template, context, repos,
-                            )
-                            if quest_event:
-                                quest_id = quest_event.get("target_id", "")
-                                if quest_id:
-                                    repos["world_state"].update_story_beat(
-                                        context.game_id, selected["id"],
-                                        "hook", ["hook"], [quest_id],
-                                    )
-                                events.append(quest_event)
-
-                        self._last_generation["story"] = context.turn_number
-
-                        seed_name = selected.get("name", selected["id"])
-                        events.append({
-                            "event_type": "STORY_BEAT",
-                            "description": f"A new story begins: '{seed_name}'.",
-                            "actor_id": context.character.get("id"),
-                            "location_id": context.location.get("id"),
-                            "mechanical_details": {
-                                "story_name": seed_name,
-                                "beat_name": "hook",
-                                "seed_id": selected["id"],
-                            },
-                        })
+
+            # -- Generate every story quest needed this turn in one batch --
+            jobs: list[tuple[dict, str, dict, dict]] = []
+            for story, seed, nxt, beat_def in advancing:
+                quest_template = beat_def.get("quest_template")
+                if quest_template:
+                    jobs.append((seed, nxt, story, quest_template))
+            hook_template = selected.get("hook", {}).get("quest_template") if selected else None
+            if selected and hook_template:
+                jobs.append((
+                    selected, "hook",
+                    {"resolved_variables": variables, "seed_id": selected["id"]},
+                    hook_template,
+                ))
+            quest_events = iter(self._generate_story_quests(jobs, context, repos))
+
+            # -- Commit advances --
+            for story, seed, nxt, beat_def in advancing:
+                # Rows from get_active_stories are already decoded — build the
+                # new values straight from them, no re-read or re-parse.
+                seed_id = story.get("seed_id", "")
+                activated = [*(story.get("activated_beats") or []), nxt]
+                quest_ids = list(story.get("quest_ids") or [])
+                beat_turns = {**(story.get("beat_turn_numbers") or {}), nxt: turn_no}
+
+                if beat_def.get("quest_template"):
+                    quest_event = next(quest_events)
+                    if quest_event:
+                        quest_id = quest_event.get("target_id", "")
+                        if quest_id:
+                            quest_ids.append(quest_id)
+                        events.append(quest_event)
+
+                repos["world_state"].advance_beat_tx(
+                    game_id, seed_id, nxt, activated, quest_ids, beat_turns,
+                )
+
+                seed_name = seed.get("name", seed_id)
+                events.append({
+                    "event_type": "STORY_BEAT",
+                    "description": f"Story '{seed_name}' advances to {nxt}.",
+                    "actor_id": actor_id,
+                    "location_id": loc_id,
+                    "mechanical_details": {
+                        "story_name": seed_name,
+                        "beat_name": nxt,
+                        "seed_id": seed_id,
+                    },
+                })
+
+            # -- Commit activation --
+            if selected:
+                story_id = f"{game_id}_{selected['id']}"
+
+                quest_ids_list: list[str] = []
+                if hook_template:
+                    quest_event = next(quest_events)
+                    if quest_event:
+                        quest_id = quest_event.get("target_id", "")
+                        if quest_id:
+                            quest_ids_list.append(quest_id)
+                        events.append(quest_event)
+
+                repos["world_state"].save_story_state({
+                    "id": story_id,
+                    "game_id": game_id,
+                    "seed_id": selected["id"],
+                    "status": "active",
+                    "current_beat": "hook",
+                    "resolved_variables": variables,
+                    "activated_beats": ["hook"],
+                    "beat_turn_numbers": {"hook": turn_no},
+                    "quest_ids": quest_ids_list,
+                    "data": {},
+                })
+
+                self._cooldowns(game_id).story = turn_no
+
+                seed_name = selected.get("name", selected["id"])
+                events.append({
+                    "event_type": "STORY_BEAT",
+                    "description": f"A new story begins: '{seed_name}'.",
+                    "actor_id": actor_id,
+                    "location_id": loc_id,
+                    "mechanical_details": {
+                        "story_name": seed_name,
+                        "beat_name": "hook",
+                        "seed_id": selected["id"],
+                    },
+                })
 
         except Exception as e:
             logger.warning(f"Story progression check failed: {e}")
 
         return events
 
-    def _generate_story_quest(
+    def _generate_story_quests(
+        self,
+        jobs: list[tuple[dict, str, dict, dict]],
+        context: GameContext,
+        repos: dict[str, Any],
+    ) -> list[dict | None]:
+        """Generate and save quests for several story beats.
+
+        Each job is (seed, beat_name, story, quest_template). The LLM calls are
+        independent, so when there is more than one they run concurrently on
+        the background pool and are batched into a single LLM request; saving
+        happens afterwards on this thread. Returns
+        one event (or None on failure) per job, in order.
+        """
+        givers = [self._story_quest_giver(*job, context) for job in jobs]
+        if len(jobs) > 1:
+            futures = [
+                self._background_pool.submit(generate_quest, self._batch_llm, context, npc)
+                for npc, _ in givers
+            ]
+            calls = [f.result for f in futures]
+        else:
+            calls = [lambda npc=npc: generate_quest(self.llm, context, npc) for npc, _ in givers]
+
+        results: list[dict | None] = []
+        for (npc, report_to_name), call in zip(givers, calls):
+            try:
+                quest_data = call()
+            except Exception as e:
+                logger.warning(f"Story quest generation failed: {e}")
+                results.append(None)
+                continue
+            results.append(self._save_story_quest(quest_data, npc["id"], report_to_name, context, repos))
+        return results
+
+    def _story_quest_giver(
         self,
         seed: dict,
         beat_name: str,
         story: dict,
         quest_template: dict,
         context: GameContext,
-        repos: dict[str, Any],
-    ) -> dict | None:
-        """Generate a quest from a story beat's quest_template."""
-        from text_rpg.mechanics.story_seeds import fill_template
-        from text_rpg.systems.director.generators import generate_quest
+    ) -> tuple[dict, str]:
+        """Build the synthetic quest-giver NPC for a story beat.
 
+        Returns (npc_dict, report_to_name).
+        """
         variables = safe_json(story.get("resolved_variables"), {})
 
-        # Build a synthetic NPC for quest generation
         quest_type = quest_template.get("type", "investigate")
         target = quest_template.get("target", "")
         report_to = quest_template.get("report_to", "")
@@ -1007,44 +1164,44 @@ class Director:
         # Find an NPC to be the quest giver
         quest_giver_id = variables.get(f"{report_to}_id", "")
         if not quest_giver_id:
-            # Find first available NPC
-            for e in context.entities:
-                if e.get("entity_type") == "npc" and e.get("is_alive", True):
-                    quest_giver_id = e.get("id", "")
-                    break
-
-        try:
-            # Use Director's quest generator with story context
-            quest_data = generate_quest(self.llm, context, {
-                "name": report_to_name,
-                "description": f"Quest giver for {seed_name}",
-                "id": quest_giver_id,
-                "dialogue_tags": ["concerned", "urgent"],
-                "properties": json.dumps({
-                    "motivation": beat_desc,
-                    "quest_hook": f"A {quest_type} task related to {target_name}. {seed.get('description_template', '')}",
-                }),
-            })
-        except Exception as e:
-            logger.warning(f"Story quest generation failed: {e}")
-            return None
+            # Fall back to the first alive NPC at the location
+            quest_giver_id = context.alive_npcs[0].get("id", "") if context.alive_npcs else ""
+
+        npc = {
+            "name": report_to_name,
+            "description": f"Quest giver for {seed_name}",
+            "id": quest_giver_id,
+            "dialogue_tags": ["concerned", "urgent"],
+            "properties": to_json_str({
+                "motivation": beat_desc,
+                "quest_hook": f"A {quest_type} task related to {target_name}. {seed.get('description_template', '')}",
+            }),
+        }
+        return npc, report_to_name
 
+    def _save_story_quest(
+        self,
+        quest_data: dict,
+        quest_giver_id: str,
+        report_to_name: str,
+        context: GameContext,
+        repos: dict[str, Any],
+    ) -> dict:
+        """Persist a generated story quest and return its event."""
         quest_data["game_id"] = context.game_id
         quest_data["quest_giver_id"] = quest_giver_id
 
-        repos["world_state"].save_quest(_serialize_quest(quest_data))
+        repos["world_state"].save_quest(_serialize("quest", quest_data))
 
         # Index to RAG
-        try:
-            self.indexer.index_lore(
-                f"Story quest: {quest_data['name']} — {quest_data.get('description', '')}",
-                category="quest",
-                tags={"game_id": context.game_id, "quest_id": quest_data["id"]},
-            )
-        except Exception:
-            pass
+        self._safe_index(
+            "lore",
+            f"Story quest: {quest_data['name']} — {quest_data.get('description', '')}",
+            category="quest",
+            tags={"game_id": context.game_id, "quest_id": quest_data["id"]},
+        )
 
-        self._last_generation["quest"] = context.turn_number
+        self._cooldowns(context.game_id).quest = context.turn_number
         return {
             "event_type": "DIRECTOR_QUEST_AVAILABLE",
             "description": f"A new quest emerges from the story: {quest_data.get('name', '')}",
@@ -1060,25 +1217,57 @@ class Director:
     def _populate_new_location(
         self, location_data: dict, context: GameContext, repos: dict[str, Any]
     ) -> None:
-        """Optionally add 0-1 NPCs to a newly generated location."""
+        """Optionally add 0-1 NPCs to a newly generated location.
+
+        The LLM call is submitted to the background pool so it does not block
+        the current turn, batched with any other pending background calls;
+        the NPC is saved by _collect_background_npcs.
+        """
         loc_type = location_data.get("location_type", "wilderness")
         # Towns/settlements are more likely to have NPCs
-        if loc_type in ("town", "village", "settlement", "tavern", "shop"):
-            from text_rpg.systems.director.generators import generate_npc
+        if loc_type in triggers.SETTLEMENT_TYPES:
+            loc_id = location_data["id"]
+            if loc_id in self._pending_npcs:
+                return
+            future = self._background_pool.submit(
+                generate_npc, self._batch_llm, context, location_data, {},
+            )
+            self._pending_npcs[loc_id] = (future, location_data)
+
+    def _collect_background_npcs(
+        self, context: GameContext, repos: dict[str, Any]
+    ) -> set[str]:
+        """Save NPCs whose background generation has completed.
+
+        Returns the location ids that got an NPC just now or are still
+        waiting for one — the turn's context was built without those NPCs,
+        so the spawn trigger must not fire there.
+        """
+        if not self._pending_npcs:
+            return set()
+        done = [lid for lid, (f, _) in self._pending_npcs.items() if f.done()]
+        populated = set(self._pending_npcs) - set(done)
+        for loc_id in done:
+            future, location_data = self._pending_npcs.pop(loc_id)
             try:
-                npc_data = generate_npc(
-                    self.llm, context, location_data, {},
-                )
+                npc_data = future.result()
                 npc_data = _scale_npc_to_player(npc_data, context)
-                npc_data["game_id"] = context.game_id
-                npc_data["location_id"] = location_data["id"]
-                repos["entity"].save(_serialize_entity(npc_data))
+                npc_data["game_id"] = location_data.get("game_id", context.game_id)
+                npc_data["location_id"] = loc_id
+                repos["entity"].save(_serialize("entity", npc_data))
             except Exception as e:
                 logger.debug(f"Failed to populate new location with NPC: {e}")
+                continue
+            populated.add(loc_id)
+        return populated
 
 
 # -- NPC scaling --
 
+# 2% of the 32-bit range — compared against getrandbits(32) to avoid a float draw
+_RARE_SPAWN_THRESHOLD = int(0.02 * (1 << 32))
+
+
 def _scale_npc_to_player(npc_data: dict, context: GameContext) -> dict:
     """Scale a Director-spawned NPC's level to player_level ± 2, clamped to region range.
 
@@ -1087,23 +1276,25 @@ def _scale_npc_to_player(npc_data: dict, context: GameContext) -> dict:
     Rare event (2%): a vastly overpowered mob spawns (e.g., dragon attack)
     ignoring the normal scaling — creates dangerous surprise encounters.
     """
-    import random
-
     player_level = context.character.get("level", 1)
     region_id = context.location.get("region_id", "")
+    old_level = npc_data.get("level", 1)
+    hp_max = npc_data.get("hp_max", 10)
+    ac = npc_data.get("ac", 10)
 
     # Rare event: 2% chance to spawn a vastly overpowered mob
-    if random.random() < 0.02:
-        rare_level = max(player_level + 5, 10)
+    if random.getrandbits(32) < _RARE_SPAWN_THRESHOLD:
+        rare_level = player_level + 5 if player_level + 5 > 10 else 10
+        rare_hp = rare_level * 8
+        hp_max = hp_max if hp_max > rare_hp else rare_hp
+        rare_ac = 14 + rare_level // 4
+        ac = ac if ac > rare_ac else rare_ac
         npc_data["level"] = rare_level
-        npc_data["hp_max"] = max(npc_data.get("hp_max", 10), rare_level * 8)
-        npc_data["hp_current"] = npc_data["hp_max"]
-        npc_data["ac"] = min(20, max(npc_data.get("ac", 10), 14 + rare_level // 4))
+        npc_data["hp_max"] = hp_max
+        npc_data["hp_current"] = hp_max
+        npc_data["ac"] = ac if ac < 20 else 20
         npc_data["is_hostile"] = True
-        npc_data.setdefault("properties", {})
-        if isinstance(npc_data["properties"], str):
-            import json
-            npc_data["properties"] = json.loads(npc_data["properties"]) if npc_data["properties"] else {}
+        npc_data["properties"] = safe_json(npc_data.get("properties"), {})
         npc_data["properties"]["rare_spawn"] = True
         return npc_data
 
@@ -1111,7 +1302,6 @@ def _scale_npc_to_player(npc_data: dict, context: GameContext) -> dict:
     region_min, region_max = 1, 20
     if region_id:
         try:
-            from text_rpg.content.loader import load_region
             region_data = load_region(region_id)
             region_min = region_data.get("level_range_min", 1)
             region_max = region_data.get("level_range_max", 20)
@@ -1119,69 +1309,75 @@ def _scale_npc_to_player(npc_data: dict, context: GameContext) -> dict:
             pass
 
     # Target level: player ± 2, clamped to region range
-    target_min = max(region_min, player_level - 2)
-    target_max = min(region_max, player_level + 2)
+    low, high = player_level - 2, player_level + 2
+    target_min = region_min if region_min > low else low
+    target_max = region_max if region_max < high else high
     # Handle edge case where player is above/below region range
     if target_min > target_max:
         target_level = target_max if player_level > region_max else target_min
     else:
         target_level = random.randint(target_min, target_max)
 
-    old_level = npc_data.get("level", 1)
     npc_data["level"] = target_level
 
     # Scale HP proportionally if level changed significantly
     if old_level > 0 and target_level != old_level:
-        ratio = target_level / old_level
-        old_hp = npc_data.get("hp_max", 10)
-        new_hp = max(4, round(old_hp * ratio))
+        new_hp, new_ac = _scale_kernel(old_level, target_level, hp_max, ac)
         npc_data["hp_max"] = new_hp
         npc_data["hp_current"] = new_hp
-
-        # Slight AC adjustment for higher levels
-        base_ac = npc_data.get("ac", 10)
-        ac_bonus = max(0, (target_level - old_level) // 3)
-        npc_data["ac"] = min(20, base_ac + ac_bonus)
+        npc_data["ac"] = new_ac
 
     return npc_data
 
 
+def _scale_kernel(old_level: int, target_level: int, old_hp: int, base_ac: int) -> tuple[int, int]:
+    """Pure integer core of NPC scaling — returns (new_hp, new_ac).
+
+    HP scales by the level ratio (minimum 4); AC gains +1 per 3 levels
+    gained, capped at 20.
+    """
+    new_hp = round(old_hp * (target_level / old_level))
+    new_hp = new_hp if new_hp > 4 else 4
+
+    # Slight AC adjustment for higher levels
+    ac_bonus = (target_level - old_level) // 3
+    new_ac = base_ac + ac_bonus if ac_bonus > 0 else base_ac
+    return new_hp, (new_ac if new_ac < 20 else 20)
+
+
 # -- Serialization helpers --
 
-def _serialize_entity(data: dict) -> dict:
-    """Prepare entity dict for DB storage."""
-    out = dict(data)
-    for field in ("ability_scores", "attacks", "behaviors", "dialogue_tags", "loot_table", "properties"):
-        if field in out and out[field] is not None and not isinstance(out[field], str):
-            out[field] = json.dumps(out[field])
-    return out
+# Fields stored as JSON text, per record kind
+_JSON_FIELDS: dict[str, tuple[str, ...]] = {
+    "entity": ("ability_scores", "attacks", "behaviors", "dialogue_tags", "loot_table", "properties"),
+    "location": ("connections", "entities", "items", "properties"),
+    "quest": ("objectives", "item_rewards"),
+}
 
+_REVERSE_DIR: dict[str, str] = {
+    "north": "south", "south": "north",
+    "east": "west", "west": "east",
+    "northeast": "southwest", "southwest": "northeast",
+    "northwest": "southeast", "southeast": "northwest",
+    "up": "down", "down": "up",
+}
 
-def _serialize_location(data: dict) -> dict:
-    """Prepare location dict for DB storage."""
-    out = dict(data)
-    for field in ("connections", "entities", "items", "properties"):
-        if field in out and out[field] is not None and not isinstance(out[field], str):
-            out[field] = json.dumps(out[field])
-    return out
 
+def _serialize(kind: str, data: dict, *, copy: bool = False) -> dict:
+    """Encode a *kind* record's JSON fields for DB storage.
 
-def _serialize_quest(data: dict) -> dict:
-    """Prepare quest dict for DB storage."""
-    out = dict(data)
-    for field in ("objectives", "item_rewards"):
-        if field in out and out[field] is not None and not isinstance(out[field], str):
-            out[field] = json.dumps(out[field])
+    Mutates and returns *data* unless copy=True. Only mutate dicts the
+    caller owns and doesn't reuse afterwards.
+    """
+    out = dict(data) if copy else data
+    for field in _JSON_FIELDS[kind]:
+        value = out.get(field)
+        if value is not None and not isinstance(value, str):
+            out[field] = to_json_str(value)
     return out
 
 
 def _reverse_direction(direction: str) -> str:
     """Return the opposite compass direction."""
-    opposites = {
-        "north": "south", "south": "north",
-        "east": "west", "west": "east",
-        "northeast": "southwest", "southwest": "northeast",
-        "northwest": "southeast", "southeast": "northwest",
-        "up": "down", "down": "up",
-    }
-    return opposites.get(direction.lower(), "back")
+    # Directions almost always arrive lowercase already — skip the copy
+    return _REVERSE_DIR.get(direction if direction.islower() else direction.lower(), "back")
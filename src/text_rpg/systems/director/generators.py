@@ -1,16 +1,19 @@
 """LLM-powered content generators for the Director."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 import math
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from text_rpg.llm.provider import LLMProvider
 from text_rpg.systems.base import GameContext
+from text_rpg.systems.director.cache import semantic_cache
 from text_rpg.systems.director.schemas import (
     validate_location,
     validate_npc,
@@ -18,7 +21,8 @@ from text_rpg.systems.director.schemas import (
     validate_quest,
     validate_spell_proposal,
 )
-from text_rpg.utils import safe_json, safe_props
+from text_rpg.systems.director.triggers import SETTLEMENT_TYPES
+from text_rpg.utils import json_view, safe_json, safe_props
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +40,47 @@ def _get_jinja() -> Environment:
     return _jinja_env
 
 
+@functools.lru_cache(maxsize=None)
+def _tpl(name: str) -> Template:
+    """Compiled template, fetched once — skips the loader's per-call up-to-date check."""
+    return _get_jinja().get_template(name)
+
+
+_NPC_TPL = _tpl("director/npc_generation.j2")
+_LOCATION_TPL = _tpl("director/location_generation.j2")
+_QUEST_TPL = _tpl("director/quest_generation.j2")
+_REGION_TPL = _tpl("director/region_generation.j2")
+_PLAUSIBILITY_TPL = _tpl("director/plausibility_check.j2")
+_CREATIVE_SOLUTION_TPL = _tpl("director/evaluate_creative_solution.j2")
+_NEGOTIATE_TPL = _tpl("director/negotiate_quest.j2")
+_SPELL_TPL = _tpl("director/spell_evaluation.j2")
+
+
+def _render_split(template: Template, **variables: Any) -> tuple[str, str]:
+    """Render a prompt template as (system, prompt).
+
+    Director templates put their role line, instructions and JSON schema in a
+    ``cached`` block that never references a variable, so the system prompt is
+    byte-identical across calls and the provider can reuse its prefix cache.
+    Everything that varies per call lives in the ``dynamic`` block, which is
+    the only part rendered per call; the system prompt is rendered once.
+    """
+    ctx = template.new_context(variables)
+    prompt = "".join(template.blocks["dynamic"](ctx)).strip()
+    return _system_prompt(template), prompt
+
+
+@functools.lru_cache(maxsize=None)
+def _system_prompt(template: Template) -> str:
+    """The variable-free ``cached`` block, rendered once per template."""
+    return "".join(template.blocks["cached"](template.new_context())).strip()
+
+
 # -- Context formatters (concise summaries for LLM prompts) --
 
 def _format_character(char: dict) -> str:
-    scores = safe_json(char.get("ability_scores"), {})
-    profs = safe_json(char.get("skill_proficiencies"), [])
+    scores = json_view(char.get("ability_scores"), {})
+    profs = json_view(char.get("skill_proficiencies"), [])
     return (
         f"{char.get('name', 'Unknown')} — Level {char.get('level', 1)} "
         f"{char.get('race', '?')} {char.get('char_class', '?')}\n"
@@ -52,11 +92,19 @@ def _format_character(char: dict) -> str:
     )
 
 
+def _format_exits(connections: list) -> str:
+    return ", ".join(c.get("direction", "?") for c in connections if isinstance(c, dict))
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_exits_json(raw: str) -> str:
+    """Exits from a DB-stored connections string, parsed once per distinct JSON."""
+    return _format_exits(safe_json(raw, []))
+
+
 def _format_location(loc: dict) -> str:
-    connections = safe_json(loc.get("connections"), [])
-    exits = ", ".join(
-        c.get("direction", "?") for c in connections if isinstance(c, dict)
-    )
+    raw = loc.get("connections")
+    exits = _format_exits_json(raw) if isinstance(raw, str) else _format_exits(safe_json(raw, []))
     return (
         f"{loc.get('name', 'Unknown')} ({loc.get('location_type', 'unknown')})\n"
         f"{loc.get('description', 'No description.')}\n"
@@ -67,30 +115,28 @@ def _format_location(loc: dict) -> str:
 def _format_entities(entities: list[dict]) -> str:
     if not entities:
         return "None present."
-    parts = []
-    for e in entities:
-        if e.get("is_alive", True):
-            parts.append(f"- {e['name']}: {e.get('description', 'No description.')[:100]}")
-    return "\n".join(parts) if parts else "None present."
+    body = "\n".join(
+        f"- {e['name']}: {e.get('description', 'No description.')[:100]}"
+        for e in entities if e.get("is_alive", True)
+    )
+    return body or "None present."
 
 
 def _format_recent_events(events: list[dict]) -> str:
     if not events:
         return "Nothing notable has happened recently."
-    parts = []
-    for e in events[:5]:
-        parts.append(f"- [{e.get('event_type', '?')}] {e.get('description', '')[:100]}")
-    return "\n".join(parts)
+    return "\n".join(
+        f"- [{e.get('event_type', '?')}] {e.get('description', '')[:100]}" for e in events[:5]
+    )
 
 
 def _format_inventory(inventory: dict | None) -> str:
     if not inventory:
         return "Empty pack."
-    items = safe_json(inventory.get("items"), [])
+    items = json_view(inventory.get("items"), [])
     if not items:
         return "Empty pack."
-    parts = [f"- {i.get('item_id', '?')} x{i.get('quantity', 1)}" for i in items[:10]]
-    return "\n".join(parts)
+    return "\n".join(f"- {i.get('item_id', '?')} x{i.get('quantity', 1)}" for i in items[:10])
 
 
 # -- Generators --
@@ -102,31 +148,36 @@ def generate_npc(
     constraints: dict,
 ) -> dict:
     """Generate a new NPC fitting the given location. Returns validated NPC dict."""
-    env = _get_jinja()
-    template = env.get_template("director/npc_generation.j2")
-
-    existing_npcs = _format_entities(context.entities)
-
-    prompt = template.render(
+    system, prompt = _render_split(
+        _NPC_TPL,
         location_summary=_format_location(location),
         location_type=location.get("location_type", "wilderness"),
         region_name=location.get("region_id", "unknown"),
         character_summary=_format_character(context.character),
-        existing_npcs=existing_npcs,
+        existing_npcs=_format_entities(context.entities),
         world_context=_format_recent_events(context.recent_events),
     )
-
-    raw = llm.generate_structured(prompt, temperature=0.9, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.9, max_tokens=512)
     npc_data = validate_npc(raw)
 
     # Assign faction based on location type / region
     loc_type = location.get("location_type", "wilderness")
     region = location.get("region_id", "unknown")
-    if loc_type in ("town", "village", "settlement", "tavern", "shop"):
+    if loc_type in SETTLEMENT_TYPES:
         npc_data.setdefault("faction_id", f"{region}_guard" if npc_data.get("is_hostile") else f"{region}_merchants")
     return npc_data
 
 
+async def agenerate_npc(
+    llm: LLMProvider,
+    context: GameContext,
+    location: dict,
+    constraints: dict,
+) -> dict:
+    """Async generate_npc — lets callers overlap several generations with asyncio.gather."""
+    return await asyncio.to_thread(generate_npc, llm, context, location, constraints)
+
+
 def generate_location(
     llm: LLMProvider,
     context: GameContext,
@@ -134,9 +185,6 @@ def generate_location(
     source_location: dict,
 ) -> dict:
     """Generate a new location in a given direction. Returns validated location dict."""
-    env = _get_jinja()
-    template = env.get_template("director/location_generation.j2")
-
     # Build list of existing locations from connections
     connections = safe_json(source_location.get("connections"), [])
     existing = ", ".join(
@@ -146,30 +194,37 @@ def generate_location(
 
     props = safe_props(source_location)
 
-    prompt = template.render(
+    system, prompt = _render_split(
+        _LOCATION_TPL,
         source_location_summary=_format_location(source_location),
         direction=direction,
         region_description=props.get("region_description", source_location.get("description", "")),
         player_level=context.character.get("level", 1),
         existing_locations=existing if existing else "None known nearby.",
     )
-
-    raw = llm.generate_structured(prompt, temperature=0.9, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.9, max_tokens=512)
     return validate_location(raw)
 
 
+async def agenerate_location(
+    llm: LLMProvider,
+    context: GameContext,
+    direction: str,
+    source_location: dict,
+) -> dict:
+    """Async generate_location."""
+    return await asyncio.to_thread(generate_location, llm, context, direction, source_location)
+
+
 def generate_quest(
     llm: LLMProvider,
     context: GameContext,
     npc: dict,
 ) -> dict:
     """Generate a quest from an NPC's motivation. Returns validated quest dict."""
-    env = _get_jinja()
-    template = env.get_template("director/quest_generation.j2")
-
     props = safe_props(npc)
-
-    prompt = template.render(
+    system, prompt = _render_split(
+        _QUEST_TPL,
         npc_name=npc.get("name", "Unknown"),
         npc_description=npc.get("description", ""),
         npc_personality=", ".join(npc.get("dialogue_tags") or []),
@@ -179,22 +234,28 @@ def generate_quest(
         location_summary=_format_location(context.location),
         recent_events_summary=_format_recent_events(context.recent_events),
     )
-
-    raw = llm.generate_structured(prompt, temperature=0.8, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.8, max_tokens=512)
     return validate_quest(raw)
 
 
+async def agenerate_quest(
+    llm: LLMProvider,
+    context: GameContext,
+    npc: dict,
+) -> dict:
+    """Async generate_quest."""
+    return await asyncio.to_thread(generate_quest, llm, context, npc)
+
+
 def generate_follow_up_quest(
     llm: LLMProvider,
     context: GameContext,
     completed_quest: dict,
 ) -> dict:
     """Generate a follow-up quest after completion. Returns validated quest dict."""
-    env = _get_jinja()
-    template = env.get_template("director/quest_generation.j2")
-
     # Re-use quest_generation template with follow-up context
-    prompt = template.render(
+    system, prompt = _render_split(
+        _QUEST_TPL,
         npc_name="the quest giver",
         npc_description="The person who gave you the previous quest.",
         npc_personality="grateful, thoughtful",
@@ -205,7 +266,7 @@ def generate_follow_up_quest(
         recent_events_summary=_format_recent_events(context.recent_events),
     )
 
-    raw = llm.generate_structured(prompt, temperature=0.8, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.8, max_tokens=512)
     data = validate_quest(raw)
 
     # Track chain depth
@@ -230,10 +291,8 @@ def generate_region(
     """Generate a new region for the player to discover. Returns validated region dict."""
     from text_rpg.systems.director.schemas import validate_region
 
-    env = _get_jinja()
-    template = env.get_template("director/region_generation.j2")
-
-    prompt = template.render(
+    system, prompt = _render_split(
+        _REGION_TPL,
         current_region_name=current_region.get("name", "Unknown"),
         current_level_min=current_region.get("level_range_min", 1),
         current_level_max=current_region.get("level_range_max", 5),
@@ -245,20 +304,31 @@ def generate_region(
         existing_regions=", ".join(existing_region_names) if existing_region_names else "None known",
     )
 
-    raw = llm.generate_structured(prompt, temperature=0.9, max_tokens=1024)
-    return validate_region(raw)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.9, max_tokens=1024)
+    region = validate_region(raw)
+
+    # The model's levels are advisory — missing or off-tier values (which
+    # validate_region defaults to 1-5) fall back to the requested tier
+    if not target_level_min <= region["level_range_min"] <= target_level_max:
+        region["level_range_min"] = target_level_min
+    if not region["level_range_min"] <= region["level_range_max"] <= target_level_max:
+        region["level_range_max"] = target_level_max
+    return region
+
 
+def _plausibility_key(llm: LLMProvider, action_description: str, context: GameContext) -> tuple[str, tuple]:
+    return action_description, (context.location.get("id"), context.character.get("level", 1))
 
+
+@semantic_cache("plausibility_check", _plausibility_key)
 def evaluate_plausibility(
     llm: LLMProvider,
     action_description: str,
     context: GameContext,
 ) -> dict:
     """Evaluate how plausible a creative player action is. Returns validated dict."""
-    env = _get_jinja()
-    template = env.get_template("director/plausibility_check.j2")
-
-    prompt = template.render(
+    system, prompt = _render_split(
+        _PLAUSIBILITY_TPL,
         action_description=action_description,
         character_summary=_format_character(context.character),
         location_summary=_format_location(context.location),
@@ -267,10 +337,17 @@ def evaluate_plausibility(
         inventory_summary=_format_inventory(context.inventory),
     )
 
-    raw = llm.generate_structured(prompt, temperature=0.7, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.7, max_tokens=512)
     return validate_plausibility(raw)
 
 
+def _creative_solution_key(
+    llm: LLMProvider, quest: dict, player_action: str, context: GameContext,
+) -> tuple[str, tuple]:
+    return player_action, (quest.get("id"), context.location.get("id"), context.character.get("level", 1))
+
+
+@semantic_cache("evaluate_creative_solution", _creative_solution_key)
 def evaluate_creative_solution(
     llm: LLMProvider,
     quest: dict,
@@ -278,12 +355,10 @@ def evaluate_creative_solution(
     context: GameContext,
 ) -> dict:
     """Evaluate if a creative approach satisfies a quest."""
-    env = _get_jinja()
-    template = env.get_template("director/evaluate_creative_solution.j2")
-
     objectives = safe_json(quest.get("objectives"), [])
 
-    prompt = template.render(
+    system, prompt = _render_split(
+        _CREATIVE_SOLUTION_TPL,
         quest_name=quest.get("name", "Unknown"),
         quest_description=quest.get("description", ""),
         npc_motivation=quest.get("npc_motivation", "unknown"),
@@ -293,7 +368,7 @@ def evaluate_creative_solution(
         context_summary=_format_location(context.location),
     )
 
-    raw = llm.generate_structured(prompt, temperature=0.7, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.7, max_tokens=512)
 
     # Validate basics
     raw.setdefault("satisfies_quest", False)
@@ -304,6 +379,14 @@ def evaluate_creative_solution(
     return raw
 
 
+def _negotiate_key(
+    llm: LLMProvider, quest: dict, npc: dict, player_proposal: str,
+    check_total: int, check_dc: int, check_success: bool,
+) -> tuple[str, tuple]:
+    return player_proposal, (quest.get("id"), npc.get("id"), check_success)
+
+
+@semantic_cache("negotiate_quest", _negotiate_key)
 def negotiate_quest(
     llm: LLMProvider,
     quest: dict,
@@ -314,16 +397,14 @@ def negotiate_quest(
     check_success: bool,
 ) -> dict:
     """Evaluate a player's quest negotiation attempt."""
-    env = _get_jinja()
-    template = env.get_template("director/negotiate_quest.j2")
-
     props = safe_props(npc)
     relationships = props.get("relationships", {})
     player_rel = relationships.get("player", {})
 
     objectives = safe_json(quest.get("objectives"), [])
 
-    prompt = template.render(
+    system, prompt = _render_split(
+        _NEGOTIATE_TPL,
         npc_name=npc.get("name", "Unknown"),
         npc_personality=", ".join(npc.get("dialogue_tags") or []),
         disposition=player_rel.get("disposition", "neutral"),
@@ -338,7 +419,7 @@ def negotiate_quest(
         check_success=check_success,
     )
 
-    raw = llm.generate_structured(prompt, temperature=0.7, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.7, max_tokens=512)
 
     # Validate basics
     raw.setdefault("accepted", False)
@@ -367,15 +448,17 @@ def plausibility_to_dc(plausibility: float) -> int:
     return max(5, min(40, round(dc)))
 
 
+def _spell_invention_key(llm: LLMProvider, spell_concept: str, context: GameContext) -> tuple[str, tuple]:
+    return spell_concept, (context.location.get("id"), context.character.get("level", 1))
+
+
+@semantic_cache("spell_evaluation", _spell_invention_key)
 def evaluate_spell_invention(
     llm: LLMProvider,
     spell_concept: str,
     context: GameContext,
 ) -> dict:
     """Evaluate a player's spell invention concept via LLM. Returns validated dict."""
-    env = _get_jinja()
-    template = env.get_template("director/spell_evaluation.j2")
-
     # Gather known elements from player's spell repertoire
     known_elements: set[str] = set()
     from text_rpg.content.loader import load_all_spells
@@ -386,12 +469,13 @@ def evaluate_spell_invention(
         if dt:
             known_elements.add(dt)
 
-    prompt = template.render(
+    system, prompt = _render_split(
+        _SPELL_TPL,
         spell_concept=spell_concept,
         character_summary=_format_character(context.character),
         location_summary=_format_location(context.location),
         known_elements=", ".join(sorted(known_elements)) if known_elements else "none",
     )
 
-    raw = llm.generate_structured(prompt, temperature=0.8, max_tokens=512)
+    raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.8, max_tokens=512)
     return validate_spell_proposal(raw)
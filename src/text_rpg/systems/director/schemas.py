@@ -1,15 +1,122 @@
 """Validation schemas for Director-generated content."""
 from __future__ import annotations
 
+import math
+import os
 import uuid
+from typing import Callable
+
+_REQUIRED_FIELDS = frozenset({"name", "description"})
+_ABILITIES = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+_VALID_SCHOOLS = frozenset({
+    "abjuration", "conjuration", "divination", "enchantment",
+    "evocation", "illusion", "necromancy", "transmutation",
+})
+
+
+class _Expr(str):
+    """A default given as Python source, evaluated afresh on each call."""
+
+
+_NEW_ID = _Expr("str(uuid.uuid4())")
+
+
+def _compile_defaults(name: str, defaults: dict[str, object]) -> Callable[[dict], dict]:
+    """Compile a straight-line filler: ``if key not in data: data[key] = <default>``.
+
+    Generated once at import. Each default is emitted as a literal (or an
+    _Expr's source), so mutable defaults like [] are fresh per call and
+    id factories only run when the key is actually missing — unlike a
+    chain of data.setdefault(key, default) calls.
+    """
+    lines = [f"def {name}(data):"]
+    for key, default in defaults.items():
+        src = default if isinstance(default, _Expr) else repr(default)
+        lines.append(f"    if {key!r} not in data: data[{key!r}] = {src}")
+    lines.append("    return data")
+    namespace: dict = {"uuid": uuid}
+    exec(compile("\n".join(lines), f"<schemas.{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_fill_npc = _compile_defaults("_fill_npc", {
+    "id": _NEW_ID, "entity_type": "npc", "dialogue_tags": [], "behaviors": [],
+    "attacks": [], "loot_table": [], "is_hostile": False, "is_alive": True,
+    "generated": True, "speed": 30, "level": 1, "hp_temp": 0, "properties": {},
+})
+_fill_location = _compile_defaults("_fill_location", {
+    "id": _NEW_ID, "location_type": "wilderness", "entities": [], "items": [],
+    "visited": False, "generated": True, "properties": {},
+})
+_fill_objective = _compile_defaults("_fill_objective", {
+    "id": _NEW_ID, "description": "Complete the objective", "is_complete": False,
+    "required_count": 1, "current_count": 0, "negotiable": False,
+})
+_fill_quest = _compile_defaults("_fill_quest", {
+    "id": _NEW_ID, "status": "active", "xp_reward": 50, "item_rewards": [],
+    "gold_reward": 0, "level_requirement": 1, "generated": True,
+    "npc_motivation": "", "completion_flexibility": "low",
+})
+_fill_region = _compile_defaults("_fill_region", {
+    "id": _Expr('str(uuid.uuid4()).replace("-", "_")'), "climate": "temperate",
+    "level_range_min": 1, "level_range_max": 5,
+})
+_fill_region_location = _compile_defaults("_fill_region_location", {
+    "id": _NEW_ID, "name": "Unknown Location", "description": "An unexplored area.",
+    "location_type": "wilderness", "connections": [], "entities": [], "items": [],
+    "visited": False, "properties": {},
+})
+_fill_plausibility = _compile_defaults("_fill_plausibility", {
+    "skill": "athletics", "ability": "strength", "reasoning": "",
+    "success_description": "You succeed.", "failure_description": "You fail.",
+})
+_fill_spell = _compile_defaults("_fill_spell", {
+    "name": "Unknown Spell", "description": "A mysterious magical effect.", "reasoning": "",
+})
+
+
+def _bulk_uuids(n: int) -> list[str]:
+    """n random (version 4) UUID strings from a single os.urandom read."""
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+# The LLM usually returns well-typed numbers, so these try the conversion
+# first and only pay for exception handling on junk. Numeric strings ("12")
+# are accepted too.
+
+def _int_in_range(val: object, lo: int, hi: float, default: int) -> int:
+    """int(val) if it converts and lies within [lo, hi], else default."""
+    try:
+        v = int(val)
+    except (TypeError, ValueError, OverflowError):
+        return default
+    return v if lo <= v <= hi else default
+
+
+def _clamp_int(val: object, lo: int, hi: int, default: int) -> int:
+    """int(val) clamped to [lo, hi], or default if it doesn't convert."""
+    try:
+        v = int(val)
+    except (TypeError, ValueError, OverflowError):
+        return default
+    return lo if v < lo else hi if v > hi else v
+
+
+def _clamp_float(val: object, lo: float, hi: float, default: float) -> float:
+    """float(val) clamped to [lo, hi], or default if it doesn't convert."""
+    try:
+        v = float(val)
+    except (TypeError, ValueError):
+        v = default
+    return max(lo, min(hi, v))
 
 
 def validate_npc(data: dict) -> dict:
     """Validate and normalize a generated NPC dict. Returns cleaned data or raises ValueError."""
-    required = {"name", "description"}
-    missing = required - set(data.keys())
+    missing = _REQUIRED_FIELDS - data.keys()
     if missing:
-        raise ValueError(f"Generated NPC missing required fields: {missing}")
+        raise ValueError(f"Generated NPC missing required fields: {set(missing)}")
 
     name = str(data["name"]).strip()
     if not name or len(name) > 100:
@@ -17,50 +124,25 @@ def validate_npc(data: dict) -> dict:
 
     # Ensure sensible stat ranges
     scores = data.get("ability_scores", {})
-    for ability in ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"):
-        val = scores.get(ability, 10)
-        if not isinstance(val, (int, float)):
-            scores[ability] = 10
-        else:
-            scores[ability] = max(1, min(30, int(val)))
+    for ability in _ABILITIES:
+        scores[ability] = _clamp_int(scores.get(ability, 10), 1, 30, 10)
     data["ability_scores"] = scores
 
-    hp = data.get("hp_max", 10)
-    if not isinstance(hp, (int, float)) or hp < 1:
-        hp = 10
-    hp = int(hp)
+    hp = _int_in_range(data.get("hp_max", 10), 1, math.inf, 10)
     data["hp_max"] = hp
     data["hp_current"] = data.get("hp_current", hp)
 
-    ac = data.get("ac", 10)
-    if not isinstance(ac, (int, float)) or ac < 1 or ac > 30:
-        ac = 10
-    data["ac"] = int(ac)
+    data["ac"] = _int_in_range(data.get("ac", 10), 1, 30, 10)
 
     # Ensure required defaults
-    data.setdefault("id", str(uuid.uuid4()))
-    data.setdefault("entity_type", "npc")
-    data.setdefault("dialogue_tags", [])
-    data.setdefault("behaviors", [])
-    data.setdefault("attacks", [])
-    data.setdefault("loot_table", [])
-    data.setdefault("is_hostile", False)
-    data.setdefault("is_alive", True)
-    data.setdefault("generated", True)
-    data.setdefault("speed", 30)
-    data.setdefault("level", 1)
-    data.setdefault("hp_temp", 0)
-    data.setdefault("properties", {})
-
-    return data
+    return _fill_npc(data)
 
 
 def validate_location(data: dict) -> dict:
     """Validate and normalize a generated location dict."""
-    required = {"name", "description"}
-    missing = required - set(data.keys())
+    missing = _REQUIRED_FIELDS - data.keys()
     if missing:
-        raise ValueError(f"Generated location missing required fields: {missing}")
+        raise ValueError(f"Generated location missing required fields: {set(missing)}")
 
     name = str(data["name"]).strip()
     if not name or len(name) > 100:
@@ -72,23 +154,14 @@ def validate_location(data: dict) -> dict:
         connections = []
     data["connections"] = connections
 
-    data.setdefault("id", str(uuid.uuid4()))
-    data.setdefault("location_type", "wilderness")
-    data.setdefault("entities", [])
-    data.setdefault("items", [])
-    data.setdefault("visited", False)
-    data.setdefault("generated", True)
-    data.setdefault("properties", {})
-
-    return data
+    return _fill_location(data)
 
 
 def validate_quest(data: dict) -> dict:
     """Validate and normalize a generated quest dict."""
-    required = {"name", "description"}
-    missing = required - set(data.keys())
+    missing = _REQUIRED_FIELDS - data.keys()
     if missing:
-        raise ValueError(f"Generated quest missing required fields: {missing}")
+        raise ValueError(f"Generated quest missing required fields: {set(missing)}")
 
     objectives = data.get("objectives", [])
     if not isinstance(objectives, list):
@@ -98,72 +171,51 @@ def validate_quest(data: dict) -> dict:
     for obj in objectives:
         if not isinstance(obj, dict):
             continue
-        obj.setdefault("id", str(uuid.uuid4()))
-        obj.setdefault("description", "Complete the objective")
-        obj.setdefault("is_complete", False)
-        obj.setdefault("required_count", 1)
-        obj.setdefault("current_count", 0)
-        obj.setdefault("negotiable", False)
-        cleaned_objectives.append(obj)
+        cleaned_objectives.append(_fill_objective(obj))
     data["objectives"] = cleaned_objectives
 
-    data.setdefault("id", str(uuid.uuid4()))
-    data.setdefault("status", "active")
-    data.setdefault("xp_reward", 50)
-    data.setdefault("item_rewards", [])
-    data.setdefault("gold_reward", 0)
-    data.setdefault("level_requirement", 1)
-    data.setdefault("generated", True)
-    data.setdefault("npc_motivation", "")
-    data.setdefault("completion_flexibility", "low")
-
-    return data
+    return _fill_quest(data)
 
 
 def validate_region(data: dict) -> dict:
     """Validate and normalize a generated region dict."""
-    required = {"name", "description"}
-    missing = required - set(data.keys())
+    missing = _REQUIRED_FIELDS - data.keys()
     if missing:
-        raise ValueError(f"Generated region missing required fields: {missing}")
+        raise ValueError(f"Generated region missing required fields: {set(missing)}")
 
     name = str(data["name"]).strip()
     if not name or len(name) > 100:
         raise ValueError(f"Invalid region name: '{name}'")
 
-    data.setdefault("id", str(uuid.uuid4()).replace("-", "_"))
-    data.setdefault("climate", "temperate")
-    data.setdefault("level_range_min", 1)
-    data.setdefault("level_range_max", 5)
+    _fill_region(data)
 
     # Clamp level ranges
-    data["level_range_min"] = max(1, min(20, int(data["level_range_min"])))
-    data["level_range_max"] = max(data["level_range_min"], min(20, int(data["level_range_max"])))
+    data["level_range_min"] = _clamp_int(data["level_range_min"], 1, 20, 1)
+    level_min = data["level_range_min"]
+    # The fallback must respect the clamp too, or a high min inverts the range
+    data["level_range_max"] = _clamp_int(data["level_range_max"], level_min, 20, max(level_min, 5))
 
-    # Validate locations list
     locations = data.get("locations", [])
     if not isinstance(locations, list):
         locations = []
+    npcs = data.get("npcs", [])
+    if not isinstance(npcs, list):
+        npcs = []
+
+    # A region arrives with many id-less children — mint their ids in one go
+    unnamed = [d for d in (*locations, *npcs) if isinstance(d, dict) and "id" not in d]
+    for d, new_id in zip(unnamed, _bulk_uuids(len(unnamed))):
+        d["id"] = new_id
+
+    # Validate locations list
     cleaned_locations = []
     for loc in locations:
         if not isinstance(loc, dict):
             continue
-        loc.setdefault("id", str(uuid.uuid4()))
-        loc.setdefault("name", "Unknown Location")
-        loc.setdefault("description", "An unexplored area.")
-        loc.setdefault("location_type", "wilderness")
-        loc.setdefault("connections", [])
-        loc.setdefault("entities", [])
-        loc.setdefault("items", [])
-        loc.setdefault("visited", False)
-        loc.setdefault("properties", {})
-        cleaned_locations.append(loc)
+        cleaned_locations.append(_fill_region_location(loc))
     data["locations"] = cleaned_locations
 
     # Validate NPCs list
-    npcs = data.get("npcs", [])
-    if not isinstance(npcs, list):
-        npcs = []
     cleaned_npcs = []
     for npc in npcs:
         if not isinstance(npc, dict):
@@ -181,18 +233,9 @@ def validate_plausibility(data: dict) -> dict:
     """Validate plausibility evaluation output."""
     if not isinstance(data, dict):
         data = {"plausibility": 0.5}
-    p = data.get("plausibility", 0.5)
-    if not isinstance(p, (int, float)):
-        p = 0.5
-    data["plausibility"] = max(0.001, min(1.0, float(p)))
+    data["plausibility"] = _clamp_float(data.get("plausibility", 0.5), 0.001, 1.0, 0.5)
 
-    data.setdefault("skill", "athletics")
-    data.setdefault("ability", "strength")
-    data.setdefault("reasoning", "")
-    data.setdefault("success_description", "You succeed.")
-    data.setdefault("failure_description", "You fail.")
-
-    return data
+    return _fill_plausibility(data)
 
 
 def validate_spell_proposal(data: dict) -> dict:
@@ -200,30 +243,18 @@ def validate_spell_proposal(data: dict) -> dict:
     if not isinstance(data, dict):
         data = {}
 
-    data.setdefault("name", "Unknown Spell")
-    data.setdefault("description", "A mysterious magical effect.")
-    data.setdefault("reasoning", "")
+    _fill_spell(data)
 
     # Clamp level to 0-6
-    level = data.get("level", 1)
-    if not isinstance(level, (int, float)):
-        level = 1
-    data["level"] = max(0, min(6, int(level)))
+    data["level"] = _clamp_int(data.get("level", 1), 0, 6, 1)
 
     # Validate school
-    valid_schools = {
-        "abjuration", "conjuration", "divination", "enchantment",
-        "evocation", "illusion", "necromancy", "transmutation",
-    }
     school = data.get("school", "evocation")
-    if school not in valid_schools:
+    if school not in _VALID_SCHOOLS:
         data["school"] = "evocation"
 
     # Clamp plausibility
-    p = data.get("plausibility", 0.5)
-    if not isinstance(p, (int, float)):
-        p = 0.5
-    data["plausibility"] = max(0.001, min(1.0, float(p)))
+    data["plausibility"] = _clamp_float(data.get("plausibility", 0.5), 0.001, 1.0, 0.5)
 
     # Ensure elements is a list
     elements = data.get("elements", [])
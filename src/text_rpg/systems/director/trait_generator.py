@@ -1,13 +1,19 @@
 """LLM-powered trait generator — creates dynamic traits from player behavior."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import os
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
+from text_rpg.llm.batching import BatchingLLM
 from text_rpg.llm.provider import LLMProvider
 from text_rpg.mechanics.behavior_tracker import BEHAVIOR_CATEGORIES
 from text_rpg.mechanics.trait_effects import (
@@ -16,12 +22,39 @@ from text_rpg.mechanics.trait_effects import (
     TRAIT_EFFECTS,
     validate_trait,
 )
-from text_rpg.utils import safe_json
+from text_rpg.systems.director.cache import get_cache
 
 logger = logging.getLogger(__name__)
 
 _PROMPTS_DIR = Path(__file__).parent.parent.parent / "llm" / "prompts"
 _jinja_env: Environment | None = None
+_trait_template: Template | None = None
+
+_BEHAVIOR_DESCRIPTIONS = {cat: data["description"] for cat, data in BEHAVIOR_CATEGORIES.items()}
+
+_CACHE_ID = "trait_generation"
+# Character summaries are short, so near-matches need to be close
+_SIMILARITY_THRESHOLD = 0.95
+
+
+_ID_BATCH = 64
+_id_pool: deque[str] = deque()
+
+
+def _new_id() -> str:
+    """A random (version 4) UUID string.
+
+    Ids are minted _ID_BATCH at a time from one os.urandom read, so a run of
+    fallbacks or a bulk backfill doesn't pay a syscall per trait.
+    """
+    try:
+        return _id_pool.popleft()
+    except IndexError:
+        buf = os.urandom(16 * _ID_BATCH)
+        _id_pool.extend(
+            str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(16, 16 * _ID_BATCH, 16)
+        )
+        return str(uuid.UUID(bytes=buf[:16], version=4))
 
 
 def _get_jinja() -> Environment:
@@ -30,76 +63,83 @@ def _get_jinja() -> Environment:
         _jinja_env = Environment(
             loader=FileSystemLoader(str(_PROMPTS_DIR)),
             autoescape=False,
+            auto_reload=False,
         )
     return _jinja_env
 
 
+def _get_trait_template() -> Template:
+    """The compiled trait prompt, fetched once rather than looked up per call."""
+    global _trait_template
+    if _trait_template is None:
+        _trait_template = _get_jinja().get_template("trait_generation.j2")
+    return _trait_template
+
+
 def _format_character(char: dict) -> str:
-    scores = safe_json(char.get("ability_scores"), {})
     return (
         f"{char.get('name', 'Unknown')} — Level {char.get('level', 1)} "
         f"{char.get('race', '?')} {char.get('char_class', '?')}"
     )
 
 
-def generate_trait(
-    llm: LLMProvider,
-    behavior_scores: dict[str, int],
-    dominant_patterns: list[str],
-    tier: int,
-    character: dict,
-    existing_traits: list[dict],
-) -> dict | None:
-    """Ask LLM to create a trait based on player behavior.
+@functools.lru_cache(maxsize=None)
+def _tier_prefix(tier: int) -> str:
+    """The ``cached`` block — role, budget, effect menu, schema — rendered once per tier.
 
-    Returns a validated trait dict or None on failure.
-    Falls back to curated traits if LLM output is invalid.
+    It's sent as the system prompt, so every trait of a tier shares a
+    byte-identical prefix the provider can reuse.
     """
-    budget = TIER_BUDGETS.get(tier, 2)
-    primary_pattern = dominant_patterns[0] if dominant_patterns else "explorer"
+    template = _get_trait_template()
+    ctx = template.new_context({
+        "tier": tier,
+        "budget": TIER_BUDGETS.get(tier, 2),
+        "effects_menu": TRAIT_EFFECTS,
+    })
+    return "".join(template.blocks["cached"](ctx)).strip()
+
 
+def _trait_prompt(
+    dominant_patterns: list[str],
+    tier: int,
+    character_summary: str,
+    existing_traits: list[dict],
+) -> tuple[str, str]:
+    """Render the trait prompt as (system, prompt)."""
     # Build pattern descriptions for the prompt
     pattern_descriptions = {
-        cat: BEHAVIOR_CATEGORIES[cat]["description"]
+        cat: _BEHAVIOR_DESCRIPTIONS[cat]
         for cat in dominant_patterns
-        if cat in BEHAVIOR_CATEGORIES
+        if cat in _BEHAVIOR_DESCRIPTIONS
     }
 
-    env = _get_jinja()
-    template = env.get_template("trait_generation.j2")
-
-    prompt = template.render(
-        character_summary=_format_character(character),
-        dominant_patterns=dominant_patterns,
-        pattern_descriptions=pattern_descriptions,
-        tier=tier,
-        budget=budget,
-        effects_menu=TRAIT_EFFECTS,
-        existing_traits=existing_traits,
-    )
+    template = _get_trait_template()
+    ctx = template.new_context({
+        "character_summary": character_summary,
+        "dominant_patterns": dominant_patterns,
+        "pattern_descriptions": pattern_descriptions,
+        "existing_traits": existing_traits,
+    })
+    return _tier_prefix(tier), "".join(template.blocks["dynamic"](ctx)).strip()
 
-    try:
-        raw = llm.generate_structured(prompt, temperature=0.8, max_tokens=512)
-    except Exception as e:
-        logger.warning(f"Trait generation LLM call failed: {e}")
-        return _fallback_trait(primary_pattern, tier)
 
-    # Validate the LLM output
+def _validated_trait(raw: dict, primary_pattern: str, tier: int) -> dict | None:
+    """Build a trait from the LLM output, or None if it's unusable."""
     name = raw.get("name", "").strip()
     description = raw.get("description", "").strip()
     effects = raw.get("effects", [])
 
     if not name or not description or not effects:
         logger.warning("Trait generation returned empty fields, using fallback")
-        return _fallback_trait(primary_pattern, tier)
+        return None
 
     is_valid, error = validate_trait(effects, tier)
     if not is_valid:
         logger.warning(f"Trait validation failed: {error}, using fallback")
-        return _fallback_trait(primary_pattern, tier)
+        return None
 
     return {
-        "id": str(uuid.uuid4()),
+        "id": _new_id(),
         "name": name,
         "description": description,
         "effects": effects,
@@ -108,6 +148,132 @@ def generate_trait(
     }
 
 
+def _cache_key(
+    dominant_patterns: list[str],
+    tier: int,
+    character: dict,
+    existing_traits: list[dict],
+) -> tuple[str, tuple]:
+    """(text, scope) for the trait cache.
+
+    Everything else in the prompt is an exact-match scope, so a similar
+    character only shares a trait when patterns, tier and the traits it
+    must not duplicate are the same.
+    """
+    scope = (
+        tier,
+        tuple(dominant_patterns),
+        tuple(sorted(t.get("name", "") for t in existing_traits)),
+    )
+    return _format_character(character), scope
+
+
+def _cached_trait(text: str, scope: tuple) -> tuple[dict | None, list[float] | None]:
+    cached, embedding = get_cache().lookup(_CACHE_ID, scope, text, _SIMILARITY_THRESHOLD)
+    if cached is not None:
+        # Hits are copies, but trait ids must still be unique
+        cached["id"] = _new_id()
+    return cached, embedding
+
+
+def generate_trait(
+    llm: LLMProvider,
+    behavior_scores: dict[str, int],
+    dominant_patterns: list[str],
+    tier: int,
+    character: dict,
+    existing_traits: list[dict],
+) -> dict | None:
+    """Ask LLM to create a trait based on player behavior.
+
+    Returns a validated trait dict or None on failure.
+    Falls back to curated traits if LLM output is invalid.
+    """
+    primary_pattern = dominant_patterns[0] if dominant_patterns else "explorer"
+    text, scope = _cache_key(dominant_patterns, tier, character, existing_traits)
+    cached, embedding = _cached_trait(text, scope)
+    if cached is not None:
+        return cached
+
+    # The cache text is the character summary — reuse it for the prompt
+    system, prompt = _trait_prompt(dominant_patterns, tier, text, existing_traits)
+
+    try:
+        raw = llm.generate_structured(prompt, system_prompt=system, temperature=0.8, max_tokens=512)
+    except Exception as e:
+        logger.warning(f"Trait generation LLM call failed: {e}")
+        return _fallback_trait(primary_pattern, tier)
+
+    trait = _validated_trait(raw, primary_pattern, tier)
+    if trait is None:
+        return _fallback_trait(primary_pattern, tier)
+    get_cache().store(_CACHE_ID, scope, text, trait, embedding)
+    return trait
+
+
+async def agenerate_trait(
+    llm: LLMProvider,
+    behavior_scores: dict[str, int],
+    dominant_patterns: list[str],
+    tier: int,
+    character: dict,
+    existing_traits: list[dict],
+) -> dict | None:
+    """Async generate_trait — lets callers overlap several generations."""
+    return await asyncio.to_thread(
+        generate_trait, llm, behavior_scores, dominant_patterns, tier, character, existing_traits,
+    )
+
+
+async def generate_traits_batch(
+    llm: LLMProvider,
+    jobs: list[dict[str, Any]],
+    max_concurrency: int = 10,
+) -> list[dict | None]:
+    """Run several generate_trait jobs concurrently, results in job order.
+
+    Each job holds generate_trait's keyword arguments (behavior_scores,
+    dominant_patterns, tier, character, existing_traits). At most
+    max_concurrency LLM calls are in flight at once.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(job: dict[str, Any]) -> dict | None:
+        async with semaphore:
+            return await agenerate_trait(llm, **job)
+
+    results = await asyncio.gather(*(run(job) for job in jobs), return_exceptions=True)
+    traits: list[dict | None] = []
+    for job, result in zip(jobs, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Batched trait generation failed: {result}")
+            patterns = job.get("dominant_patterns") or ["explorer"]
+            result = _fallback_trait(patterns[0], job.get("tier", 1))
+        traits.append(result)
+    return traits
+
+
+def generate_traits_bulk(
+    llm: LLMProvider,
+    jobs: list[dict[str, Any]],
+    max_batch: int = 8,
+) -> list[dict | None]:
+    """Generate traits for many jobs in as few LLM requests as possible.
+
+    Jobs take the same keyword arguments as generate_trait, and each one
+    runs through it on a worker thread; their LLM calls meet in a
+    BatchingLLM and go out max_batch to a request. Meant for backfills,
+    where one request per trait would dominate the cost.
+    """
+    batcher = BatchingLLM(llm, max_batch=max_batch)
+    try:
+        # Jobs of the same tier share a system prompt, sent once per batch
+        with ThreadPoolExecutor(max_workers=max_batch, thread_name_prefix="trait-bulk") as pool:
+            return list(pool.map(lambda job: generate_trait(batcher, **job), jobs))
+    finally:
+        batcher.close()
+
+
 def _fallback_trait(pattern: str, tier: int) -> dict | None:
     """Return a curated fallback trait for a given behavior pattern."""
     fallback = FALLBACK_TRAITS.get(pattern)
@@ -134,7 +300,7 @@ def _fallback_trait(pattern: str, tier: int) -> dict | None:
         effects = trimmed if trimmed else effects[:1]
 
     return {
-        "id": str(uuid.uuid4()),
+        "id": _new_id(),
         "name": fallback["name"],
         "description": fallback.get("description", "A trait awakens within you."),
         "effects": effects,
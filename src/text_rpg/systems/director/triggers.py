@@ -1,47 +1,113 @@
 """Trigger evaluation — decides when the Director should generate content."""
 from __future__ import annotations
 
-import json
-from typing import Any
+import functools
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
+from text_rpg.content.loader import load_guilds_by_profession, load_region
 from text_rpg.systems.base import GameContext
-from text_rpg.utils import safe_json, safe_props
+from text_rpg.utils import json_view
+
+# Location types where NPCs gather — shared with the Director and generators
+SETTLEMENT_TYPES = frozenset({"town", "village", "settlement", "tavern", "shop"})
+_TRAINER_LOCATION_TYPES = SETTLEMENT_TYPES | {"guild_hall"}
+_ARCANE_LOCATION_TYPES = frozenset({"arcane_tower", "library", "academy", "enchanted_grove"})
+
+# Bound once; still the global generator, so random.seed() keeps runs reproducible
+_random = random.random
+
+
+@dataclass(slots=True, frozen=True)
+class TriggerCtx:
+    """Per-turn facts the Director's triggers share, derived once from GameContext."""
+
+    game_id: str
+    turn: int
+    character_id: str
+    loc_id: str | None
+    loc_type: str
+    location: dict
+    alive_npc_count: int
+    alive_entity_count: int
+    recent_events: list[dict]
+    # Quest givers with an active/available quest
+    quest_giver_ids: frozenset[str]
+    # Repo lookups shared between triggers this turn, filled on first use
+    memo: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    def memberships(self, guild_repo: Any) -> list[dict]:
+        """The character's guild memberships, fetched at most once per turn."""
+        if "memberships" not in self.memo:
+            self.memo["memberships"] = guild_repo.get_memberships(self.game_id, self.character_id)
+        return self.memo["memberships"]
+
+    @classmethod
+    def from_context(cls, context: GameContext) -> TriggerCtx:
+        return cls(
+            game_id=context.game_id,
+            turn=context.turn_number,
+            character_id=context.character.get("id", ""),
+            loc_id=context.location.get("id"),
+            loc_type=context.location.get("location_type", "wilderness"),
+            location=context.location,
+            alive_npc_count=len(context.alive_npcs),
+            alive_entity_count=len(context.alive_entities),
+            recent_events=context.recent_events or [],
+            quest_giver_ids=frozenset(
+                q.get("quest_giver_id") for q in (context.active_quests or [])
+                if q.get("status") in ("active", "available")
+            ),
+        )
+
+
+def _per_turn(trigger: Callable[[TriggerCtx, dict[str, Any]], bool]) -> Callable:
+    """Memoize a (tctx, repos) trigger on this turn's TriggerCtx.
+
+    Only for triggers that scan events or query repos — the Director's
+    pipeline and its prefetch step may both ask within one tick. A new turn
+    builds a new TriggerCtx, so results never outlive the turn.
+    """
+    key = f"trigger:{trigger.__name__}"
+
+    @functools.wraps(trigger)
+    def wrapper(tctx: TriggerCtx, repos: dict[str, Any]) -> bool:
+        if key not in tctx.memo:
+            tctx.memo[key] = trigger(tctx, repos)
+        return tctx.memo[key]
+    return wrapper
 
 
-def should_spawn_npc(context: GameContext, repos: dict[str, Any]) -> bool:
+@_per_turn
+def should_spawn_npc(tctx: TriggerCtx, repos: dict[str, Any]) -> bool:
     """True if the current location could use a new NPC.
 
     Conditions:
     - Location has fewer than 2 alive NPCs
     - Player has visited this location on 3+ turns without social interaction
     """
-    alive_npcs = [
-        e for e in context.entities
-        if e.get("entity_type") == "npc" and e.get("is_alive", True)
-    ]
-    if len(alive_npcs) >= 2:
+    alive_npcs = tctx.alive_npc_count
+    if alive_npcs >= 2:
         return False
 
     # Check if location is populated enough for the area type
-    loc_type = context.location.get("location_type", "wilderness")
-    if loc_type in ("town", "village", "settlement", "tavern", "shop") and len(alive_npcs) < 1:
+    if tctx.loc_type in SETTLEMENT_TYPES and alive_npcs < 1:
         return True
 
-    # Check if player has been here a while without social interaction
-    recent = context.recent_events or []
-    location_id = context.location.get("id")
-    turns_at_location = sum(
-        1 for e in recent
-        if e.get("location_id") == location_id
-    )
-    dialogue_at_location = any(
-        e.get("event_type") == "DIALOGUE" and e.get("location_id") == location_id
-        for e in recent
-    )
-    if turns_at_location >= 3 and not dialogue_at_location and len(alive_npcs) == 0:
-        return True
+    if alive_npcs:
+        return False
 
-    return False
+    # Check if player has been here a while without social interaction
+    location_id = tctx.loc_id
+    turns_at_location = 0
+    for e in tctx.recent_events:
+        if e.get("location_id") != location_id:
+            continue
+        if e.get("event_type") == "DIALOGUE":
+            return False
+        turns_at_location += 1
+    return turns_at_location >= 3
 
 
 def should_generate_location(direction: str, context: GameContext) -> bool:
@@ -50,29 +116,35 @@ def should_generate_location(direction: str, context: GameContext) -> bool:
     This is checked in the exploration system itself — always returns True
     as a confirmation that the Director should attempt generation.
     """
-    connections = safe_json(context.location.get("connections"), [])
+    # Connection exists, no need to generate
+    return direction.lower() not in _connection_directions(context.location.get("connections"))
+
+
+def _connection_directions(connections: Any) -> frozenset[str]:
+    """Lowercased exit directions of a location's connections column."""
+    if isinstance(connections, str):
+        return _directions_of_json(connections)
+    return frozenset(
+        conn.get("direction", "").lower()
+        for conn in json_view(connections, []) if isinstance(conn, dict)
+    )
 
-    for conn in connections:
-        if isinstance(conn, dict) and conn.get("direction", "").lower() == direction.lower():
-            return False  # Connection exists, no need to generate
-    return True
 
+@functools.lru_cache(maxsize=512)
+def _directions_of_json(raw: str) -> frozenset[str]:
+    return _connection_directions(json_view(raw, []))
 
-def should_offer_quest(npc: dict, context: GameContext) -> bool:
+
+def should_offer_quest(npc: dict, tctx: TriggerCtx) -> bool:
     """True if NPC has a quest hook but no active quest from them."""
-    props = safe_props(npc)
+    props = json_view(npc.get("properties"), {})
 
     quest_hook = props.get("quest_hook")
     if not quest_hook:
         return False
 
     # Check if there's already an active quest from this NPC
-    npc_id = npc.get("id", "")
-    for quest in (context.active_quests or []):
-        if quest.get("quest_giver_id") == npc_id and quest.get("status") in ("active", "available"):
-            return False
-
-    return True
+    return npc.get("id", "") not in tctx.quest_giver_ids
 
 
 def should_generate_follow_up(completed_quest: dict, context: GameContext) -> bool:
@@ -82,7 +154,7 @@ def should_generate_follow_up(completed_quest: dict, context: GameContext) -> bo
         return False
 
     # Don't chain too deep — check if this quest was itself a follow-up
-    props = safe_props(completed_quest)
+    props = json_view(completed_quest.get("properties"), {})
     chain_depth = props.get("chain_depth", 0)
     if chain_depth >= 3:
         return False
@@ -90,25 +162,21 @@ def should_generate_follow_up(completed_quest: dict, context: GameContext) -> bo
     return True
 
 
-def should_enrich_location(context: GameContext) -> bool:
+def should_enrich_location(tctx: TriggerCtx) -> bool:
     """True if the location has been visited but feels empty."""
-    loc = context.location
-    items = safe_json(loc.get("items"), [])
-
-    entities = context.entities
-    alive = [e for e in entities if e.get("is_alive", True)]
-
     # Location is empty if no items and no alive entities
-    if not items and not alive:
-        # Only enrich if the location has been visited before
-        if loc.get("visited", False):
-            return True
-    return False
+    if tctx.alive_entity_count:
+        return False
+    loc = tctx.location
+    if json_view(loc.get("items"), []):
+        return False
+    # Only enrich if the location has been visited before
+    return bool(loc.get("visited", False))
 
 
-def pacing_check(context: GameContext) -> bool:
+def pacing_check(tctx: TriggerCtx) -> bool:
     """True every 10 turns — opportunity for the Director to seed hooks."""
-    return context.turn_number > 0 and context.turn_number % 10 == 0
+    return tctx.turn > 0 and tctx.turn % 10 == 0
 
 
 def should_reveal_new_region(
@@ -121,8 +189,9 @@ def should_reveal_new_region(
     Tier-aware progression:
     - Player level must be within 1 of the region's level_range_max
     - Player has visited 60%+ of the locations in the current region
-    - Prefers revealing same-tier unexplored regions before higher tiers
-    - Only reveals T(N+1) when no same-tier unexplored regions remain
+
+    Choosing the region (unvisited content first, else a generated one) is
+    left to the caller, so all_region_ids doesn't affect the result.
     """
     region_id = context.location.get("region_id", "")
     if not region_id:
@@ -133,12 +202,8 @@ def should_reveal_new_region(
         return False
 
     # Check exploration percentage in current region
-    region_locations = location_repo.get_by_region(context.game_id, region_id)
-    if not region_locations:
-        return False
-
-    visited = sum(1 for loc in region_locations if loc.get("visited"))
-    total = len(region_locations)
+    summary = location_repo.get_visited_summary(context.game_id)
+    visited, total = summary.get(region_id, (0, 0))
     if total == 0:
         return False
 
@@ -147,7 +212,6 @@ def should_reveal_new_region(
         return False
 
     # Check player level vs region max
-    from text_rpg.content.loader import load_region, load_all_regions
     try:
         region_data = load_region(region_id)
     except Exception:
@@ -158,100 +222,67 @@ def should_reveal_new_region(
     if player_level < level_max - 1:
         return False
 
-    # Build set of visited regions
-    visited_regions = set()
-    all_game_locations = location_repo.get_all(context.game_id)
-    for loc in all_game_locations:
-        r = loc.get("region_id", "")
-        if r and loc.get("visited"):
-            visited_regions.add(r)
-
-    # Load all region metadata for tier-aware selection
-    all_regions = load_all_regions()
-    current_level_max = level_max
-
-    # Find unvisited content regions, grouped by tier proximity
-    same_tier = []
-    next_tier = []
-    for rid in all_region_ids:
-        if rid in visited_regions:
-            continue
-        rdata = all_regions.get(rid)
-        if not rdata:
-            continue
-        r_min = rdata.get("level_range_min", 1)
-        r_max = rdata.get("level_range_max", 5)
-        # Same tier: level ranges overlap with current region
-        if r_min <= current_level_max and r_max >= region_data.get("level_range_min", 1):
-            same_tier.append(rid)
-        # Next tier: level_range_min is within reach (player level >= r_min - 2)
-        elif player_level >= r_min - 2:
-            next_tier.append(rid)
-
-    # Prefer same-tier regions first, then next-tier
-    if same_tier or next_tier:
-        return True
-
-    # If all content regions visited, Director can generate a new one
+    # Either an unvisited content region remains or the Director
+    # generates a new one — there is always something to reveal.
     return True
 
 
-def should_spawn_arcane_location(context: GameContext, repos: dict[str, Any]) -> bool:
+@_per_turn
+def should_spawn_arcane_location(tctx: TriggerCtx, repos: dict[str, Any]) -> bool:
     """True when the player has invented 3+ spells, suggesting an arcane location nearby.
 
     This spawns a library, arcane tower, or enchanted grove to support further research.
     """
-    spell_creation_repo = repos.get("spell_creation")
-    if not spell_creation_repo:
-        return False
-
-    char_id = context.character.get("id", "")
-    customs = spell_creation_repo.get_custom_spells(context.game_id, char_id)
-    combos = spell_creation_repo.get_discovered_combinations(context.game_id, char_id)
-
-    total_discoveries = len(customs) + len(combos)
-    if total_discoveries < 3:
+    # Don't spawn if already at an arcane location
+    if tctx.loc_type in _ARCANE_LOCATION_TYPES:
         return False
 
-    # Don't spawn if already at an arcane location
-    loc_type = context.location.get("location_type", "")
-    if loc_type in ("arcane_tower", "library", "academy", "enchanted_grove"):
+    spell_creation_repo = repos.get("spell_creation")
+    if not spell_creation_repo:
         return False
 
-    return True
+    return spell_creation_repo.count_discoveries(tctx.game_id, tctx.character_id) >= 3
 
 
-def should_spawn_guild_trainer(context: GameContext, repos: dict[str, Any]) -> bool:
+def should_spawn_guild_trainer(
+    context: GameContext,
+    repos: dict[str, Any],
+    tctx: TriggerCtx | None = None,
+) -> bool:
     """True if a guild trainer NPC should appear at this location.
 
     Conditions:
     - Location is a T2+ settlement (town, village, settlement)
     - No trainer NPC already at this location
     - Player has at least one guild membership
+
+    Cheapest checks first — the membership query only runs when the
+    location could take a trainer. Pass this turn's tctx to share it.
     """
     loc_type = context.location.get("location_type", "wilderness")
-    if loc_type not in ("town", "village", "settlement", "tavern", "shop", "guild_hall"):
+    if loc_type not in _TRAINER_LOCATION_TYPES:
+        return False
+
+    guild_repo = repos.get("guild")
+    if not guild_repo:
         return False
 
     # Check that no trainer NPC is already present
     for entity in context.entities:
         if not entity.get("is_alive", True):
             continue
-        props = safe_props(entity)
+        props = json_view(entity.get("properties"), {})
         if props.get("teaches"):
             return False
 
     # Player must be in a guild
-    guild_repo = repos.get("guild")
-    if not guild_repo:
-        return False
+    if tctx is None:
+        tctx = TriggerCtx.from_context(context)
+    return len(tctx.memberships(guild_repo)) > 0
 
-    char_id = context.character.get("id", "")
-    memberships = guild_repo.get_memberships(context.game_id, char_id)
-    return len(memberships) > 0
 
-
-def should_offer_guild_recruitment(context: GameContext, repos: dict[str, Any]) -> bool:
+@_per_turn
+def should_offer_guild_recruitment(tctx: TriggerCtx, repos: dict[str, Any]) -> bool:
     """True if the player has a trade skill L3+ but is not in the corresponding guild.
 
     Used to generate recruitment dialogue from NPCs.
@@ -261,30 +292,22 @@ def should_offer_guild_recruitment(context: GameContext, repos: dict[str, Any])
     if not trade_repo or not guild_repo:
         return False
 
-    char_id = context.character.get("id", "")
-    game_id = context.game_id
-
-    skills = trade_repo.get_skills(game_id, char_id)
-    memberships = guild_repo.get_memberships(game_id, char_id)
-    member_guild_ids = {m["guild_id"] for m in memberships}
-
-    from text_rpg.content.loader import load_all_guilds
-    guilds = load_all_guilds()
-
-    # Check if player has a high-level skill without guild membership
-    for skill in skills:
-        if not skill.get("is_learned"):
-            continue
-        if skill.get("level", 1) < 3:
-            continue
-
-        skill_name = skill.get("skill_name", "")
-        # Find the guild for this profession
-        for gid, gdata in guilds.items():
-            if gdata.get("profession") == skill_name and gid not in member_guild_ids:
-                return True
+    guilds_by_profession = load_guilds_by_profession()
+
+    # Guilds the player's high-level skills qualify them for
+    skills = trade_repo.get_skills(tctx.game_id, tctx.character_id)
+    eligible = {
+        gid
+        for skill in skills
+        if skill.get("is_learned") and skill.get("level", 1) >= 3
+        for gid in guilds_by_profession.get(skill.get("skill_name", ""), ())
+    }
+    if not eligible:
+        return False
 
-    return False
+    # Recruit if any of them is a guild the player hasn't joined
+    member_guild_ids = {m["guild_id"] for m in tctx.memberships(guild_repo)}
+    return not eligible <= member_guild_ids
 
 
 def should_spawn_bounty_hunter(context: GameContext, bounty_amount: int) -> bool:
@@ -292,15 +315,13 @@ def should_spawn_bounty_hunter(context: GameContext, bounty_amount: int) -> bool
 
     Chance increases with bounty amount. Only triggers on roads/wilderness.
     """
-    import random
-
     if bounty_amount < 50:
         return False
 
     loc_type = context.location.get("location_type", "wilderness")
-    if loc_type in ("town", "village", "settlement", "tavern", "shop"):
+    if loc_type in SETTLEMENT_TYPES:
         return False  # Guards handle towns, bounty hunters roam the wilds
 
-    # Higher bounty → higher chance
-    chance = min(0.5, bounty_amount / 200)
-    return random.random() < chance
+    # Higher bounty → higher chance, capped at 50% from 100 gold up
+    chance = bounty_amount * 0.005 if bounty_amount < 100 else 0.5
+    return _random() < chance
@@ -3,88 +3,128 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Callable
 
 from text_rpg.mechanics.ability_scores import modifier
 from text_rpg.mechanics.size import stealth_modifier
 from text_rpg.mechanics.skills import SKILL_ABILITY_MAP, skill_check
 from text_rpg.models.action import Action, ActionResult, DiceRoll, StateMutation
 from text_rpg.systems.base import GameContext, GameSystem
-from text_rpg.utils import safe_json
+from text_rpg.utils import json_view
 
 logger = logging.getLogger(__name__)
 
+_HANDLED = frozenset({"move", "look", "search", "interact"})
+# Guarded settlements — entering one with a bounty draws the guards
+_TOWN_TYPES = frozenset({"town", "village", "settlement"})
+# Locations whose (type, region) one system remembers before evicting the LRU one
+_MAX_LOCATION_KINDS = 10_000
+
+
+def _find_connection(connections: list, key: str) -> dict | None:
+    """The connection whose direction (or target location id) matches the lowercased key.
+
+    A single early-exit scan — locations have a handful of exits and the
+    list is rebuilt every turn, so an index would cost more than it saves.
+    """
+    for conn in connections:
+        if isinstance(conn, dict):
+            if conn.get("direction", "").lower() == key:
+                return conn
+            # Also match by location id
+            if conn.get("target_location_id", "").lower() == key:
+                return conn
+    return None
+
+
+def _exit_label(conn: dict) -> tuple[str, str]:
+    """(direction, destination) as shown to the player — shared by look and the action list."""
+    destination = conn.get("description")
+    if destination is None:
+        destination = conn.get("target_location_id", "?")
+    return conn.get("direction", "?"), destination
+
+
+def _no_way(action: Action, direction: str) -> ActionResult:
+    return ActionResult(
+        action_id=action.id, success=False,
+        outcome_description=f"You can't go '{direction}' from here.",
+    )
+
 
 class ExplorationSystem(GameSystem):
     def __init__(self, director: Any | None = None, repos: dict[str, Any] | None = None):
-        self._director = director
+        self._director = None
+        self._plausibility_to_dc: Callable[[float], int] | None = None
         self._repos = repos or {}
+        # (game_id, location_id) -> (location_type, region_id); neither changes once saved
+        self._location_kinds: OrderedDict[tuple[str, str], tuple[str | None, str | None]] = OrderedDict()
+        self._max_location_kinds = _MAX_LOCATION_KINDS
+        self._resolvers: dict[str, Callable[[Action, GameContext], ActionResult]] = {
+            "move": self._resolve_move,
+            "look": self._resolve_look,
+            "search": self._resolve_search,
+            "interact": self._resolve_interact,
+        }
+        if director is not None:
+            self._set_director(director)
 
     def inject(self, *, director: Any = None, repos: dict | None = None, **kwargs: Any) -> None:
         if director is not None:
-            self._director = director
+            self._set_director(director)
         if repos is not None:
             self._repos = repos
 
+    def _set_director(self, director: Any) -> None:
+        # The director package is heavy, so it's imported here rather than at
+        # module level — and only once, not on every dynamic move.
+        from text_rpg.systems.director.generators import plausibility_to_dc
+
+        self._director = director
+        self._plausibility_to_dc = plausibility_to_dc
+
     @property
     def system_id(self) -> str:
         return "exploration"
 
     @property
     def handled_action_types(self) -> set[str]:
-        return {"move", "look", "search", "interact"}
+        return set(_HANDLED)
 
     def can_handle(self, action: Action, context: GameContext) -> bool:
-        return action.action_type.lower() in self.handled_action_types
+        return action.action_type.lower() in _HANDLED
 
     def resolve(self, action: Action, context: GameContext) -> ActionResult:
-        action_type = action.action_type.lower()
-        if action_type == "move":
-            return self._resolve_move(action, context)
-        elif action_type == "look":
-            return self._resolve_look(action, context)
-        elif action_type == "search":
-            return self._resolve_search(action, context)
-        elif action_type == "interact":
-            return self._resolve_interact(action, context)
+        resolver = self._resolvers.get(action.action_type.lower(), self._resolve_unknown)
+        return resolver(action, context)
+
+    def _resolve_unknown(self, action: Action, context: GameContext) -> ActionResult:
         return ActionResult(action_id=action.id, success=False, outcome_description="Unknown exploration action.")
 
     def get_available_actions(self, context: GameContext) -> list[dict]:
         actions: list[dict] = [{"action_type": "look", "description": "Look around"}]
-        connections = safe_json(context.location.get("connections"), [])
+        connections = json_view(context.location.get("connections"), [])
         for conn in connections:
             if isinstance(conn, dict):
+                direction, destination = _exit_label(conn)
                 actions.append({
                     "action_type": "move",
                     "target": conn.get("direction", ""),
-                    "description": f"Go {conn.get('direction', '?')} to {conn.get('description', conn.get('target_location_id', '?'))}",
+                    "description": f"Go {direction} to {destination}",
                 })
         actions.append({"action_type": "search", "description": "Search the area"})
         return actions
 
     def _resolve_move(self, action: Action, context: GameContext) -> ActionResult:
         direction = (action.target_id or "").lower()
-        connections = safe_json(context.location.get("connections"), [])
-
-        target_conn = None
-        for conn in connections:
-            if isinstance(conn, dict):
-                if conn.get("direction", "").lower() == direction:
-                    target_conn = conn
-                    break
-                # Also match by location id
-                if conn.get("target_location_id", "").lower() == direction:
-                    target_conn = conn
-                    break
+        target_conn = _find_connection(json_view(context.location.get("connections"), []), direction)
 
         if not target_conn:
             # No existing connection — try dynamic location generation via Director
             if self._director and self._repos:
                 return self._try_dynamic_move(action, direction, context)
-            return ActionResult(
-                action_id=action.id, success=False,
-                outcome_description=f"You can't go '{direction}' from here.",
-            )
+            return _no_way(action, direction)
 
         if target_conn.get("is_locked"):
             return ActionResult(
@@ -103,12 +143,13 @@ class ExplorationSystem(GameSystem):
         ]
 
         # Move companions to new location
-        for comp in (context.companions or []):
-            if comp.get("status") == "active":
-                mutations.append(StateMutation(
-                    target_type="entity", target_id=comp["entity_id"],
-                    field="location_id", old_value=None, new_value=target_loc_id,
-                ))
+        mutations.extend(
+            StateMutation(
+                target_type="entity", target_id=comp["entity_id"],
+                field="location_id", old_value=None, new_value=target_loc_id,
+            )
+            for comp in context.companions if comp.get("status") == "active"
+        )
 
         # Check for bounty-related encounters when entering a town
         bounty_event = self._check_bounty_on_enter(target_loc_id, context)
@@ -125,127 +166,126 @@ class ExplorationSystem(GameSystem):
 
     def _try_dynamic_move(self, action: Action, direction: str, context: GameContext) -> ActionResult:
         """Attempt to discover a new path via the Director's plausibility engine."""
-        from text_rpg.systems.director.generators import plausibility_to_dc
-
+        # Only the Director calls (and reading their output) can fail —
+        # any failure there means no way through.
         try:
             # Evaluate plausibility of finding/creating a path this direction
             plausibility = self._director.evaluate_plausibility(action, context)
             if not isinstance(plausibility, dict):
                 plausibility = {"plausibility": 0.5}
-            dc = plausibility_to_dc(plausibility.get("plausibility", 0.5))
+            dc = self._plausibility_to_dc(plausibility.get("plausibility", 0.5))
 
             # Skill check — typically Survival or Perception for path-finding
             ability_name = plausibility.get("ability", "wisdom").lower()
             skill_name = plausibility.get("skill", "survival").lower()
+        except Exception as e:
+            logger.warning(f"Dynamic location generation failed: {e}")
+            return _no_way(action, direction)
 
-            char = context.character
-            scores = safe_json(char.get("ability_scores"), {})
-            ability_score = scores.get(ability_name, 10)
-
-            skill_profs = safe_json(char.get("skill_proficiencies"), [])
-            is_prof = skill_name in skill_profs
-
-            prof_bonus = char.get("proficiency_bonus", 2)
-            success, roll_result = skill_check(ability_score, prof_bonus, is_prof, dc)
-
-            dice_rolls = [DiceRoll(
-                dice_expression="1d20",
-                rolls=roll_result.individual_rolls,
-                modifier=roll_result.modifier,
-                total=roll_result.total,
-                purpose=f"{skill_name}_check (DC {dc})",
-            )]
-
-            # Record the skill check event for behavior tracking
-            skill_check_event = {
-                "event_type": "SKILL_CHECK",
-                "description": f"{skill_name} check (DC {dc}) — {'success' if success else 'failure'}",
-                "actor_id": char.get("id", ""),
-                "mechanical_details": {
-                    "skill": skill_name,
-                    "dc": dc,
-                    "success": success,
-                    "roll": roll_result.total,
-                },
-            }
+        char = context.character
+        scores = json_view(char.get("ability_scores"), {})
+        ability_score = scores.get(ability_name, 10)
+
+        skill_profs = json_view(char.get("skill_proficiencies"), [])
+        is_prof = skill_name in skill_profs
+
+        prof_bonus = char.get("proficiency_bonus", 2)
+        success, roll_result = skill_check(ability_score, prof_bonus, is_prof, dc)
+
+        dice_rolls = [DiceRoll(
+            dice_expression="1d20",
+            rolls=roll_result.individual_rolls,
+            modifier=roll_result.modifier,
+            total=roll_result.total,
+            purpose=f"{skill_name}_check (DC {dc})",
+        )]
 
-            if success:
-                # Generate and save new location
-                new_location = self._director.generate_location_for_direction(
-                    direction, context, self._repos,
-                )
-                if not new_location:
-                    return ActionResult(
-                        action_id=action.id, success=False,
-                        outcome_description=f"You search {direction} but find no viable path.",
-                        dice_rolls=dice_rolls,
-                    )
-
-                target_loc_id = new_location["id"]
-                return ActionResult(
-                    action_id=action.id, success=True,
-                    outcome_description=f"You discover a path leading {direction} to {new_location.get('name', 'a new area')}.",
-                    dice_rolls=dice_rolls,
-                    state_mutations=[
-                        StateMutation(target_type="game", target_id=context.game_id, field="current_location_id", old_value=context.location["id"], new_value=target_loc_id),
-                        StateMutation(target_type="location", target_id=target_loc_id, field="visited", old_value=False, new_value=True),
-                    ],
-                    events=[
-                        skill_check_event,
-                        {
-                            "event_type": "DISCOVERY",
-                            "description": f"Discovered a new path {direction} leading to {new_location.get('name', 'a new area')}.",
-                            "location_id": target_loc_id,
-                        },
-                    ],
-                )
-            else:
-                failure_desc = plausibility.get(
-                    "failure_description",
-                    f"You search {direction} but can't find a way through.",
-                )
-                return ActionResult(
-                    action_id=action.id, success=False,
-                    outcome_description=failure_desc,
-                    dice_rolls=dice_rolls,
-                    events=[
-                        skill_check_event,
-                        {
-                            "event_type": "EXPLORATION_FAIL",
-                            "description": f"Failed to find a path {direction}.",
-                        },
-                    ],
-                )
+        # Record the skill check event for behavior tracking
+        skill_check_event = {
+            "event_type": "SKILL_CHECK",
+            "description": f"{skill_name} check (DC {dc}) — {'success' if success else 'failure'}",
+            "actor_id": char.get("id", ""),
+            "mechanical_details": {
+                "skill": skill_name,
+                "dc": dc,
+                "success": success,
+                "roll": roll_result.total,
+            },
+        }
+
+        if not success:
+            failure_desc = plausibility.get(
+                "failure_description",
+                f"You search {direction} but can't find a way through.",
+            )
+            return ActionResult(
+                action_id=action.id, success=False,
+                outcome_description=failure_desc,
+                dice_rolls=dice_rolls,
+                events=[
+                    skill_check_event,
+                    {
+                        "event_type": "EXPLORATION_FAIL",
+                        "description": f"Failed to find a path {direction}.",
+                    },
+                ],
+            )
+
+        # Generate and save new location
+        try:
+            new_location = self._director.generate_location_for_direction(
+                direction, context, self._repos,
+            )
         except Exception as e:
             logger.warning(f"Dynamic location generation failed: {e}")
+            return _no_way(action, direction)
+        if not new_location:
             return ActionResult(
                 action_id=action.id, success=False,
-                outcome_description=f"You can't go '{direction}' from here.",
+                outcome_description=f"You search {direction} but find no viable path.",
+                dice_rolls=dice_rolls,
             )
 
+        target_loc_id = new_location["id"]
+        return ActionResult(
+            action_id=action.id, success=True,
+            outcome_description=f"You discover a path leading {direction} to {new_location.get('name', 'a new area')}.",
+            dice_rolls=dice_rolls,
+            state_mutations=[
+                StateMutation(target_type="game", target_id=context.game_id, field="current_location_id", old_value=context.location["id"], new_value=target_loc_id),
+                StateMutation(target_type="location", target_id=target_loc_id, field="visited", old_value=False, new_value=True),
+            ],
+            events=[
+                skill_check_event,
+                {
+                    "event_type": "DISCOVERY",
+                    "description": f"Discovered a new path {direction} leading to {new_location.get('name', 'a new area')}.",
+                    "location_id": target_loc_id,
+                },
+            ],
+        )
+
     def _check_bounty_on_enter(self, target_loc_id: str, context: GameContext) -> dict | None:
         """Check if entering a town triggers a guard confrontation due to bounty."""
         if not self._repos or not self._repos.get("reputation") or not self._repos.get("location"):
             return None
 
         try:
-            target_loc = self._repos["location"].get(target_loc_id, context.game_id)
+            target_loc = self._location_kind(target_loc_id, context.game_id)
             if not target_loc:
                 return None
 
-            loc_type = target_loc.get("location_type", "wilderness")
-            if loc_type not in ("town", "village", "settlement"):
+            loc_type, region_id = target_loc
+            if loc_type not in _TOWN_TYPES:
                 return None
 
-            region_id = target_loc.get("region_id", "")
             if not region_id:
                 return None
 
-            bounty = self._repos["reputation"].get_bounty(context.game_id, region_id)
-            if bounty.get("amount", 0) <= 0:
+            amount = self._repos["reputation"].get_bounty_amount(context.game_id, region_id)
+            if amount <= 0:
                 return None
 
-            amount = bounty["amount"]
             return {
                 "event_type": "GUARD_CONFRONTATION",
                 "description": (
@@ -260,11 +300,29 @@ class ExplorationSystem(GameSystem):
         except Exception:
             return None
 
+    def _location_kind(self, location_id: str, game_id: str) -> tuple[str | None, str | None] | None:
+        """A location's (type, region), queried once per location and kept in a bounded LRU.
+
+        Only the bounty can change between visits, so it's still read on
+        every entry — repeat moves just skip the location lookup.
+        """
+        key = (game_id, location_id)
+        kind = self._location_kinds.get(key)
+        if kind is None:
+            # Only the type and region matter — skip loading the full row
+            kind = self._repos["location"].get_type_and_region(location_id, game_id)
+            if kind is not None:
+                self._location_kinds[key] = kind
+                if len(self._location_kinds) > self._max_location_kinds:
+                    self._location_kinds.popitem(last=False)
+        else:
+            self._location_kinds.move_to_end(key)
+        return kind
+
     def _resolve_look(self, action: Action, context: GameContext) -> ActionResult:
         loc = context.location
-        entities = context.entities
-        entity_names = [e["name"] for e in entities if e.get("is_alive", True)]
-        items = safe_json(loc.get("items"), [])
+        entity_names = [e["name"] for e in context.alive_entities]
+        items = json_view(loc.get("items"), [])
 
         description = loc.get("description", "You see nothing notable.")
         parts = [description]
@@ -273,24 +331,27 @@ class ExplorationSystem(GameSystem):
         if items:
             parts.append(f"Items on the ground: {', '.join(items)}")
 
-        connections = safe_json(loc.get("connections"), [])
+        connections = json_view(loc.get("connections"), [])
         if connections:
             exits = []
             for c in connections:
                 if isinstance(c, dict):
-                    exits.append(f"{c.get('direction', '?')} ({c.get('description', c.get('target_location_id', '?'))})")
+                    direction, destination = _exit_label(c)
+                    exits.append(f"{direction} ({destination})")
             parts.append(f"Exits: {', '.join(exits)}")
 
         return ActionResult(action_id=action.id, success=True, outcome_description="\n".join(parts))
 
     def _resolve_search(self, action: Action, context: GameContext) -> ActionResult:
         char = context.character
-        scores = safe_json(char.get("ability_scores"), {})
-        skill_profs = safe_json(char.get("skill_proficiencies"), [])
+        scores = json_view(char.get("ability_scores"), {})
+        skill_profs = json_view(char.get("skill_proficiencies"), [])
 
         wis_score = scores.get("wisdom", 10)
         prof_bonus = char.get("proficiency_bonus", 2)
-        is_prof = "investigation" in skill_profs or "perception" in skill_profs
+        # Investigation is preferred when the character has both
+        search_skill = "investigation" if "investigation" in skill_profs else "perception"
+        is_prof = search_skill in skill_profs
 
         # Searching uses stealth-like awareness — size helps small creatures
         size_mod = stealth_modifier(char.get("size", "Medium"))
@@ -301,7 +362,6 @@ class ExplorationSystem(GameSystem):
             modifier=result.modifier, total=result.total, purpose="investigation_check",
         )]
 
-        search_skill = "investigation" if "investigation" in skill_profs else "perception"
         skill_event = {
             "event_type": "SKILL_CHECK",
             "description": f"{search_skill} check (DC 12) — {'success' if success else 'failure'}",
@@ -326,8 +386,9 @@ class ExplorationSystem(GameSystem):
     def _resolve_interact(self, action: Action, context: GameContext) -> ActionResult:
         target = action.target_id or ""
         # Check if target is an item on the ground
-        items = safe_json(context.location.get("items"), [])
-        if target.lower() in [i.lower() for i in items]:
+        items = json_view(context.location.get("items"), [])
+        target_lc = target.lower()
+        if any(i.lower() == target_lc for i in items):
             return ActionResult(
                 action_id=action.id, success=True,
                 outcome_description=f"You pick up {target}.",
@@ -1,7 +1,31 @@
 """Shared utility functions for the Text RPG."""
 from __future__ import annotations
 
+import functools
 import json
+from typing import Any
+
+try:  # Optional C-accelerated parser — install the "fast" extra
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def to_json_str(value) -> str:
+    """Serialize *value* to a compact JSON string for storage.
+
+    Uses orjson when installed (non-string dict keys are stringified, as the
+    stdlib does); falls back to the stdlib for values orjson rejects or when
+    it isn't available.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
 
 
 def safe_json(value, default=None):
@@ -14,12 +38,43 @@ def safe_json(value, default=None):
         return default if default is not None else {}
     if isinstance(value, str):
         try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return default if default is not None else {}
+            return _json_loads(value)
+        except (ValueError, TypeError):
+            pass
+        if _json_loads is not json.loads:
+            # orjson is stricter than the stdlib (e.g. NaN literals) — retry leniently
+            try:
+                return json.loads(value)
+            except (ValueError, TypeError):
+                pass
+        return default if default is not None else {}
     return value
 
 
+_INVALID = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_view(raw: str) -> Any:
+    return safe_json(raw, _INVALID)
+
+
+def json_view(value: Any, default: Any) -> Any:
+    """Read-only parsed view of a JSON column — never mutate the result.
+
+    Stored strings are parsed once per distinct value, so the same row read
+    by several prompts or triggers in a turn isn't re-parsed. Use safe_json
+    when the caller needs its own copy to modify.
+    """
+    if isinstance(value, str):
+        parsed = _parse_view(value)
+        return default if parsed is _INVALID else parsed
+    # Repo rows usually arrive already deserialized — hand them straight back
+    if value is not None:
+        return value
+    return default if default is not None else {}
+
+
 def safe_props(obj: dict) -> dict:
     """Safely extract and deserialize 'properties' from a DB row."""
     props = obj.get("properties") or {}
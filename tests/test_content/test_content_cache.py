@@ -0,0 +1,33 @@
+"""Tests for memoized content loading."""
+from __future__ import annotations
+
+from text_rpg.content import loader
+from text_rpg.mechanics import story_seeds
+
+
+class TestContentCache:
+    def test_repeat_loads_return_same_object(self):
+        assert loader.load_all_factions() is loader.load_all_factions()
+        assert loader.load_world_events() is loader.load_world_events()
+        assert loader.load_all_regions() is loader.load_all_regions()
+        assert loader.load_all_guilds() is loader.load_all_guilds()
+        assert story_seeds.load_all_seeds() is story_seeds.load_all_seeds()
+
+    def test_seed_map_matches_seed_list(self):
+        seed_map = story_seeds.load_seed_map()
+        assert set(seed_map) == {s["id"] for s in story_seeds.load_all_seeds()}
+
+    def test_guilds_by_profession_matches_guilds(self):
+        index = loader.load_guilds_by_profession()
+        for gid, gdata in loader.load_all_guilds().items():
+            assert gid in index[gdata["profession"]]
+
+    def test_reload_clears_caches(self):
+        factions = loader.load_all_factions()
+        seeds = story_seeds.load_all_seeds()
+        regions = loader.load_all_regions()
+        loader.reload()
+        assert loader.load_all_factions() is not factions
+        assert loader.load_all_regions() is not regions
+        assert loader.load_all_factions() == factions
+        assert story_seeds.load_all_seeds() is not seeds
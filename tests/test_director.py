@@ -0,0 +1,334 @@
+"""Tests for the Director's turn-level orchestration."""
+from __future__ import annotations
+
+import pytest
+
+from text_rpg.models.action import ActionResult
+from text_rpg.storage.repos.world_state_repo import StoryContext
+from text_rpg.systems.base import GameContext
+from text_rpg.systems.director import director as director_module
+from text_rpg.systems.director import triggers
+from text_rpg.systems.director.director import Director
+
+
+class FakeEntityRepo:
+    def __init__(self) -> None:
+        self.saved: list[dict] = []
+
+    def save(self, entity: dict) -> None:
+        self.saved.append(entity)
+
+
+def _make_context() -> GameContext:
+    return GameContext(
+        game_id="g1",
+        character={"id": "c1", "level": 3},
+        location={"id": "loc1"},
+        entities=[],
+        turn_number=10,
+        world_time=480,
+    )
+
+
+@pytest.fixture
+def director():
+    d = Director(llm=None, retriever=None, indexer=None)
+    yield d
+    d.close()
+
+
+class TestBackgroundPopulation:
+    def test_town_npc_saved_on_collect(self, director, monkeypatch):
+        monkeypatch.setattr(
+            director_module, "generate_npc",
+            lambda llm, ctx, loc, hints: {"id": "npc1", "name": "Mira", "level": 3, "hp_max": 12, "ac": 11},
+        )
+        repo = FakeEntityRepo()
+        location = {"id": "new_loc", "location_type": "village", "game_id": "g1"}
+        director._populate_new_location(location, _make_context(), {"entity": repo})
+
+        future, _ = director._pending_npcs["new_loc"]
+        future.result(timeout=5)
+        director._collect_background_npcs(_make_context(), {"entity": repo})
+
+        assert not director._pending_npcs
+        assert len(repo.saved) == 1
+        assert repo.saved[0]["location_id"] == "new_loc"
+        assert repo.saved[0]["game_id"] == "g1"
+
+    def test_wilderness_is_not_populated(self, director):
+        location = {"id": "wild", "location_type": "wilderness"}
+        director._populate_new_location(location, _make_context(), {"entity": FakeEntityRepo()})
+        assert not director._pending_npcs
+
+    def test_generation_failure_is_swallowed(self, director, monkeypatch):
+        def boom(*args):
+            raise RuntimeError("llm down")
+
+        monkeypatch.setattr(director_module, "generate_npc", boom)
+        repo = FakeEntityRepo()
+        director._populate_new_location(
+            {"id": "town", "location_type": "town"}, _make_context(), {"entity": repo},
+        )
+        director._pending_npcs["town"][0].exception(timeout=5)
+        director._collect_background_npcs(_make_context(), {"entity": repo})
+        assert not director._pending_npcs
+        assert repo.saved == []
+
+    def test_new_town_gets_exactly_one_npc(self, director, monkeypatch):
+        import threading
+
+        release = threading.Event()
+
+        def fake_generate_npc(llm, ctx, loc, hints):
+            release.wait(timeout=5)
+            return {"id": f"npc{len(repo.saved)}", "name": "Mira", "entity_type": "npc",
+                    "level": 3, "hp_max": 12, "ac": 11}
+
+        monkeypatch.setattr(director_module, "generate_npc", fake_generate_npc)
+        for name in ("should_enrich_location", "pacing_check",
+                     "should_offer_guild_recruitment", "should_spawn_arcane_location"):
+            monkeypatch.setattr(triggers, name, lambda *args: False)
+        repo = FakeEntityRepo()
+        repos = {"entity": repo}
+
+        def turn(number: int) -> None:
+            # As the turn loop does: the context is built from what's saved so far
+            context = GameContext(
+                game_id="g1",
+                character={"id": "c1", "level": 3},
+                location={"id": "new_town", "location_type": "town", "game_id": "g1"},
+                entities=[dict(e) for e in repo.saved],
+                turn_number=number,
+                world_time=480,
+            )
+            director._cooldowns("g1").quest = number
+            director._cooldowns("g1").region = number
+            director.evaluate(context, ActionResult(), repos)
+
+        # The move that generated the town queued its NPC in the background
+        director._populate_new_location(
+            {"id": "new_town", "location_type": "town", "game_id": "g1"}, _make_context(), repos,
+        )
+        turn(11)  # still generating
+        release.set()
+        director._pending_npcs["new_town"][0].result(timeout=5)
+        turn(12)  # collected at the start of evaluate, after the context was built
+        turn(13)
+
+        assert [e["location_id"] for e in repo.saved] == ["new_town"]
+
+    def test_close_cancels_queued_generations(self, director, monkeypatch):
+        import threading
+
+        release = threading.Event()
+        monkeypatch.setattr(
+            director_module, "generate_npc", lambda *args: release.wait(timeout=5) and {},
+        )
+        repos = {"entity": FakeEntityRepo()}
+        # One more town than there are pool workers, so the last one is still queued
+        for i in range(5):
+            director._populate_new_location(
+                {"id": f"town{i}", "location_type": "town"}, _make_context(), repos,
+            )
+        queued = director._pending_npcs["town4"][0]
+
+        threading.Timer(0.1, release.set).start()
+        director.close()
+
+        assert queued.cancelled()
+        assert not director._pending_npcs
+        with pytest.raises(RuntimeError):
+            director._background_pool.submit(print)
+
+
+class FakeWorldStateRepo:
+    def __init__(self) -> None:
+        self.quests: list[dict] = []
+
+    def save_quest(self, quest: dict) -> None:
+        self.quests.append(quest)
+
+
+class TestStoryQuestBatch:
+    def _job(self, seed_id: str) -> tuple:
+        seed = {"id": seed_id, "name": seed_id.title()}
+        story = {"resolved_variables": {"farmer": "Old Tom", "farmer_id": f"npc_{seed_id}"}}
+        template = {"type": "investigate", "target": "barn", "report_to": "farmer"}
+        return (seed, "development", story, template)
+
+    def test_events_returned_in_job_order(self, director, monkeypatch):
+        def fake_generate_quest(llm, ctx, npc):
+            return {"id": f"q_{npc['id']}", "name": f"Quest for {npc['id']}", "description": "d"}
+
+        monkeypatch.setattr(director_module, "generate_quest", fake_generate_quest)
+        repo = FakeWorldStateRepo()
+        results = director._generate_story_quests(
+            [self._job("alpha"), self._job("beta")], _make_context(), {"world_state": repo},
+        )
+        assert [r["target_id"] for r in results] == ["q_npc_alpha", "q_npc_beta"]
+        assert [q["quest_giver_id"] for q in repo.quests] == ["npc_alpha", "npc_beta"]
+
+    def test_one_failure_does_not_drop_others(self, director, monkeypatch):
+        def fake_generate_quest(llm, ctx, npc):
+            if npc["id"] == "npc_alpha":
+                raise ValueError("bad quest")
+            return {"id": "q2", "name": "Quest", "description": "d"}
+
+        monkeypatch.setattr(director_module, "generate_quest", fake_generate_quest)
+        repo = FakeWorldStateRepo()
+        results = director._generate_story_quests(
+            [self._job("alpha"), self._job("beta")], _make_context(), {"world_state": repo},
+        )
+        assert results[0] is None
+        assert results[1]["target_id"] == "q2"
+        assert len(repo.quests) == 1
+
+
+class TestNpcPrefetch:
+    def _town_context(self, turn: int, loc_id: str = "square") -> GameContext:
+        return GameContext(
+            game_id="g1",
+            character={"id": "c1", "level": 3},
+            location={"id": loc_id, "location_type": "town"},
+            entities=[],
+            turn_number=turn,
+            world_time=480,
+        )
+
+    def test_prefetch_used_on_next_turn(self, director, monkeypatch):
+        calls = []
+
+        def fake_generate_npc(llm, ctx, loc, hints):
+            calls.append(ctx.turn_number)
+            return {"id": "npc1", "name": "Mira", "level": 3, "hp_max": 12, "ac": 11}
+
+        monkeypatch.setattr(director_module, "generate_npc", fake_generate_npc)
+        director._cooldowns("g1").npc = 16  # cooldown of 5 expires on turn 21
+
+        director._maybe_prefetch_npc(self._town_context(20), {})
+        assert "g1" in director._prefetch
+
+        npc = director._take_prefetched_npc(self._town_context(21))
+        assert npc["name"] == "Mira"
+        assert calls == [20]
+        assert "g1" not in director._prefetch
+
+    def test_prefetch_discarded_after_moving(self, director, monkeypatch):
+        monkeypatch.setattr(
+            director_module, "generate_npc",
+            lambda llm, ctx, loc, hints: {"id": "npc1", "name": "Mira"},
+        )
+        director._cooldowns("g1").npc = 16
+        director._maybe_prefetch_npc(self._town_context(20), {})
+        assert director._take_prefetched_npc(self._town_context(21, loc_id="gate")) is None
+
+    def test_no_prefetch_when_cooldown_far_off(self, director):
+        director._cooldowns("g1").npc = 19
+        director._maybe_prefetch_npc(self._town_context(20), {})
+        assert not director._prefetch
+
+
+class TestGenerationPipeline:
+    @pytest.fixture(autouse=True)
+    def _quiet_triggers(self, monkeypatch):
+        for name in ("should_spawn_npc", "should_enrich_location", "pacing_check",
+                     "should_offer_guild_recruitment", "should_spawn_arcane_location"):
+            monkeypatch.setattr(triggers, name, lambda *args: False)
+
+    def _evaluate(self, director):
+        director._cooldowns("g1").region = 10
+        return director.evaluate(_make_context(), ActionResult(), {})
+
+    def test_priority_order_is_explicit(self, director):
+        assert [step[0] for step in director._pipeline] == [
+            "npc", "quest", "enrich", "pacing", "region", "guild", "arcane_location",
+        ]
+
+    def test_first_triggered_step_wins(self, director, monkeypatch):
+        monkeypatch.setattr(triggers, "should_offer_guild_recruitment", lambda c, r: True)
+        monkeypatch.setattr(triggers, "should_spawn_arcane_location", lambda c, r: True)
+        events = self._evaluate(director)
+        assert [e["mechanical_details"]["hint"] for e in events] == ["guild_recruitment_nearby"]
+        assert director._cooldowns("g1").guild == 10
+        assert director._cooldowns("g1").arcane_location == -999
+
+    def test_cooldown_skips_step(self, director, monkeypatch):
+        monkeypatch.setattr(triggers, "should_offer_guild_recruitment", lambda c, r: True)
+        monkeypatch.setattr(triggers, "should_spawn_arcane_location", lambda c, r: True)
+        director._cooldowns("g1").guild = 5
+        events = self._evaluate(director)
+        assert [e["mechanical_details"]["hint"] for e in events] == ["arcane_location_nearby"]
+
+    def test_cooldown_state_covers_every_type(self):
+        from dataclasses import fields
+
+        from text_rpg.systems.director.director import _COOLDOWNS, _CooldownState
+
+        assert {f.name for f in fields(_CooldownState)} == set(_COOLDOWNS)
+
+
+class FakeStoryRepo:
+    """Only the calls story progression is allowed to make — no get_story_state."""
+
+    def __init__(self, stories: list[dict]) -> None:
+        self.stories = stories
+        self.advanced: list[tuple] = []
+
+    def get_story_context(self, game_id):
+        return StoryContext(active_stories=self.stories)
+
+    def advance_beat_tx(self, *args):
+        self.advanced.append(args)
+
+
+class TestStoryAdvance:
+    def test_advance_uses_in_memory_story(self, director):
+        story = {
+            "seed_id": "harvest_festival",
+            "current_beat": "development",
+            "activated_beats": ["hook", "development"],
+            "beat_turn_numbers": {"hook": 2, "development": 10},
+            "quest_ids": ["q1"],
+        }
+        repo = FakeStoryRepo([story])
+        context = _make_context()
+        context.turn_number = 40
+        director._cooldowns("g1").story = 40
+
+        events = director._check_story_progression(context, {"world_state": repo})
+
+        assert [e["mechanical_details"]["beat_name"] for e in events] == ["escalation"]
+        assert repo.advanced == [(
+            "g1", "harvest_festival", "escalation",
+            ["hook", "development", "escalation"], ["q1"],
+            {"hook": 2, "development": 10, "escalation": 40},
+        )]
+        assert story["activated_beats"] == ["hook", "development"]
+
+
+class TestCooldownState:
+    def test_tracked_per_game(self, director):
+        director._cooldowns("g1").npc = 12
+        assert director._cooldowns("g2").npc == -999
+        assert not director._can_generate("npc", 14, "g1")
+        assert director._can_generate("npc", 14, "g2")
+
+    def test_least_recently_used_game_evicted(self, director):
+        director._max_cooldown_entries = 2
+        director._cooldowns("a").npc = 1
+        director._cooldowns("b").npc = 2
+        director._cooldowns("a")
+        director._cooldowns("c")
+        assert list(director._last_generation) == ["a", "c"]
+
+
+class TestSafeIndex:
+    def test_dispatches_to_queue(self, director, monkeypatch):
+        calls = []
+        monkeypatch.setitem(director._index_fns, "lore", lambda *a, **kw: calls.append((a, kw)))
+        director._safe_index("lore", "A grove", category="location")
+        assert calls == [(("A grove",), {"category": "location"})]
+
+    def test_errors_are_swallowed(self, director):
+        director._safe_index("unknown_kind", "text")
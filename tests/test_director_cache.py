@@ -0,0 +1,98 @@
+"""Tests for the Director's semantic response cache."""
+from __future__ import annotations
+
+import pytest
+
+from text_rpg.systems.base import GameContext
+from text_rpg.systems.director import cache as director_cache
+from text_rpg.systems.director import generators
+from text_rpg.systems.director.cache import SemanticCache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    director_cache.get_cache().clear()
+    director_cache.configure(None)
+    yield
+    director_cache.get_cache().clear()
+    director_cache.configure(None)
+
+
+class CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_structured(self, prompt, system_prompt=None, temperature=0.7, max_tokens=512):
+        self.calls += 1
+        return {"plausibility": 0.5, "skill": "athletics", "ability": "strength"}
+
+
+def _context(loc_id: str = "loc1", level: int = 3) -> GameContext:
+    return GameContext(
+        game_id="g1",
+        character={"id": "c1", "level": level},
+        location={"id": loc_id},
+        entities=[],
+        turn_number=1,
+    )
+
+
+def _fake_embed(text: str) -> list[float]:
+    return [1.0, 0.0] if "wall" in text else [0.0, 1.0]
+
+
+class TestSemanticCache:
+    def test_exact_repeat_skips_llm(self):
+        llm = CountingLLM()
+        first = generators.evaluate_plausibility(llm, "climb the wall", _context())
+        first["skill"] = "mutated"
+        second = generators.evaluate_plausibility(llm, "Climb  the WALL", _context())
+        assert llm.calls == 1
+        assert second["skill"] == "athletics"
+
+    def test_scope_must_match(self):
+        llm = CountingLLM()
+        generators.evaluate_plausibility(llm, "climb the wall", _context())
+        generators.evaluate_plausibility(llm, "climb the wall", _context(loc_id="loc2"))
+        generators.evaluate_plausibility(llm, "climb the wall", _context(level=4))
+        assert llm.calls == 3
+
+    def test_near_duplicate_hits_with_embeddings(self):
+        director_cache.configure(_fake_embed)
+        llm = CountingLLM()
+        generators.evaluate_plausibility(llm, "climb the wall", _context())
+        generators.evaluate_plausibility(llm, "scale the wall", _context())
+        generators.evaluate_plausibility(llm, "swim the moat", _context())
+        assert llm.calls == 2
+
+    def test_zero_vector_never_matches(self):
+        cache = SemanticCache(embed_fn=lambda text: [0.0, 0.0])
+        cache.store("t", (), "a", {"x": 1}, cache._embed("a"))
+        assert cache.lookup("t", (), "b", 0.9)[0] is None
+
+    def test_embeds_only_when_exact_match_misses(self):
+        embedded = []
+        cache = SemanticCache(embed_fn=lambda text: embedded.append(text) or _fake_embed(text))
+        cached, embedding = cache.lookup("t", (), "climb the wall", 0.9)
+        assert cached is None and embedded == []
+        cache.store("t", (), "climb the wall", {"x": 1}, embedding)
+        assert embedded == ["climb the wall"]
+        assert cache.lookup("t", (), "Climb the wall", 0.9)[0] == {"x": 1}
+        assert embedded == ["climb the wall"]
+        assert cache.lookup("t", (), "scale the wall", 0.9)[0] == {"x": 1}
+        assert embedded == ["climb the wall", "scale the wall"]
+
+    def test_failed_embedding_not_retried_on_store(self):
+        calls = []
+        cache = SemanticCache(embed_fn=lambda text: calls.append(text) or [0.0, 0.0])
+        cache.store("t", (), "a", {"x": 1}, None)
+        _, embedding = cache.lookup("t", (), "b", 0.9)
+        cache.store("t", (), "b", {"x": 2}, embedding)
+        assert calls == ["a", "b"]
+
+    def test_partitions_are_lru_bounded(self):
+        cache = SemanticCache(max_partitions=2)
+        for scope in ("a", "b", "c"):
+            cache.store("t", (scope,), "text", {"x": 1}, None)
+        assert cache.lookup("t", ("a",), "text", 0.9)[0] is None
+        assert cache.lookup("t", ("c",), "text", 0.9)[0] == {"x": 1}
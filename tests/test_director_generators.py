@@ -0,0 +1,149 @@
+"""Tests for Director generators — sync and async variants."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+from text_rpg.llm.provider import LLMProvider
+from text_rpg.systems.base import GameContext
+from text_rpg.systems.director import generators
+
+
+class RecordingLLM(LLMProvider):
+    """Sync-only provider; async calls go through the base-class thread fallback."""
+
+    def __init__(self, response: dict) -> None:
+        self.response = response
+        self.prompts: list[str] = []
+        self.system_prompts: list[str | None] = []
+
+    def generate(self, prompt, system_prompt=None, temperature=0.8, max_tokens=1024):
+        return ""
+
+    def generate_structured(self, prompt, system_prompt=None, temperature=0.7, max_tokens=512):
+        self.prompts.append(prompt)
+        self.system_prompts.append(system_prompt)
+        return dict(self.response)
+
+    def is_available(self):
+        return True
+
+    @property
+    def model_name(self):
+        return "recording"
+
+
+def _context() -> GameContext:
+    return GameContext(
+        game_id="g1",
+        character={"id": "c1", "name": "Ash", "level": 3},
+        location={"id": "loc1", "name": "Millbrook", "location_type": "village", "region_id": "verdant_reach"},
+        entities=[],
+        turn_number=10,
+    )
+
+
+class TestAsyncGenerators:
+    def test_async_npc_matches_sync(self):
+        llm = RecordingLLM({"name": "Mira", "description": "A herbalist."})
+        ctx = _context()
+        sync_npc = generators.generate_npc(llm, ctx, ctx.location, {})
+        async_npc = asyncio.run(generators.agenerate_npc(llm, ctx, ctx.location, {}))
+        assert llm.prompts[0] == llm.prompts[1]
+        assert async_npc["name"] == sync_npc["name"] == "Mira"
+        assert async_npc["faction_id"] == "verdant_reach_merchants"
+
+    def test_gather_runs_independent_generations(self):
+        llm = RecordingLLM({"name": "Thing", "description": "d"})
+        ctx = _context()
+
+        async def run():
+            return await asyncio.gather(
+                generators.agenerate_npc(llm, ctx, ctx.location, {}),
+                generators.agenerate_location(llm, ctx, "north", ctx.location),
+                generators.agenerate_quest(llm, ctx, {"id": "npc1", "name": "Mira"}),
+            )
+
+        npc, location, quest = asyncio.run(run())
+        assert len(llm.prompts) == 3
+        assert npc["name"] == location["name"] == quest["name"] == "Thing"
+
+
+class TestPromptPrefix:
+    def test_system_prompt_is_stable_across_contexts(self):
+        llm = RecordingLLM({"name": "Mira", "description": "A herbalist."})
+        ctx = _context()
+        other = GameContext(
+            game_id="g2",
+            character={"id": "c2", "name": "Bryn", "level": 9},
+            location={"id": "loc2", "name": "Frostgate", "location_type": "town", "region_id": "north"},
+            entities=[],
+            turn_number=99,
+        )
+        generators.generate_npc(llm, ctx, ctx.location, {})
+        generators.generate_npc(llm, other, other.location, {})
+        assert llm.system_prompts[0] is llm.system_prompts[1]
+        assert llm.prompts[0] != llm.prompts[1]
+        assert "Frostgate" in llm.prompts[1]
+        assert "Frostgate" not in llm.system_prompts[1]
+
+    def test_every_director_template_splits_cleanly(self):
+        for name in generators._PROMPTS_DIR.joinpath("director").glob("*.j2"):
+            system, prompt = generators._render_split(generators._tpl(f"director/{name.name}"))
+            assert system and prompt
+            assert "{{" not in system
+
+
+class TestGenerateRegion:
+    def _region(self, **levels):
+        llm = RecordingLLM({"name": "Ashfall", "description": "d", **levels})
+        ctx = _context()
+        region = generators.generate_region(llm, ctx, {"name": "Verdant Reach"}, 6, 10, [])
+        return llm, region
+
+    def test_schema_shows_numeric_placeholders(self):
+        llm, _ = self._region()
+        assert '"level_range_min": <int>' in llm.system_prompts[0]
+        assert '"level_range_min": 6' in llm.prompts[0]
+
+    def test_missing_levels_use_target_tier(self):
+        _, region = self._region()
+        assert (region["level_range_min"], region["level_range_max"]) == (6, 10)
+
+    def test_off_tier_levels_use_target_tier(self):
+        _, region = self._region(level_range_min=2, level_range_max="the target tier maximum level")
+        assert (region["level_range_min"], region["level_range_max"]) == (6, 10)
+        _, region = self._region(level_range_min=8, level_range_max=15)
+        assert (region["level_range_min"], region["level_range_max"]) == (8, 10)
+
+    def test_in_tier_levels_kept(self):
+        _, region = self._region(level_range_min=7, level_range_max=9)
+        assert (region["level_range_min"], region["level_range_max"]) == (7, 9)
+
+
+class TestOllamaMessages:
+    def test_system_prompt_is_a_plain_leading_message(self):
+        from text_rpg.llm.ollama_provider import OllamaProvider
+
+        messages = OllamaProvider()._messages("hi", "rules")
+        assert messages == [{"role": "system", "content": "rules"}, {"role": "user", "content": "hi"}]
+
+
+class TestFormatLocation:
+    def test_json_and_list_connections_match(self):
+        conns = [{"direction": "north"}, {"direction": "east"}, "junk"]
+        as_list = generators._format_location({"name": "Hub", "connections": conns})
+        as_json = generators._format_location({"name": "Hub", "connections": json.dumps(conns)})
+        assert as_list == as_json
+        assert as_list.endswith("Exits: north, east")
+
+
+class TestFormatters:
+    def test_entities_skip_dead(self):
+        entities = [{"name": "Mira", "description": "x" * 150}, {"name": "Ghost", "is_alive": False}]
+        assert generators._format_entities(entities) == f"- Mira: {'x' * 100}"
+        assert generators._format_entities(entities[1:]) == "None present."
+
+    def test_recent_events_capped_at_five(self):
+        events = [{"event_type": "MOVE", "description": f"step {i}"} for i in range(7)]
+        assert generators._format_recent_events(events).splitlines()[-1] == "- [MOVE] step 4"
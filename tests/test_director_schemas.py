@@ -1,6 +1,8 @@
 """Tests for Director schema validation — validate_region and NPC scaling."""
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from text_rpg.systems.director.schemas import validate_region, validate_npc
@@ -89,6 +91,21 @@ class TestValidateRegion:
         assert len(result["npcs"]) == 1
         assert result["npcs"][0]["name"] == "Bob"
 
+    def test_child_ids_are_unique_v4_uuids(self):
+        import uuid
+
+        data = {
+            "name": "Test",
+            "description": "Test",
+            "locations": [{"name": "A"}, {"name": "B", "id": "keep"}],
+            "npcs": [{"name": "Bob", "description": "d"}],
+        }
+        result = validate_region(data)
+        ids = [result["locations"][0]["id"], result["npcs"][0]["id"]]
+        assert result["locations"][1]["id"] == "keep"
+        assert len(set(ids)) == 2
+        assert all(uuid.UUID(i).version == 4 for i in ids)
+
     def test_non_list_locations_cleaned(self):
         data = {"name": "Test", "description": "Test", "locations": "not a list"}
         result = validate_region(data)
@@ -107,6 +124,41 @@ class TestValidateRegion:
         assert result["level_range_min"] == 5
         assert result["level_range_max"] == 10
 
+    def test_non_numeric_max_never_below_min(self):
+        result = validate_region({
+            "name": "X", "description": "d",
+            "level_range_min": 8, "level_range_max": "the target tier maximum level",
+        })
+        assert (result["level_range_min"], result["level_range_max"]) == (8, 8)
+
+
+class TestValidateNpc:
+    def test_ability_scores_clamped_and_defaulted(self):
+        data = {"name": "Bob", "description": "d", "ability_scores": {"strength": 99, "dexterity": "x", "wisdom": 0.5}}
+        scores = validate_npc(data)["ability_scores"]
+        assert scores["strength"] == 30
+        assert scores["dexterity"] == 10
+        assert scores["wisdom"] == 1
+        assert scores["charisma"] == 10
+
+    def test_out_of_range_hp_and_ac_fall_back(self):
+        result = validate_npc({"name": "Bob", "description": "d", "hp_max": 0, "ac": 31})
+        assert result["hp_max"] == result["hp_current"] == 10
+        assert result["ac"] == 10
+        assert validate_npc({"name": "Bob", "description": "d", "hp_max": 250.7, "ac": 15.2})["hp_max"] == 250
+
+    def test_extra_ability_keys_kept(self):
+        scores = {"strength": 40, "luck": 3}
+        result = validate_npc({"name": "Bob", "description": "d", "ability_scores": scores})
+        assert result["ability_scores"] is scores
+        assert scores["luck"] == 3
+        assert scores["strength"] == 30
+
+    def test_numeric_strings_accepted(self):
+        result = validate_npc({"name": "Bob", "description": "d", "hp_max": "18", "ac": "13",
+                               "ability_scores": {"strength": "16"}})
+        assert (result["hp_max"], result["ac"], result["ability_scores"]["strength"]) == (18, 13, 16)
+
 
 class TestNPCScaling:
     """Test _scale_npc_to_player function."""
@@ -203,3 +255,68 @@ class TestNPCScaling:
         npc = {"level": 1, "hp_max": 10, "hp_current": 10, "ac": 18}
         result = _scale_npc_to_player(npc, ctx)
         assert result["ac"] <= 20
+
+    def test_scale_kernel(self):
+        from text_rpg.systems.director.director import _scale_kernel
+
+        assert _scale_kernel(1, 4, 10, 12) == (40, 13)
+        assert _scale_kernel(10, 1, 5, 10) == (4, 10)
+        assert _scale_kernel(1, 20, 10, 19) == (200, 20)
+
+    def test_rare_spawn_threshold_is_two_percent(self):
+        from text_rpg.systems.director.director import _RARE_SPAWN_THRESHOLD
+
+        assert _RARE_SPAWN_THRESHOLD / (1 << 32) == pytest.approx(0.02, abs=1e-9)
+
+
+class TestDirectorSerialization:
+    """Test the director's direction and storage helpers."""
+
+    def test_reverse_direction(self):
+        from text_rpg.systems.director.director import _reverse_direction
+
+        assert _reverse_direction("North") == "south"
+        assert _reverse_direction("southeast") == "northwest"
+        assert _reverse_direction("sideways") == "back"
+
+    def test_serialize_location_copies_and_encodes(self):
+        from text_rpg.systems.director.director import _serialize
+
+        data = {"id": "loc1", "connections": [{"direction": "north"}], "items": "[]", "entities": None}
+        out = _serialize("location", data, copy=True)
+        assert json.loads(out["connections"]) == [{"direction": "north"}]
+        assert out["items"] == "[]"
+        assert out["entities"] is None
+        assert data["connections"] == [{"direction": "north"}]
+
+
+class TestCompiledDefaults:
+    def test_mutable_defaults_are_fresh(self):
+        a = validate_npc({"name": "A", "description": "d"})
+        b = validate_npc({"name": "B", "description": "d"})
+        a["attacks"].append("bite")
+        assert b["attacks"] == []
+        assert a["id"] != b["id"]
+
+    def test_existing_values_kept(self):
+        from text_rpg.systems.director.schemas import validate_quest
+
+        quest = validate_quest({"name": "Q", "description": "d", "id": "q1", "status": None,
+                                "objectives": [{"id": "o1"}]})
+        assert quest["id"] == "q1"
+        assert quest["status"] is None
+        assert quest["objectives"][0] == {
+            "id": "o1", "description": "Complete the objective", "is_complete": False,
+            "required_count": 1, "current_count": 0, "negotiable": False,
+        }
+
+    def test_region_id_uses_underscores(self):
+        assert "-" not in validate_region({"name": "R", "description": "d"})["id"]
+
+    def test_serialize_in_place(self):
+        from text_rpg.systems.director.director import _serialize
+
+        data = {"id": "q1", "objectives": [{"id": "o1"}], "item_rewards": "[]"}
+        assert _serialize("quest", data) is data
+        assert json.loads(data["objectives"]) == [{"id": "o1"}]
+        assert data["item_rewards"] == "[]"
@@ -1,10 +1,54 @@
-"""Tests for Director trigger functions — should_reveal_new_region."""
+"""Tests for Director trigger functions."""
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from text_rpg.systems.base import GameContext
-from text_rpg.systems.director.triggers import should_reveal_new_region
+from text_rpg.systems.director import triggers
+from text_rpg.systems.director.triggers import (
+    TriggerCtx,
+    pacing_check,
+    should_enrich_location,
+    should_generate_location,
+    should_offer_guild_recruitment,
+    should_offer_quest,
+    should_spawn_arcane_location,
+    should_spawn_bounty_hunter,
+    should_spawn_guild_trainer,
+    should_reveal_new_region,
+    should_spawn_npc,
+)
+
+
+class FakeTradeRepo:
+    def __init__(self, skills: list[dict]):
+        self._skills = skills
+
+    def get_skills(self, game_id: str, char_id: str) -> list[dict]:
+        return self._skills
+
+
+class FakeGuildRepo:
+    def __init__(self, guild_ids: list[str]):
+        self._guild_ids = guild_ids
+
+        self.calls = 0
+
+    def get_memberships(self, game_id: str, char_id: str) -> list[dict]:
+        self.calls += 1
+        return [{"guild_id": gid} for gid in self._guild_ids]
+
+
+class FakeSpellCreationRepo:
+    def __init__(self, discoveries: int):
+        self.discoveries = discoveries
+        self.calls = 0
+
+    def count_discoveries(self, game_id: str, char_id: str) -> int:
+        self.calls += 1
+        return self.discoveries
 
 
 class FakeLocationRepo:
@@ -19,6 +63,13 @@ class FakeLocationRepo:
     def get_all(self, game_id: str) -> list[dict]:
         return list(self._locations)
 
+    def get_visited_summary(self, game_id: str) -> dict[str, tuple[int, int]]:
+        summary: dict[str, tuple[int, int]] = {}
+        for loc in self._locations:
+            visited, total = summary.get(loc.get("region_id"), (0, 0))
+            summary[loc.get("region_id")] = (visited + bool(loc.get("visited")), total + 1)
+        return summary
+
 
 def _make_context(
     player_level: int = 1,
@@ -140,3 +191,141 @@ class TestShouldRevealNewRegion:
         repo = FakeLocationRepo(locations)
         ctx = _make_context(player_level=5)
         assert not should_reveal_new_region(ctx, {"location": repo}, ALL_REGIONS)
+
+
+class TestShouldGenerateLocation:
+    @pytest.mark.parametrize("encode", [list, json.dumps])
+    def test_existing_exit_is_case_insensitive(self, encode):
+        conns = [{"direction": "North", "target_location_id": "a"}, "junk"]
+        ctx = GameContext(
+            game_id="g1", character={}, entities=[], turn_number=1,
+            location={"id": "loc1", "connections": encode(conns)},
+        )
+        assert not should_generate_location("north", ctx)
+        assert not should_generate_location("NORTH", ctx)
+        assert should_generate_location("east", ctx)
+
+    def test_missing_or_invalid_connections(self):
+        for conns in (None, "not json"):
+            ctx = GameContext(
+                game_id="g1", character={}, entities=[], turn_number=1,
+                location={"id": "loc1", "connections": conns},
+            )
+            assert should_generate_location("north", ctx)
+
+
+class TestTriggerCtx:
+    def _ctx(self, **overrides) -> TriggerCtx:
+        base = dict(
+            game_id="g1",
+            character={"id": "c1", "level": 3},
+            location={"id": "loc1", "location_type": "town", "visited": True},
+            entities=[],
+            turn_number=20,
+        )
+        base.update(overrides)
+        return TriggerCtx.from_context(GameContext(**base))
+
+    def test_from_context_derives_counts(self):
+        tctx = self._ctx(
+            entities=[
+                {"entity_type": "npc", "is_alive": True},
+                {"entity_type": "npc", "is_alive": False},
+                {"entity_type": "creature", "is_alive": True},
+            ],
+            active_quests=[
+                {"quest_giver_id": "npc1", "status": "active"},
+                {"quest_giver_id": "npc2", "status": "completed"},
+            ],
+        )
+        assert tctx.alive_npc_count == 1
+        assert tctx.alive_entity_count == 2
+        assert tctx.quest_giver_ids == frozenset({"npc1"})
+
+    def test_is_frozen(self):
+        with pytest.raises(AttributeError):
+            self._ctx().turn = 5
+
+    def test_empty_town_spawns_npc(self):
+        assert should_spawn_npc(self._ctx(), {})
+
+    def test_lingering_without_dialogue_spawns_npc(self):
+        wilds = {"id": "loc1", "location_type": "forest"}
+        here = [{"event_type": "MOVE", "location_id": "loc1"}] * 3
+        elsewhere = [{"event_type": "DIALOGUE", "location_id": "loc2"}]
+        talked = [{"event_type": "DIALOGUE", "location_id": "loc1"}]
+        assert should_spawn_npc(self._ctx(location=wilds, recent_events=here + elsewhere), {})
+        assert not should_spawn_npc(self._ctx(location=wilds, recent_events=here[:2]), {})
+        assert not should_spawn_npc(self._ctx(location=wilds, recent_events=here + talked), {})
+
+    def test_quest_not_offered_twice(self):
+        npc = {"id": "npc1", "properties": {"quest_hook": "lost cat"}}
+        busy = self._ctx(active_quests=[{"quest_giver_id": "npc1", "status": "available"}])
+        assert not should_offer_quest(npc, busy)
+        assert should_offer_quest(npc, self._ctx())
+
+    def test_enrich_empty_visited_location(self):
+        assert should_enrich_location(self._ctx())
+        assert not should_enrich_location(self._ctx(entities=[{"is_alive": True}]))
+
+    def test_pacing_every_ten_turns(self):
+        assert pacing_check(self._ctx(turn_number=20))
+        assert not pacing_check(self._ctx(turn_number=21))
+
+    def test_recruitment_for_skilled_non_member(self):
+        from text_rpg.content.loader import load_guilds_by_profession
+        smithing_guild = load_guilds_by_profession()["smithing"][0]
+        skilled = FakeTradeRepo([{"skill_name": "smithing", "level": 3, "is_learned": True}])
+        novice = FakeTradeRepo([{"skill_name": "smithing", "level": 2, "is_learned": True}])
+        assert should_offer_guild_recruitment(
+            self._ctx(), {"trade_skill": skilled, "guild": FakeGuildRepo([])})
+        assert not should_offer_guild_recruitment(
+            self._ctx(), {"trade_skill": skilled, "guild": FakeGuildRepo([smithing_guild])})
+        assert not should_offer_guild_recruitment(
+            self._ctx(), {"trade_skill": novice, "guild": FakeGuildRepo([])})
+
+    def test_memberships_fetched_once_per_turn(self):
+        guild_repo = FakeGuildRepo(["smiths_guild"])
+        tctx = self._ctx()
+        assert tctx.memberships(guild_repo) == tctx.memberships(guild_repo)
+        assert guild_repo.calls == 1
+        assert self._ctx().memberships(guild_repo)
+        assert guild_repo.calls == 2
+
+    def test_guild_trainer_needs_membership_and_no_trainer(self):
+        ctx = GameContext(
+            game_id="g1", character={"id": "c1"}, entities=[], turn_number=1,
+            location={"id": "loc1", "location_type": "town"},
+        )
+        assert should_spawn_guild_trainer(ctx, {"guild": FakeGuildRepo(["smiths_guild"])})
+        assert not should_spawn_guild_trainer(ctx, {"guild": FakeGuildRepo([])})
+        ctx.entities.append({"is_alive": True, "properties": {"teaches": "smithing"}})
+        guild_repo = FakeGuildRepo(["smiths_guild"])
+        assert not should_spawn_guild_trainer(ctx, {"guild": guild_repo})
+        assert guild_repo.calls == 0
+
+    def test_bounty_hunter_chance_scales_with_bounty(self, monkeypatch):
+        monkeypatch.setattr(triggers, "_random", lambda: 0.4)
+        road = GameContext(
+            game_id="g1", character={}, entities=[], turn_number=1,
+            location={"id": "loc1", "location_type": "road"},
+        )
+        town = GameContext(
+            game_id="g1", character={}, entities=[], turn_number=1,
+            location={"id": "loc1", "location_type": "town"},
+        )
+        assert not should_spawn_bounty_hunter(road, 40)
+        assert not should_spawn_bounty_hunter(road, 60)  # 30% chance
+        assert should_spawn_bounty_hunter(road, 90)  # 45% chance
+        assert should_spawn_bounty_hunter(road, 5000)  # capped at 50%
+        assert not should_spawn_bounty_hunter(town, 5000)
+
+    def test_repo_triggers_evaluate_once_per_turn(self):
+        repo = FakeSpellCreationRepo(3)
+        tctx = self._ctx()
+        assert should_spawn_arcane_location(tctx, {"spell_creation": repo})
+        repo.discoveries = 0
+        assert should_spawn_arcane_location(tctx, {"spell_creation": repo})
+        assert repo.calls == 1
+        assert not should_spawn_arcane_location(self._ctx(), {"spell_creation": repo})
+        assert repo.calls == 2
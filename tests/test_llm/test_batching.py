@@ -0,0 +1,126 @@
+"""Tests for src/text_rpg/llm/batching.py."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from text_rpg.llm.batching import BatchingLLM
+from text_rpg.llm.provider import LLMProvider
+
+
+class ScriptedLLM(LLMProvider):
+    """Answers batch prompts with the given 'answers' list, single prompts with {'solo': prompt}."""
+
+    def __init__(self, answers: list | None = None) -> None:
+        self.answers = answers
+        self.calls: list[tuple[str, str | None, int]] = []
+
+    def generate(self, prompt, system_prompt=None, temperature=0.8, max_tokens=1024):
+        return ""
+
+    def generate_structured(self, prompt, system_prompt=None, temperature=0.7, max_tokens=512):
+        self.calls.append((prompt, system_prompt, max_tokens))
+        if prompt.startswith("You are completing"):
+            return {"answers": self.answers}
+        return {"solo": prompt}
+
+    def is_available(self):
+        return True
+
+    @property
+    def model_name(self):
+        return "scripted"
+
+
+def _numbered(*answers) -> list[dict]:
+    return [{"task": i, "answer": a} for i, a in enumerate(answers, 1)]
+
+
+@pytest.fixture
+def make_batcher():
+    batchers = []
+
+    def make(inner, **kwargs):
+        b = BatchingLLM(inner, **kwargs)
+        batchers.append(b)
+        return b
+
+    yield make
+    for b in batchers:
+        b.close()
+
+
+class TestBatchingLLM:
+    def test_full_batch_is_one_call(self, make_batcher):
+        inner = ScriptedLLM(answers=_numbered({"n": 1}, {"n": 2}, {"n": 3}))
+        llm = make_batcher(inner, max_batch=3, max_wait=10)
+        futures = [llm.submit(f"task {i}", "schema") for i in range(3)]
+        assert [f.result(timeout=5) for f in futures] == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert len(inner.calls) == 1
+        prompt, system, max_tokens = inner.calls[0]
+        assert prompt.count("schema") == 1
+        assert "### Task 3 (Format 1)" in prompt
+        assert max_tokens == 3 * 512
+
+    def test_timer_flushes_partial_batch(self, make_batcher):
+        inner = ScriptedLLM(answers=_numbered({"n": 1}, {"n": 2}))
+        llm = make_batcher(inner, max_batch=8, max_wait=0.01)
+        futures = [llm.submit("a"), llm.submit("b")]
+        assert [f.result(timeout=5) for f in futures] == [{"n": 1}, {"n": 2}]
+
+    def test_lone_request_forwarded_unchanged(self, make_batcher):
+        inner = ScriptedLLM()
+        llm = make_batcher(inner, max_wait=0.01)
+        assert llm.generate_structured("just me", "schema") == {"solo": "just me"}
+        assert inner.calls == [("just me", "schema", 512)]
+
+    def test_missing_answer_retried_alone(self, make_batcher):
+        inner = ScriptedLLM(answers=_numbered({"n": 1}, "garbage"))
+        llm = make_batcher(inner, max_batch=2, max_wait=10)
+        first, second = llm.submit("a"), llm.submit("b")
+        assert first.result(timeout=5) == {"n": 1}
+        assert second.result(timeout=5) == {"solo": "b"}
+
+    def test_blocking_callers_share_a_batch(self, make_batcher):
+        inner = ScriptedLLM(answers=_numbered({"n": 1}, {"n": 2}))
+        llm = make_batcher(inner, max_batch=2, max_wait=10)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(llm.generate_structured, ["a", "b"]))
+        assert sorted(r["n"] for r in results) == [1, 2]
+        assert len(inner.calls) == 1
+
+    def test_answers_routed_by_task_number(self, make_batcher):
+        inner = ScriptedLLM(answers=[{"task": 2, "answer": {"n": 2}}, {"task": 1, "answer": {"n": 1}}])
+        llm = make_batcher(inner, max_batch=2, max_wait=10)
+        first, second = llm.submit("a"), llm.submit("b")
+        assert first.result(timeout=5) == {"n": 1}
+        assert second.result(timeout=5) == {"n": 2}
+        assert len(inner.calls) == 1
+
+    def test_dropped_or_misnumbered_answers_retried(self, make_batcher):
+        # Task 2's answer is missing; task 3's number appears twice, so neither copy is trusted
+        inner = ScriptedLLM(answers=[
+            {"task": 1, "answer": {"n": 1}},
+            {"task": 3, "answer": {"n": 3}},
+            {"task": 3, "answer": {"n": 2}},
+            {"task": 9, "answer": {"n": 9}},
+            {"answer": {"n": 0}},
+        ])
+        llm = make_batcher(inner, max_batch=3, max_wait=10)
+        futures = [llm.submit(p) for p in ("a", "b", "c")]
+        assert [f.result(timeout=5) for f in futures] == [{"n": 1}, {"solo": "b"}, {"solo": "c"}]
+
+    def test_batch_capped_by_context_window(self, make_batcher):
+        inner = ScriptedLLM(answers=_numbered({"n": 1}, {"n": 2}))
+        llm = make_batcher(inner, max_batch=8, max_wait=10, context_tokens=2500)
+        futures = [llm.submit(p, max_tokens=1000) for p in ("a", "b", "c")]
+        # Two 1000-token answers fit in 2500; the third starts a new batch
+        assert [f.result(timeout=5) for f in futures[:2]] == [{"n": 1}, {"n": 2}]
+        assert inner.calls[0][2] == 2000
+        llm.close()
+
+    def test_context_window_defaults_to_provider(self, make_batcher):
+        inner = ScriptedLLM()
+        inner.num_ctx = 8192
+        assert make_batcher(inner)._budget.max_context_tokens == 8192
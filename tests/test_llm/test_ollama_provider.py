@@ -0,0 +1,16 @@
+"""Tests for src/text_rpg/llm/ollama_provider.py."""
+from __future__ import annotations
+
+from text_rpg.llm.ollama_provider import OllamaProvider, _take_json_object
+
+
+class TestStreamedJson:
+    def test_stops_at_closing_brace(self):
+        deltas = iter(['Sure! ```json\n{"name": "Mi', 'ra", "tags": ["a}"', '], "x": {"y": 1}}', "\n``` Hope", "!"])
+        text = _take_json_object(deltas)
+        assert text.endswith('{"y": 1}}')
+        assert next(deltas) == "\n``` Hope"
+
+    def test_escaped_quotes_and_unclosed_fence_parse(self):
+        text = _take_json_object(['```json\n{"say": "he said \\"}\\" loudly"}', " trailing"])
+        assert OllamaProvider()._parse_json(text) == {"say": 'he said "}" loudly'}
@@ -0,0 +1,142 @@
+"""Tests for src/text_rpg/llm/semantic_cache.py."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from text_rpg.llm.provider import LLMProvider
+from text_rpg.llm.semantic_cache import CachedLLMProvider, InMemoryEmbeddingCache
+
+
+class CountingLLM(LLMProvider):
+    def __init__(self, response: dict | None = None) -> None:
+        self.calls = 0
+        self.response = {"name": "Mira"} if response is None else response
+
+    def generate(self, prompt, system_prompt=None, temperature=0.8, max_tokens=1024):
+        self.calls += 1
+        return "text"
+
+    def generate_structured(self, prompt, system_prompt=None, temperature=0.7, max_tokens=512):
+        self.calls += 1
+        return dict(self.response)
+
+    def is_available(self):
+        return True
+
+    @property
+    def model_name(self):
+        return "fake"
+
+
+class TestCachedLLMProvider:
+    def test_exact_repeat_hits_cache(self):
+        inner = CountingLLM()
+        llm = CachedLLMProvider(inner)
+        assert llm.generate_structured("prompt") == {"name": "Mira"}
+        assert llm.generate_structured("prompt") == {"name": "Mira"}
+        assert inner.calls == 1
+        assert llm.hits == 1
+
+    def test_different_params_miss(self):
+        inner = CountingLLM()
+        llm = CachedLLMProvider(inner)
+        llm.generate_structured("prompt", temperature=0.7)
+        llm.generate_structured("prompt", temperature=0.9)
+        assert inner.calls == 2
+
+    def test_returns_independent_copies(self):
+        llm = CachedLLMProvider(CountingLLM())
+        first = llm.generate_structured("prompt")
+        first["id"] = "mutated"
+        assert "id" not in llm.generate_structured("prompt")
+
+    def test_empty_response_not_cached(self):
+        inner = CountingLLM(response={})
+        llm = CachedLLMProvider(inner)
+        llm.generate_structured("prompt")
+        llm.generate_structured("prompt")
+        assert inner.calls == 2
+
+    def test_free_text_not_cached(self):
+        inner = CountingLLM()
+        llm = CachedLLMProvider(inner)
+        llm.generate("prompt")
+        llm.generate("prompt")
+        assert inner.calls == 2
+
+    def test_semantic_match_above_threshold(self):
+        vectors = {"a": [1.0, 0.0], "b": [0.99, 0.05], "c": [0.0, 1.0]}
+        inner = CountingLLM()
+        llm = CachedLLMProvider(inner, threshold=0.95, embed_fn=vectors.__getitem__)
+        llm.generate_structured("a")
+        llm.generate_structured("b")
+        assert inner.calls == 1
+        llm.generate_structured("c")
+        assert inner.calls == 2
+
+    def test_zero_vector_never_matches(self):
+        inner = CountingLLM()
+        llm = CachedLLMProvider(inner, embed_fn=lambda text: [0.0, 0.0])
+        llm.generate_structured("a")
+        llm.generate_structured("b")
+        assert inner.calls == 2
+
+
+class TestInMemoryEmbeddingCache:
+    def test_lru_eviction(self):
+        cache = InMemoryEmbeddingCache(maxsize=2)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+        cache.get("a")
+        cache.put("c", {"v": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        import text_rpg.llm.semantic_cache as mod
+
+        now = [100.0]
+        monkeypatch.setattr(mod.time, "monotonic", lambda: now[0])
+        cache = InMemoryEmbeddingCache(ttl_seconds=10)
+        cache.put("a", {"v": 1})
+        now[0] = 111.0
+        assert cache.get("a") is None
+
+
+class TestInFlightDedup:
+    def test_concurrent_identical_requests_share_one_call(self):
+        release = threading.Event()
+
+        class SlowLLM(CountingLLM):
+            def generate_structured(self, prompt, system_prompt=None, temperature=0.7, max_tokens=512):
+                release.wait(timeout=5)
+                return super().generate_structured(prompt, system_prompt, temperature, max_tokens)
+
+        inner = SlowLLM()
+        llm = CachedLLMProvider(inner)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(llm.generate_structured, "same prompt") for _ in range(3)]
+            while not llm._inflight:
+                pass
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert inner.calls == 1
+        assert results == [{"name": "Mira"}] * 3
+        results[0]["name"] = "mutated"
+        assert results[1]["name"] == "Mira"
+        assert not llm._inflight
+
+    def test_failure_propagates_and_clears(self):
+        class BrokenLLM(CountingLLM):
+            def generate_structured(self, *args, **kwargs):
+                raise RuntimeError("down")
+
+        llm = CachedLLMProvider(BrokenLLM())
+        with pytest.raises(RuntimeError):
+            llm.generate_structured("p")
+        assert not llm._inflight
@@ -0,0 +1,92 @@
+"""Tests for mechanics/story_seeds.py — beat triggers."""
+from __future__ import annotations
+
+from text_rpg.mechanics.story_seeds import (
+    TriggerState,
+    check_beat_trigger,
+    eligible_seed_ids,
+    load_all_seeds,
+    select_seed,
+)
+
+
+class TestCheckBeatTrigger:
+    def test_turn_range_inside(self):
+        beat = {"trigger_type": "turn_range", "trigger_min": 10, "trigger_max": 20}
+        assert check_beat_trigger(beat, TriggerState(turn_number=15))
+
+    def test_turn_range_outside(self):
+        beat = {"trigger_type": "turn_range", "trigger_min": 10, "trigger_max": 20}
+        assert not check_beat_trigger(beat, TriggerState(turn_number=25))
+
+    def test_turn_offset_from_previous_beat(self):
+        beat = {"trigger_type": "turn_offset", "trigger_value": 10}
+        state = TriggerState(
+            turn_number=14, current_beat="development",
+            beat_turn_numbers={"hook": 5},
+        )
+        assert not check_beat_trigger(beat, state)
+        state.turn_number = 15
+        assert check_beat_trigger(beat, state)
+
+    def test_hook_quest_complete(self):
+        beat = {"trigger_type": "quest_complete", "trigger_value": "hook_quest"}
+        state = TriggerState(quest_ids=["q1"], completed_quest_ids=["q0"])
+        assert not check_beat_trigger(beat, state)
+        state.completed_quest_ids = ["q0", "q1"]
+        assert check_beat_trigger(beat, state)
+
+    def test_specific_quest_complete(self):
+        beat = {"trigger_type": "quest_complete", "trigger_value": "q7"}
+        assert check_beat_trigger(beat, TriggerState(completed_quest_ids=["q7"]))
+
+    def test_unknown_trigger_type(self):
+        assert not check_beat_trigger({"trigger_type": "moon_phase"}, TriggerState())
+
+    def test_state_is_slotted(self):
+        assert not hasattr(TriggerState(), "__dict__")
+
+
+class TestSelectSeed:
+    def _seeds(self):
+        return [
+            {"id": "a", "level_range": [1, 20], "incompatible_tags": ["war"]},
+            {"id": "b", "level_range": [1, 20], "incompatible_tags": []},
+        ]
+
+    def test_skips_completed(self):
+        result = select_seed(self._seeds(), {"character_level": 3}, completed_ids=["b"])
+        assert result["id"] == "a"
+
+    def test_skips_incompatible_tags(self):
+        result = select_seed(self._seeds(), {"character_level": 3}, active_tags=["war"])
+        assert result["id"] == "b"
+
+    def test_loaded_seeds_have_precompiled_tag_sets(self):
+        seeds = load_all_seeds()
+        assert seeds
+        assert all(isinstance(s["_incompatible_tags_set"], frozenset) for s in seeds)
+        assert all(len(s["_level_bounds"]) == 2 for s in seeds)
+
+    def test_level_bounds_respected(self):
+        seeds = [{"id": "low", "level_range": [1, 3]}, {"id": "high", "level_range": [8, 12]}]
+        assert select_seed(seeds, {"character_level": 10})["id"] == "high"
+        assert select_seed(seeds, {"character_level": 5}) is None
+
+    def test_no_eligible_returns_none(self):
+        assert select_seed(self._seeds(), {"character_level": 3}, completed_ids=["a", "b"]) is None
+
+
+class TestEligibleSeedIds:
+    def test_excludes_completed_and_out_of_level(self):
+        low = {
+            s["id"] for s in load_all_seeds()
+            if s.get("level_range", [1, 20])[0] <= 1 <= s.get("level_range", [1, 20])[1]
+        }
+        some_id = next(iter(low))
+        result = eligible_seed_ids(frozenset({some_id}), 1)
+        assert result == low - {some_id}
+
+    def test_empty_when_everything_completed(self):
+        all_ids = frozenset(s["id"] for s in load_all_seeds())
+        assert eligible_seed_ids(all_ids, 5) == frozenset()
@@ -0,0 +1,100 @@
+"""Tests for rag/index_queue.py and Indexer.index_many."""
+from __future__ import annotations
+
+import threading
+
+from text_rpg.rag.index_queue import IndexerQueue
+from text_rpg.rag.indexer import Indexer
+
+
+class FakeIndexer:
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.batches: list[list[tuple[str, tuple]]] = []
+        self.gate = gate
+
+    def index_many(self, entries):
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.batches.append(list(entries))
+
+
+class FakeEmbeddings:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def is_available(self) -> bool:
+        return True
+
+    def embed_batch(self, texts):
+        self.calls.append(list(texts))
+        return [[0.1, 0.2] for _ in texts]
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.added: list[tuple] = []
+
+    def add_documents(self, collection, documents, metadatas, ids, embeddings=None):
+        self.added.append((collection, documents, metadatas))
+
+
+class TestIndexerQueue:
+    def test_entries_reach_indexer(self):
+        fake = FakeIndexer()
+        q = IndexerQueue(fake)
+        q.index_lore("A hidden grove", "location", {"game_id": "g1"})
+        q.index_npc_fact("g1", "npc1", "Mira", "sells herbs")
+        q.close()
+        entries = [e for batch in fake.batches for e in batch]
+        assert entries == [
+            ("lore", ("A hidden grove", "location", {"game_id": "g1"})),
+            ("npc_fact", ("g1", "npc1", "Mira", "sells herbs")),
+        ]
+
+    def test_backlog_is_batched(self):
+        gate = threading.Event()
+        fake = FakeIndexer(gate)
+        q = IndexerQueue(fake, batch_size=4)
+        for i in range(9):
+            q.index_event("g1", "TEST", f"event {i}")
+        gate.set()
+        q.close()
+        assert sum(len(b) for b in fake.batches) == 9
+        assert all(len(b) <= 4 for b in fake.batches)
+        assert len(fake.batches) < 9
+
+    def test_failure_does_not_stop_consumer(self):
+        class Flaky(FakeIndexer):
+            def index_many(self, entries):
+                if not self.batches:
+                    self.batches.append([])
+                    raise RuntimeError("store down")
+                super().index_many(entries)
+
+        fake = Flaky()
+        q = IndexerQueue(fake)
+        q.index_lore("first", "lore")
+        q.flush()
+        q.index_lore("second", "lore")
+        q.close()
+        assert fake.batches[-1] == [("lore", ("second", "lore", None))]
+
+    def test_none_indexer_is_noop(self):
+        q = IndexerQueue(None)
+        q.index_lore("ignored", "lore")
+        q.close()
+
+
+class TestIndexMany:
+    def test_groups_by_collection_with_one_embed_call_each(self):
+        embeddings, store = FakeEmbeddings(), FakeStore()
+        indexer = Indexer(store, embeddings)
+        indexer.index_many([
+            ("lore", ("A grove", "location", None)),
+            ("event", ("g1", "FACTION_GOAL", "The guild expands", "loc1")),
+            ("npc_fact", ("g1", "npc1", "Mira", "sells herbs")),
+        ])
+        assert len(embeddings.calls) == 2
+        by_collection = {c: (docs, metas) for c, docs, metas in store.added}
+        assert by_collection["game_lore"][0] == ["A grove", "Mira: sells herbs"]
+        assert by_collection["events"][1][0]["location_id"] == "loc1"
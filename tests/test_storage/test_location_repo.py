@@ -0,0 +1,50 @@
+"""Tests for storage/repos/location_repo.py."""
+from __future__ import annotations
+
+import pytest
+
+from text_rpg.storage.repos.location_repo import LocationRepo
+
+GAME_ID = "test-game"
+
+
+@pytest.fixture
+def repo(in_memory_db):
+    with in_memory_db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO games (id, name, created_at) VALUES (?, ?, ?)",
+            (GAME_ID, "Test Game", "2024-01-01T00:00:00Z"),
+        )
+    return LocationRepo(in_memory_db)
+
+
+class TestVisitedSummary:
+    def test_counts_per_region(self, repo):
+        for i, (region, visited) in enumerate([
+            ("verdant_reach", True), ("verdant_reach", False), ("verdant_reach", True),
+            ("iron_coast", False), (None, True),
+        ]):
+            repo.save({
+                "id": f"loc{i}", "game_id": GAME_ID, "name": f"Loc {i}",
+                "region_id": region, "visited": visited, "connections": [],
+            })
+        assert repo.get_visited_summary(GAME_ID) == {
+            "verdant_reach": (2, 3),
+            "iron_coast": (0, 1),
+            None: (1, 1),
+        }
+
+    def test_empty_game(self, repo):
+        assert repo.get_visited_summary(GAME_ID) == {}
+
+
+class TestGetTypeAndRegion:
+    def test_returns_type_and_region(self, repo):
+        repo.save({
+            "id": "loc1", "game_id": GAME_ID, "name": "Millbrook",
+            "location_type": "town", "region_id": "verdant_reach", "connections": [],
+        })
+        assert repo.get_type_and_region("loc1", GAME_ID) == ("town", "verdant_reach")
+
+    def test_missing_location(self, repo):
+        assert repo.get_type_and_region("nope", GAME_ID) is None
@@ -0,0 +1,34 @@
+"""Tests for storage/repos/reputation_repo.py."""
+from __future__ import annotations
+
+import pytest
+
+from text_rpg.storage.repos.reputation_repo import ReputationRepo
+
+GAME_ID = "test-game"
+
+
+@pytest.fixture
+def repo(in_memory_db):
+    with in_memory_db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO games (id, name, created_at) VALUES (?, ?, ?)",
+            (GAME_ID, "Test Game", "2024-01-01T00:00:00Z"),
+        )
+    return ReputationRepo(in_memory_db)
+
+
+class TestBountyAmount:
+    def test_accumulates_with_crimes(self, repo):
+        repo.add_bounty(GAME_ID, "verdant_reach", 30, "Theft")
+        repo.add_bounty(GAME_ID, "verdant_reach", 45, "Assault")
+        assert repo.get_bounty_amount(GAME_ID, "verdant_reach") == 75
+        assert repo.get_bounty_amount(GAME_ID, "verdant_reach") == repo.get_bounty(GAME_ID, "verdant_reach")["amount"]
+
+    def test_no_bounty(self, repo):
+        assert repo.get_bounty_amount(GAME_ID, "iron_coast") == 0
+
+    def test_paid_off(self, repo):
+        repo.add_bounty(GAME_ID, "verdant_reach", 30, "Theft")
+        repo.pay_bounty(GAME_ID, "verdant_reach")
+        assert repo.get_bounty_amount(GAME_ID, "verdant_reach") == 0
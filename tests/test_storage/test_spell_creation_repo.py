@@ -178,6 +178,16 @@ class TestCustomSpells:
         assert retrieved["location_id"] == "tower_lab"
 
 
+class TestCountDiscoveries:
+    def test_counts_spells_and_combinations_per_character(self, repo):
+        assert repo.count_discoveries("test-game", "char-1") == 0
+        repo.discover_combination("test-game", "char-1", "fire+ice", 5)
+        repo.discover_combination("test-game", "char-2", "fire+ice", 5)
+        repo.save_custom_spell(_make_spell_data(spell_id="spell1"))
+        repo.save_custom_spell(_make_spell_data(spell_id="spell2", game_id="other-game"))
+        assert repo.count_discoveries("test-game", "char-1") == 2
+
+
 class TestDeleteAll:
     """Tests for cascade deletion."""
 
@@ -0,0 +1,125 @@
+"""Tests for storage/repos/world_state_repo.py."""
+from __future__ import annotations
+
+import pytest
+
+from text_rpg.storage.repos.world_state_repo import WorldStateRepo
+
+
+@pytest.fixture
+def setup_game(in_memory_db):
+    """Insert required game row for foreign key constraints."""
+    with in_memory_db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO games (id, name, created_at) VALUES (?, ?, ?)",
+            ("test-game", "Test Game", "2024-01-01T00:00:00Z"),
+        )
+    return in_memory_db
+
+
+@pytest.fixture
+def repo(setup_game):
+    return WorldStateRepo(setup_game)
+
+
+GAME_ID = "test-game"
+
+
+def _save_story(repo: WorldStateRepo, seed_id: str = "bandit_raids") -> None:
+    repo.save_story_state({
+        "id": f"{GAME_ID}_{seed_id}",
+        "game_id": GAME_ID,
+        "seed_id": seed_id,
+        "status": "active",
+        "current_beat": "hook",
+        "resolved_variables": {"settlement": "Thornfield"},
+        "activated_beats": ["hook"],
+        "beat_turn_numbers": {"hook": 5},
+        "quest_ids": [],
+        "data": {},
+    })
+
+
+class TestAdvanceBeat:
+    """Tests for the single-transaction beat advancement."""
+
+    def test_advance_updates_all_beat_fields(self, repo):
+        _save_story(repo)
+        repo.advance_beat_tx(
+            GAME_ID, "bandit_raids", "development",
+            ["hook", "development"], ["q1"], {"hook": 5, "development": 12},
+        )
+        story = repo.get_story_state(GAME_ID, "bandit_raids")
+        assert story["current_beat"] == "development"
+        assert story["activated_beats"] == ["hook", "development"]
+        assert story["quest_ids"] == ["q1"]
+        assert story["beat_turn_numbers"] == {"hook": 5, "development": 12}
+
+    def test_advance_preserves_other_fields(self, repo):
+        _save_story(repo)
+        repo.advance_beat_tx(
+            GAME_ID, "bandit_raids", "development",
+            ["hook", "development"], [], {"hook": 5, "development": 12},
+        )
+        story = repo.get_story_state(GAME_ID, "bandit_raids")
+        assert story["status"] == "active"
+        assert story["resolved_variables"] == {"settlement": "Thornfield"}
+
+    def test_advance_only_touches_matching_seed(self, repo):
+        _save_story(repo, "bandit_raids")
+        _save_story(repo, "plague_rumors")
+        repo.advance_beat_tx(
+            GAME_ID, "bandit_raids", "development",
+            ["hook", "development"], [], {"hook": 5, "development": 12},
+        )
+        other = repo.get_story_state(GAME_ID, "plague_rumors")
+        assert other["current_beat"] == "hook"
+        assert other["beat_turn_numbers"] == {"hook": 5}
+
+
+class TestCompletedQuestIds:
+    def test_returns_only_completed(self, repo):
+        for quest_id, status in [("q1", "completed"), ("q2", "active"), ("q3", "completed")]:
+            repo.save_quest({"id": quest_id, "game_id": GAME_ID, "name": quest_id, "status": status})
+        assert sorted(repo.get_completed_quest_ids(GAME_ID)) == ["q1", "q3"]
+
+    def test_empty_when_none_completed(self, repo):
+        assert repo.get_completed_quest_ids(GAME_ID) == []
+
+
+class TestEventCooldowns:
+    def test_batch_round_trip(self, repo):
+        repo.set_event_cooldowns(GAME_ID, ["storm", "fair"], 12)
+        repo.set_event_cooldown(GAME_ID, "eclipse", 3)
+        cooldowns = repo.get_event_cooldowns(GAME_ID, ["storm", "fair", "eclipse", "never"])
+        assert cooldowns == {"storm": 12, "fair": 12, "eclipse": 3}
+
+    def test_batch_set_updates_existing(self, repo):
+        repo.set_event_cooldowns(GAME_ID, ["storm"], 5)
+        repo.set_event_cooldowns(GAME_ID, ["storm"], 9)
+        assert repo.get_event_cooldown(GAME_ID, "storm") == 9
+
+    def test_empty_ids(self, repo):
+        assert repo.get_event_cooldowns(GAME_ID, []) == {}
+        repo.set_event_cooldowns(GAME_ID, [], 1)
+
+
+class TestStoryContext:
+    def test_collects_all_three_views(self, repo):
+        _save_story(repo, "bandit_raids")
+        _save_story(repo, "plague_rumors")
+        repo.complete_story(GAME_ID, "plague_rumors", "failed")
+        repo.save_quest({"id": "q1", "game_id": GAME_ID, "name": "q1", "status": "completed"})
+        repo.save_quest({"id": "q2", "game_id": GAME_ID, "name": "q2", "status": "active"})
+
+        ctx = repo.get_story_context(GAME_ID)
+        assert [s["seed_id"] for s in ctx.active_stories] == ["bandit_raids"]
+        assert ctx.active_stories[0]["beat_turn_numbers"] == {"hook": 5}
+        assert ctx.completed_story_ids == ["plague_rumors"]
+        assert ctx.completed_quest_ids == ["q1"]
+
+    def test_skips_quests_without_active_stories(self, repo):
+        repo.save_quest({"id": "q1", "game_id": GAME_ID, "name": "q1", "status": "completed"})
+        ctx = repo.get_story_context(GAME_ID)
+        assert ctx.active_stories == []
+        assert ctx.completed_quest_ids == []
@@ -0,0 +1,271 @@
+"""Tests for the exploration system — movement, looking, interacting."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from text_rpg.mechanics.dice import DiceResult
+from text_rpg.models.action import Action
+from text_rpg.systems.base import GameContext
+from text_rpg.systems.exploration.system import ExplorationSystem
+
+
+CONNECTIONS = [
+    {"direction": "north", "target_location_id": "loc-2", "description": "Market Square"},
+    {"direction": "east", "target_location_id": "loc-3", "description": "Old Gate", "is_locked": True},
+]
+
+
+def _context(connections=CONNECTIONS, items=("Rusty Key",), entities=None, companions=None) -> GameContext:
+    return GameContext(
+        game_id="g1",
+        character={"id": "char-1", "ability_scores": {"wisdom": 12}, "skill_proficiencies": ["perception"]},
+        location={
+            "id": "loc-1",
+            "description": "A quiet crossroads.",
+            "connections": connections,
+            "items": list(items),
+        },
+        entities=entities or [],
+        companions=companions,
+    )
+
+
+class FakeLocationRepo:
+    def __init__(self, locations: dict[str, tuple[str, str]]):
+        self.locations = locations
+        self.calls = 0
+
+    def get_type_and_region(self, location_id, game_id):
+        self.calls += 1
+        return self.locations.get(location_id)
+
+
+class FakeReputationRepo:
+    def __init__(self, bounties: dict[str, int]):
+        self.bounties = bounties
+
+    def get_bounty_amount(self, game_id, region_id):
+        return self.bounties.get(region_id, 0)
+
+
+class FakeDirector:
+    def __init__(self, plausibility=None, new_location=None):
+        self.plausibility = plausibility or {"plausibility": 0.8, "skill": "survival"}
+        self.new_location = new_location
+
+    def evaluate_plausibility(self, action, context):
+        return self.plausibility
+
+    def generate_location_for_direction(self, direction, context, repos):
+        return self.new_location
+
+
+def _action(action_type: str, target: str | None = None) -> Action:
+    return Action(action_type=action_type, actor_id="char-1", target_id=target)
+
+
+@pytest.fixture
+def system():
+    return ExplorationSystem()
+
+
+class TestDispatch:
+    def test_action_type_is_case_insensitive(self, system):
+        assert system.can_handle(_action("LOOK"), _context())
+        assert system.resolve(_action("LOOK"), _context()).success
+
+    def test_unknown_action(self, system):
+        assert not system.can_handle(_action("dance"), _context())
+        result = system.resolve(_action("dance"), _context())
+        assert not result.success
+        assert result.outcome_description == "Unknown exploration action."
+
+
+class TestMove:
+    def test_moves_along_connection(self, system):
+        result = system.resolve(_action("move", "North"), _context())
+        assert result.success
+        assert result.state_mutations[0].new_value == "loc-2"
+        assert result.events[0]["location_id"] == "loc-2"
+
+    def test_matches_by_location_id(self, system):
+        result = system.resolve(_action("move", "loc-2"), _context())
+        assert result.success
+
+    def test_locked_connection(self, system):
+        result = system.resolve(_action("move", "east"), _context())
+        assert not result.success
+        assert "locked" in result.outcome_description
+
+    def test_unknown_direction_without_director(self, system):
+        result = system.resolve(_action("move", "west"), _context())
+        assert not result.success
+
+    def test_connections_stored_as_json(self, system):
+        result = system.resolve(_action("move", "north"), _context(connections=json.dumps(CONNECTIONS)))
+        assert result.success
+
+    def test_active_companions_follow(self, system):
+        companions = [
+            {"entity_id": "c1", "status": "active"},
+            {"entity_id": "c2", "status": "waiting"},
+        ]
+        result = system.resolve(_action("move", "north"), _context(companions=companions))
+        moved = [m.target_id for m in result.state_mutations if m.target_type == "entity"]
+        assert moved == ["c1"]
+
+
+class TestLook:
+    def test_lists_entities_items_and_exits(self, system):
+        entities = [{"name": "Mira", "is_alive": True}, {"name": "Wolf", "is_alive": False}]
+        result = system.resolve(_action("look"), _context(entities=entities))
+        text = result.outcome_description
+        assert "Present: Mira" in text
+        assert "Wolf" not in text
+        assert "Items on the ground: Rusty Key" in text
+        assert "Exits: north (Market Square), east (Old Gate)" in text
+
+    def test_available_actions_match_exits(self, system):
+        actions = system.get_available_actions(_context())
+        moves = [a for a in actions if a["action_type"] == "move"]
+        assert [a["target"] for a in moves] == ["north", "east"]
+        assert moves[0]["description"] == "Go north to Market Square"
+
+
+class TestSearch:
+    @pytest.mark.parametrize("profs, skill, proficient", [
+        (["investigation", "perception"], "investigation", True),
+        (["perception"], "perception", True),
+        (["athletics"], "perception", False),
+    ])
+    def test_skill_and_proficiency(self, system, monkeypatch, profs, skill, proficient):
+        seen = {}
+
+        def fake_check(ability_score, prof_bonus, is_prof, dc, **kwargs):
+            seen["is_prof"] = is_prof
+            return True, DiceResult("1d20", [15], 1, 16)
+
+        monkeypatch.setattr("text_rpg.systems.exploration.system.skill_check", fake_check)
+        ctx = _context()
+        ctx.character["skill_proficiencies"] = profs
+        result = system.resolve(_action("search"), ctx)
+        assert result.events[0]["mechanical_details"]["skill"] == skill
+        assert seen["is_prof"] is proficient
+        assert [e["event_type"] for e in result.events] == ["SKILL_CHECK", "DISCOVERY"]
+
+
+class TestInteract:
+    def test_picks_up_item_case_insensitively(self, system):
+        result = system.resolve(_action("interact", "rusty key"), _context())
+        assert result.success
+        assert [m.field for m in result.state_mutations] == ["items_remove", "items_add"]
+
+    def test_missing_item(self, system):
+        result = system.resolve(_action("interact", "sword"), _context())
+        assert not result.success
+
+
+class TestBountyOnEnter:
+    def _system(self, loc_type="town", bounty=120):
+        return ExplorationSystem(repos={
+            "location": FakeLocationRepo({"loc-2": (loc_type, "verdant_reach")}),
+            "reputation": FakeReputationRepo({"verdant_reach": bounty}),
+        })
+
+    def test_guards_confront_wanted_player(self):
+        result = self._system().resolve(_action("move", "north"), _context())
+        confrontation = result.events[-1]
+        assert confrontation["event_type"] == "GUARD_CONFRONTATION"
+        assert confrontation["mechanical_details"] == {"bounty_amount": 120, "region": "verdant_reach"}
+        assert "120 gold" in result.outcome_description
+
+    def test_location_kind_queried_once(self):
+        system = self._system(bounty=0)
+        for _ in range(3):
+            system.resolve(_action("move", "north"), _context())
+        assert system._repos["location"].calls == 1
+
+    def test_location_kinds_evict_least_recent(self):
+        system = ExplorationSystem(repos={
+            "location": FakeLocationRepo({f"loc-{i}": ("forest", "r") for i in range(4)}),
+        })
+        system._max_location_kinds = 2
+        for loc_id in ("loc-0", "loc-1", "loc-0", "loc-2"):
+            system._location_kind(loc_id, "g1")
+        assert list(system._location_kinds) == [("g1", "loc-0"), ("g1", "loc-2")]
+
+    def test_bounty_reread_on_every_entry(self):
+        system = self._system(bounty=0)
+        system.resolve(_action("move", "north"), _context())
+        system._repos["reputation"].bounties["verdant_reach"] = 75
+        result = system.resolve(_action("move", "north"), _context())
+        assert result.events[-1]["event_type"] == "GUARD_CONFRONTATION"
+
+    def test_no_bounty(self):
+        result = self._system(bounty=0).resolve(_action("move", "north"), _context())
+        assert [e["event_type"] for e in result.events] == ["MOVE"]
+
+    def test_wilderness_is_unguarded(self):
+        result = self._system(loc_type="forest").resolve(_action("move", "north"), _context())
+        assert [e["event_type"] for e in result.events] == ["MOVE"]
+
+
+class TestDynamicMove:
+    @pytest.fixture
+    def roll(self, monkeypatch):
+        def fake(success):
+            monkeypatch.setattr(
+                "text_rpg.systems.exploration.system.skill_check",
+                lambda *a, **k: (success, DiceResult("1d20", [15], 1, 16)),
+            )
+        return fake
+
+    def _system(self, new_location=None):
+        return ExplorationSystem(
+            director=FakeDirector(new_location=new_location),
+            repos={"location": FakeLocationRepo({})},
+        )
+
+    def test_discovers_new_location(self, roll):
+        roll(True)
+        system = self._system({"id": "loc-9", "name": "Hidden Glade"})
+        result = system.resolve(_action("move", "west"), _context())
+        assert result.success
+        assert "Hidden Glade" in result.outcome_description
+        assert [e["event_type"] for e in result.events] == ["SKILL_CHECK", "DISCOVERY"]
+        assert result.state_mutations[0].new_value == "loc-9"
+
+    def test_failed_check(self, roll):
+        roll(False)
+        result = self._system().resolve(_action("move", "west"), _context())
+        assert not result.success
+        assert [e["event_type"] for e in result.events] == ["SKILL_CHECK", "EXPLORATION_FAIL"]
+
+    def test_no_viable_path(self, roll):
+        roll(True)
+        result = self._system().resolve(_action("move", "west"), _context())
+        assert not result.success
+        assert "no viable path" in result.outcome_description
+
+    def test_injected_director(self, roll):
+        roll(True)
+        system = ExplorationSystem()
+        system.inject(
+            director=FakeDirector(new_location={"id": "loc-9"}),
+            repos={"location": FakeLocationRepo({})},
+        )
+        assert system.resolve(_action("move", "west"), _context()).success
+
+    def test_director_failure_blocks_the_way(self, roll):
+        roll(True)
+
+        class BrokenDirector(FakeDirector):
+            def generate_location_for_direction(self, direction, context, repos):
+                raise RuntimeError("LLM unavailable")
+
+        system = ExplorationSystem(director=BrokenDirector(), repos={"location": FakeLocationRepo({})})
+        result = system.resolve(_action("move", "west"), _context())
+        assert not result.success
+        assert result.outcome_description == "You can't go 'west' from here."
@@ -1,11 +1,72 @@
 """Integration tests for trait system — input handler + fallback generator."""
 from __future__ import annotations
 
+import asyncio
+import uuid
+
 import pytest
 
 from text_rpg.cli.input_handler import InputHandler
+from text_rpg.llm.provider import LLMProvider
 from text_rpg.mechanics.trait_effects import FALLBACK_TRAITS, TIER_BUDGETS, validate_trait
-from text_rpg.systems.director.trait_generator import _fallback_trait
+from text_rpg.systems.director import cache as director_cache
+from text_rpg.systems.director.trait_generator import (
+    _fallback_trait,
+    agenerate_trait,
+    generate_trait,
+    generate_traits_batch,
+    generate_traits_bulk,
+)
+
+_VALID_TRAIT = {
+    "name": "Ember Soul",
+    "description": "Fire answers your call.",
+    "effects": [{"type": "skill_bonus", "params": {"skill": "arcana"}}],
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    director_cache.get_cache().clear()
+    yield
+    director_cache.get_cache().clear()
+
+
+class StubLLM(LLMProvider):
+    """Returns a fixed structured response; raises for prompts containing `fail_on`."""
+
+    def __init__(self, response: dict, fail_on: str | None = None) -> None:
+        self.response = response
+        self.fail_on = fail_on
+        self.prompts: list[str] = []
+        self.system_prompts: list[str | None] = []
+
+    def generate(self, prompt, system_prompt=None, temperature=0.8, max_tokens=1024):
+        return ""
+
+    def generate_structured(self, prompt, system_prompt=None, temperature=0.7, max_tokens=512):
+        self.prompts.append(prompt)
+        self.system_prompts.append(system_prompt)
+        if self.fail_on and self.fail_on in prompt:
+            raise RuntimeError("boom")
+        return dict(self.response)
+
+    def is_available(self):
+        return True
+
+    @property
+    def model_name(self):
+        return "stub"
+
+
+def _job(pattern: str = "fire_affinity", name: str = "Ash") -> dict:
+    return {
+        "behavior_scores": {pattern: 10},
+        "dominant_patterns": [pattern],
+        "tier": 1,
+        "character": {"name": name, "level": 2, "race": "elf", "char_class": "wizard"},
+        "existing_traits": [],
+    }
 
 
 class TestTraitInputPatterns:
@@ -58,7 +119,101 @@ class TestFallbackTraits:
         assert trait["tier"] == 1
         assert trait["behavior_source"] == "explorer"
 
+    def test_fallback_ids_are_unique_v4_uuids(self):
+        ids = [_fallback_trait("explorer", 1)["id"] for _ in range(150)]
+        assert len(set(ids)) == 150
+        assert all(uuid.UUID(i).version == 4 for i in ids)
+
     def test_unknown_pattern_uses_first_fallback(self):
         trait = _fallback_trait("nonexistent_pattern", 1)
         assert trait is not None
         assert trait["behavior_source"] == "nonexistent_pattern"
+
+
+class TestGenerateTrait:
+    def test_async_matches_sync(self):
+        llm = StubLLM(_VALID_TRAIT)
+        sync_trait = generate_trait(llm, **_job())
+        director_cache.get_cache().clear()
+        async_trait = asyncio.run(agenerate_trait(llm, **_job()))
+        assert llm.prompts[0] == llm.prompts[1]
+        assert sync_trait["name"] == async_trait["name"] == "Ember Soul"
+        assert sync_trait["id"] != async_trait["id"]
+
+    def test_invalid_output_falls_back(self):
+        trait = generate_trait(StubLLM({"name": "x"}), **_job())
+        assert trait["name"] == FALLBACK_TRAITS["fire_affinity"]["name"]
+
+    def test_batch_keeps_job_order_and_falls_back_per_job(self):
+        llm = StubLLM(_VALID_TRAIT, fail_on="Bram")
+        jobs = [_job(name="Ash"), _job("explorer", name="Bram"), _job(name="Cyd")]
+        traits = asyncio.run(generate_traits_batch(llm, jobs, max_concurrency=2))
+        assert len(llm.prompts) == 3
+        assert [t["name"] for t in traits] == [
+            "Ember Soul", FALLBACK_TRAITS["explorer"]["name"], "Ember Soul",
+        ]
+
+
+class TestTraitPrompt:
+    def test_system_prompt_is_shared_per_tier(self):
+        llm = StubLLM(_VALID_TRAIT)
+        generate_trait(llm, **_job(name="Ash"))
+        generate_trait(llm, **_job("explorer", name="Bram"))
+        tier_2 = _job(name="Cyd")
+        tier_2["tier"] = 2
+        generate_trait(llm, **tier_2)
+        first, second, third = llm.system_prompts
+        assert first == second != third
+        assert f"budget of **{TIER_BUDGETS[1]} points**" in first
+        assert "Ash" in llm.prompts[0] and "Ash" not in first
+        assert "skill_bonus" not in llm.prompts[0]
+
+
+class TestTraitCache:
+    def test_repeat_profile_skips_llm_with_fresh_id(self):
+        llm = StubLLM(_VALID_TRAIT)
+        first = generate_trait(llm, **_job())
+        second = generate_trait(llm, **_job())
+        assert len(llm.prompts) == 1
+        assert second["name"] == first["name"]
+        assert second["id"] != first["id"]
+
+    def test_existing_traits_are_part_of_the_key(self):
+        llm = StubLLM(_VALID_TRAIT)
+        first = generate_trait(llm, **_job())
+        job = _job()
+        job["existing_traits"] = [first]
+        generate_trait(llm, **job)
+        assert len(llm.prompts) == 2
+
+    def test_fallbacks_are_not_cached(self):
+        llm = StubLLM({})
+        generate_trait(llm, **_job())
+        generate_trait(llm, **_job())
+        assert len(llm.prompts) == 2
+
+
+class BatchAnsweringLLM(StubLLM):
+    """Answers a batched prompt with one trait per task; the second answer is junk."""
+
+    def generate_structured(self, prompt, system_prompt=None, temperature=0.7, max_tokens=512):
+        self.prompts.append(prompt)
+        if prompt.startswith("You are completing"):
+            n = prompt.count("### Task ")
+            answers = [dict(self.response) for _ in range(n)]
+            answers[1] = {"name": ""}
+            return {"answers": [{"task": i, "answer": a} for i, a in enumerate(answers, 1)]}
+        return {}
+
+
+class TestGenerateTraitsBulk:
+    def test_one_request_per_batch_with_per_job_validation(self):
+        llm = BatchAnsweringLLM(_VALID_TRAIT)
+        jobs = [_job(name="Ash"), _job("explorer", name="Bram"), _job(name="Cyd")]
+        traits = generate_traits_bulk(llm, jobs, max_batch=3)
+        assert len(llm.prompts) == 1
+        assert llm.prompts[0].count("## Available Effect Menu") == 1
+        assert [t["name"] for t in traits] == [
+            "Ember Soul", FALLBACK_TRAITS["explorer"]["name"], "Ember Soul",
+        ]
+        assert len({t["id"] for t in traits}) == 3
@@ -1,11 +1,12 @@
-"""Tests for src/text_rpg/utils.py — safe_json and safe_props."""
+"""Tests for src/text_rpg/utils.py — safe_json, safe_props and to_json_str."""
 from __future__ import annotations
 
 import json
 
 import pytest
 
-from text_rpg.utils import safe_json, safe_props
+from text_rpg import utils
+from text_rpg.utils import json_view, safe_json, safe_props, to_json_str
 
 
 class TestSafeJson:
@@ -41,6 +42,21 @@ class TestSafeJson:
     def test_json_array_string(self):
         assert safe_json("[1, 2, 3]") == [1, 2, 3]
 
+    def test_stdlib_fallback(self, monkeypatch):
+        import text_rpg.utils as utils
+
+        monkeypatch.setattr(utils, "_json_loads", json.loads)
+        assert safe_json('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert safe_json("not json", []) == []
+
+    def test_lenient_literals_still_parse(self):
+        import math
+
+        assert math.isnan(safe_json('{"x": NaN}')["x"])
+
+    def test_unicode_round_trip(self):
+        assert safe_json(json.dumps({"name": "Éowyn — the Fair"})) == {"name": "Éowyn — the Fair"}
+
 
 class TestSafeProps:
     def test_empty_properties(self):
@@ -58,3 +74,36 @@ class TestSafeProps:
     def test_dict_properties(self):
         data = {"properties": {"hp": 10, "ac": 12}}
         assert safe_props(data) == {"hp": 10, "ac": 12}
+
+
+class TestJsonView:
+    def test_parses_once_per_distinct_string(self):
+        raw = json.dumps({"strength": 17, "marker": "json-view-test"})
+        before = utils._parse_view.cache_info().hits
+        assert json_view(raw, {})["strength"] == 17
+        assert json_view(raw, {}) is json_view(raw, {})
+        assert utils._parse_view.cache_info().hits >= before + 2
+
+    def test_invalid_and_native_values(self):
+        assert json_view("not json", []) == []
+        assert json_view(None, []) == []
+        native = [{"item_id": "rope"}]
+        assert json_view(native, []) is native
+
+
+class TestToJsonStr:
+    def test_round_trip(self):
+        data = {"motivation": "Éowyn's vow", "tags": [1, 2.5, None, True]}
+        assert json.loads(to_json_str(data)) == data
+
+    def test_compact(self):
+        assert to_json_str({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_non_string_keys_fall_back(self):
+        assert json.loads(to_json_str({1: "x"})) == {"1": "x"}
+
+    def test_stdlib_only(self, monkeypatch):
+        import text_rpg.utils as utils
+
+        monkeypatch.setattr(utils, "orjson", None)
+        assert to_json_str({"a": [1, 2]}) == '{"a":[1,2]}'